@@ -1,11 +1,12 @@
 from flask import Flask, request
 from flask_restx import Resource, Namespace
-from database.database import Database
+from database.database import get_database
 from datetime import datetime, date
 from utils.dto import AccountingDTO
 from flask_jwt_extended import jwt_required, get_jwt_identity
-from utils.enum_tool import AccountingEnum
 from utils.api_access_level_tool import api_access_level
+from utils.etag_tool import conditional_get
+from utils.stream_tool import stream_json_response
 
 accounting = AccountingDTO.api
 
@@ -23,7 +24,7 @@ class AccountingUserAPI(Resource):
         start_month = date(datetime.today().year - 1, 6, 1).strftime('%Y-%m-%d')
 
         try:
-            database = Database()
+            database = get_database()
 
             sql = "SELECT date, amount, category FROM membership_fees WHERE user_id = %s AND date BETWEEN %s AND %s ORDER BY date;"
             values = (user_id, start_month, current_month)
@@ -37,32 +38,19 @@ class AccountingUserAPI(Resource):
             total_amount = int(database.execute_one(sql)['value'])
         except Exception as e:
             return {'message': '서버에 오류가 발생했어요 :(\n지속적으로 발생하면 문의주세요!', 'error': str(e)}, 400
-        finally:
-            database.close()
 
         payment_amount = None
         if monthly_payment_list and monthly_payment_list[-1]['date'].strftime('%Y-%m-%d') == current_month:
             payment_amount = monthly_payment_list[-1]['amount']
 
-        if payment_period:
-            payment_period['start_date'] = payment_period['start_date'].strftime('%Y-%m-%d')
-            payment_period['end_date'] = payment_period['end_date'].strftime('%Y-%m-%d')
-
         payment_data = {
-            'monthly_payment_list': monthly_payment_list,
-            'payment_period': payment_period,
+            'monthly_payment_list': AccountingDTO.serialize_monthly_payment.many(monthly_payment_list),
+            'payment_period': AccountingDTO.serialize_payment_period(payment_period),
             'payment_amount': payment_amount,
             'total_amount': total_amount
         }
 
-        if not monthly_payment_list:
-            return payment_data, 200
-        else:
-            for idx, monthly_payment in enumerate(monthly_payment_list):
-                monthly_payment_list[idx]['date'] = monthly_payment['date'].strftime('%Y-%m-%d')
-                monthly_payment_list[idx]['category'] = AccountingEnum.PaymentState(monthly_payment['category'])
-
-            return payment_data, 200
+        return payment_data, 200
     
 @accounting.route('/list')
 class AccountingListAPI(Resource):
@@ -70,25 +58,17 @@ class AccountingListAPI(Resource):
     @accounting.response(400, 'Bad Request', AccountingDTO.accounting_response_message)
     @accounting.doc(security='apiKey')
     @api_access_level(1)
+    @conditional_get(('data_map', 'accountings'))
     def get(self):
         try:
-            database = Database()
-            sql = "SELECT * FROM accountings;"
-            accounting_list = database.execute_all(sql)
-
+            database = get_database()
             sql = "SELECT value FROM data_map WHERE category = 'account_balance';"
             total_amount = int(database.execute_one(sql)['value'])
+
+            # 거래 내역은 전체를 메모리에 올리지 않고 한 행씩 읽어온다.
+            sql = "SELECT * FROM accountings;"
+            accounting_list = database.execute_stream(sql, rows=True)
         except Exception as e:
             return {'message': '서버에 오류가 발생했어요 :(\n지속적으로 발생하면 문의주세요!', 'error': str(e)}, 400
-        finally:
-            database.close()
-
-        result_data = {'accounting_list': accounting_list, 'total_amount': total_amount}
 
-        if not accounting_list:
-            return result_data, 200
-        else:
-            for idx, accounting in enumerate(accounting_list):
-                accounting_list[idx]['date'] = accounting['date'].strftime('%Y-%m-%d')
-                accounting_list[idx]['payment_method'] = AccountingEnum.PaymentMethod(accounting['payment_method'])
-            return result_data, 200
+        return stream_json_response(accounting_list, AccountingDTO.serialize_accounting, key='accounting_list', data={'total_amount': total_amount})
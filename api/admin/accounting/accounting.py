@@ -1,10 +1,9 @@
 from flask import Flask, request
 from flask_restx import Resource, Namespace
-from database.database import Database
+from database.database import get_database
 from datetime import datetime, date
 from utils.dto import AdminAccountingDTO
 from flask_jwt_extended import jwt_required, get_jwt_identity
-from utils.enum_tool import AccountingEnum, UserEnum
 from utils.aes_cipher import AESCipher
 from utils.api_access_level_tool import api_access_level
 
@@ -29,7 +28,7 @@ class MembershipFeeCheckAPI(Resource):
         start_month = get_start_month()
         
         try:
-            database = Database()
+            database = get_database()
 
             sql = "SELECT date, start_date, end_date FROM monthly_payment_periods WHERE date BETWEEN %s AND %s ORDER BY date;"
             values = (start_month, current_month)
@@ -40,22 +39,14 @@ class MembershipFeeCheckAPI(Resource):
             user_payment_list = database.execute_all(sql, values)
 
             crypt = AESCipher()
-            for idx, user_payment in enumerate(user_payment_list):
-                user_payment_list[idx]['name'] = crypt.decrypt(user_payment['name'])
+            names = crypt.decrypt_many(user_payment['name'] for user_payment in user_payment_list)
+            for idx, name in enumerate(names):
+                user_payment_list[idx]['name'] = name
         except Exception as e:
             return {'message': '서버에 오류가 발생했어요 :(\n지속적으로 발생하면 문의주세요!', 'error': str(e)}, 400
-        finally:
-            database.close()
 
-        for idx, payment_period in enumerate(payment_period_list):
-            payment_period_list[idx]['date'] = payment_period['date'].strftime('%Y-%m-%d')
-            payment_period_list[idx]['start_date'] = payment_period['start_date'].strftime('%Y-%m-%d')
-            payment_period_list[idx]['end_date'] = payment_period['end_date'].strftime('%Y-%m-%d')
-
-        for idx, user_payment in enumerate(user_payment_list):
-            user_payment_list[idx]['date'] = user_payment['date'].strftime('%Y-%m-%d')
-            user_payment_list[idx]['category'] = AccountingEnum.PaymentState(user_payment['category'])
-            user_payment_list[idx]['level'] = UserEnum.Level(user_payment['level'])
+        payment_period_list = AdminAccountingDTO.serialize_payment_period.many(payment_period_list)
+        user_payment_list = AdminAccountingDTO.serialize_user_payment.many(user_payment_list)
 
         monthly_payment_list = []
 
@@ -86,24 +77,17 @@ class MembershipFeePeriodAPI(Resource):
         start_month = get_start_month()
 
         try:
-            database = Database()
+            database = get_database()
             sql = "SELECT date, start_date, end_date FROM monthly_payment_periods WHERE date BETWEEN %s AND %s ORDER BY date;"
             values = (start_month, current_month)
             payment_period_list = database.execute_all(sql, values)
         except Exception as e:
             return {'message': '서버에 오류가 발생했어요 :(\n지속적으로 발생하면 문의주세요!', 'error': str(e)}, 400
-        finally:
-            database.close()
 
         if not payment_period_list:
             return [], 200
         else:
-            for idx, payment_period in enumerate(payment_period_list):
-                payment_period_list[idx]['date'] = payment_period['date'].strftime('%Y-%m-%d')
-                payment_period_list[idx]['start_date'] = payment_period['start_date'].strftime('%Y-%m-%d')
-                payment_period_list[idx]['end_date'] = payment_period['end_date'].strftime('%Y-%m-%d')
-            
-            return payment_period_list, 200
+            return AdminAccountingDTO.serialize_payment_period.many(payment_period_list), 200
     
     @accounting.expect(AdminAccountingDTO.model_payment_period, required=True)
     @accounting.response(201, 'Created', AdminAccountingDTO.response_message)
@@ -114,15 +98,13 @@ class MembershipFeePeriodAPI(Resource):
         payment_period = request.get_json()
 
         try:
-            database = Database()
+            database = get_database()
             sql = "INSERT INTO monthly_payment_periods (date, start_date, end_date) VALUES (%s, %s, %s);"
             values = (payment_period['date'], payment_period['start_date'], payment_period['end_date'])
             database.execute(sql, values)
             database.commit()
         except Exception as e:
             return {'message': '서버에 오류가 발생했어요 :(\n지속적으로 발생하면 문의주세요!', 'error': str(e)}, 400
-        finally:
-            database.close()
 
         return {'message': '회비 기간을 설정했어요 :)'}, 201
 
@@ -135,15 +117,13 @@ class MembershipFeePeriodAPI(Resource):
         payment_period = request.get_json()
 
         try:
-            database = Database()
+            database = get_database()
             sql = "UPDATE monthly_payment_periods SET start_date = %s, end_date = %s WHERE date = %s;"
             values = (payment_period['start_date'], payment_period['end_date'], payment_period['date'])
             database.execute(sql, values)
             database.commit()
         except Exception as e:
             return {'message': '서버에 오류가 발생했어요 :(\n지속적으로 발생하면 문의주세요!', 'error': str(e)}, 400
-        finally:
-            database.close()
 
         return {'message': '회비 기간을 수정했어요 :)'}, 200
     
@@ -156,14 +136,12 @@ class MembershipFeePeriodAPI(Resource):
         payment_date = request.args['date']
 
         try:
-            database = Database()
+            database = get_database()
             sql = "DELETE FROM monthly_payment_periods WHERE date = %s;"
             values = (payment_date,)
             database.execute(sql, values)
             database.commit()
         except Exception as e:
             return {'message': '서버에 오류가 발생했어요 :(\n지속적으로 발생하면 문의주세요!', 'error': str(e)}, 400
-        finally:
-            database.close()
 
         return {'message': '회비 기간을 삭제했어요 :)'}, 200
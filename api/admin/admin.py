@@ -4,6 +4,10 @@ from api.admin.accounting.accounting import accounting
 from api.admin.notification.notification import notification
 from api.admin.attendance.attendance import attendance
 from api.admin.role.role import role
+from api.admin.query.query import query
+from api.admin.member.member import member
+from utils.json_tool import output_json
+from utils import swagger_tool
 
 admin = Blueprint('admin', __name__, url_prefix='/admin')
 
@@ -14,9 +18,13 @@ authorizations = {
         'name': 'Authorization'
     }
 }
-api = Api(admin, authorizations=authorizations)
+api = Api(admin, authorizations=authorizations, **swagger_tool.API_OPTIONS)
+# 응답 JSON 직렬화에 orjson 사용
+api.representations['application/json'] = output_json
 
 api.add_namespace(accounting, '/accounting')
 api.add_namespace(notification, '/notification')
 api.add_namespace(attendance, '/attendance')
-api.add_namespace(role, '/role')
\ No newline at end of file
+api.add_namespace(role, '/role')
+api.add_namespace(query, '/query')
+api.add_namespace(member, '/member')
\ No newline at end of file
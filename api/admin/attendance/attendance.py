@@ -1,11 +1,12 @@
 from flask import Flask, request
 from flask_restx import Resource, Namespace
-from database.database import Database
+from database.database import get_database
 from utils.dto import AdminAttendanceDTO
 from flask_jwt_extended import jwt_required, get_jwt_identity
-from utils.enum_tool import AttendanceEnum, UserEnum
+from utils.enum_tool import AttendanceEnum
 from utils.aes_cipher import AESCipher
 from utils.api_access_level_tool import api_access_level
+from utils.etag_tool import conditional_get
 
 attendance = AdminAttendanceDTO.api
 
@@ -15,29 +16,20 @@ class AttendanceListAPI(Resource):
     @attendance.response(400, 'Bad Request', AdminAttendanceDTO.response_message)
     @attendance.doc(security='apiKey')
     @api_access_level(2)
+    @conditional_get(('attendance',))
     def get(self):
         # DB 예외 처리
         try:
             # DB에서 전체 attendance 목록을 날짜 순으로 가져오기
-            database = Database()
+            database = get_database()
             sql = "SELECT id, category, date, first_auth_start_time, first_auth_end_time, "\
                   "second_auth_start_time, second_auth_end_time FROM attendance ORDER BY date;"
             attendance_list = database.execute_all(sql)
         except Exception as e:
             return {'message': '서버에 오류가 발생했어요 :(\n지속적으로 발생하면 문의주세요!', 'error': str(e)}, 400
-        finally:
-            database.close()
 
         # 데이터를 적절히 문자열로 변환
-        for attendance in attendance_list:
-            attendance['category'] = AttendanceEnum.Category(attendance['category'])
-            attendance['date'] = attendance['date'].strftime('%Y-%m-%d')
-            attendance['first_auth_start_time'] = str(attendance['first_auth_start_time'])
-            attendance['first_auth_end_time'] = str(attendance['first_auth_end_time'])
-            attendance['second_auth_start_time'] = str(attendance['second_auth_start_time'])
-            attendance['second_auth_end_time'] = str(attendance['second_auth_end_time'])
-
-        return attendance_list, 200
+        return AdminAttendanceDTO.serialize_attendance_info.many(attendance_list), 200
 
 
 @attendance.route("")
@@ -56,25 +48,16 @@ class AttendanceInfoAPI(Resource):
         # DB 예외 처리
         try:
             # DB에서 category, date값에 맞는 출석 정보 가져오기
-            database = Database()
+            database = get_database()
             sql = "SELECT id, first_auth_start_time, first_auth_end_time, "\
                   "second_auth_start_time, second_auth_end_time FROM attendance "\
                   "WHERE category = %s and date = %s;"
             attendance = database.execute_one(sql, (category, date))
         except Exception as e:
             return {'message': '서버에 오류가 발생했어요 :(\n지속적으로 발생하면 문의주세요!', 'error': str(e)}, 400
-        finally:
-            database.close()
-
-        # 출석 정보가 존재할 때 처리
-        if attendance:
-            # time을 문자열로 변환
-            attendance['first_auth_start_time'] = str(attendance['first_auth_start_time'])
-            attendance['first_auth_end_time'] = str(attendance['first_auth_end_time'])
-            attendance['second_auth_start_time'] = str(attendance['second_auth_start_time'])
-            attendance['second_auth_end_time'] = str(attendance['second_auth_end_time'])
 
-        return attendance, 200
+        # 출석 정보가 존재할 때 time을 문자열로 변환
+        return AdminAttendanceDTO.serialize_attendance(attendance), 200
     
     # 출석 정보 추가
     @attendance.expect(AdminAttendanceDTO.model_attendance_without_id, validate=True)
@@ -92,7 +75,7 @@ class AttendanceInfoAPI(Resource):
         # DB 예외 처리
         try:
             # 출석 정보 DB에 추가
-            database = Database()
+            database = get_database()
             sql = "INSERT INTO attendance VALUES(NULL, %s, %s, %s, %s, %s, %s)"
             values = (
                 attendance['category'],
@@ -106,8 +89,6 @@ class AttendanceInfoAPI(Resource):
             database.commit()
         except Exception as e:
             return {'message': '서버에 오류가 발생했어요 :(\n지속적으로 발생하면 문의주세요!', 'error': str(e)}, 400
-        finally:
-            database.close()
 
         return {'message': '출석 정보를 추가했어요 :)'}, 200
 
@@ -124,7 +105,7 @@ class AttendanceInfoAPI(Resource):
         # DB 예외처리
         try:
             # 수정된 출석 정보를 DB에 반영
-            database = Database()
+            database = get_database()
             sql = "UPDATE attendance SET "\
                 "date = %s, "\
                 "first_auth_start_time = %s, first_auth_end_time = %s, "\
@@ -142,8 +123,6 @@ class AttendanceInfoAPI(Resource):
             database.commit()
         except Exception as e:
             return {'message': '서버에 오류가 발생했어요 :(\n지속적으로 발생하면 문의주세요!', 'error': str(e)}, 400
-        finally:
-            database.close()
 
         return {'message': '출석 정보를 수정했어요 :)'}, 200
 
@@ -158,21 +137,19 @@ class AttendanceInfoAPI(Resource):
         id = request.args['id']
         # DB 예외처리
         try:
-            database = Database()
-
-            # 회원 출석 정보 삭제
-            sql = "DELETE FROM user_attendance WHERE attendance_id = %s;"
-            database.execute(sql, (id,))
+            database = get_database()
 
-            # 출석 정보 삭제
-            sql = "DELETE FROM attendance WHERE id = %s;"
-            database.execute(sql, (id,))
+            # 회원 출석 정보와 출석 정보를 하나의 트랜잭션으로 삭제
+            with database.transaction():
+                # 회원 출석 정보 삭제
+                sql = "DELETE FROM user_attendance WHERE attendance_id = %s;"
+                database.execute(sql, (id,))
 
-            database.commit()
+                # 출석 정보 삭제
+                sql = "DELETE FROM attendance WHERE id = %s;"
+                database.execute(sql, (id,))
         except Exception as e:
             return {'message': '서버에 오류가 발생했어요 :(\n지속적으로 발생하면 문의주세요!', 'error': str(e)}, 400
-        finally:
-            database.close()
 
         return {'message': '출석 정보를 삭제했어요 :)'}, 200
  
@@ -191,33 +168,24 @@ class AttendanceUserListAPI(Resource):
         # DB 예외 처리
         try:
             # DB에서 회원 목록 불러오기
-            database = Database()
+            database = get_database()
             sql = "SELECT u.id, u.name, u.grade, u.part_index, u.rest_type, ua.first_auth_time, ua.second_auth_time, ua.state FROM users u LEFT JOIN user_attendance ua "\
                   "ON u.id = ua.user_id WHERE ua.attendance_id = %s;"
             user_list = database.execute_all(sql, (attendance_id,))
 
             # 회원 이름 복호화
             cript = AESCipher()
-            for idx, user in enumerate(user_list):
-                user_list[idx]['name'] = cript.decrypt(user['name'])
+            names = cript.decrypt_many(user['name'] for user in user_list)
+            for idx, name in enumerate(names):
+                user_list[idx]['name'] = name
         except Exception as e:
             return {'message': '서버에 오류가 발생했어요 :(\n지속적으로 발생하면 문의주세요!', 'error': str(e)}, 400
-        finally:
-            database.close()
 
         if not user_list: # 회원이 존재하지 않을 경우 처리
             return [], 200
         else:
             # index 및 time을 문자열로 변환
-            for idx, user in enumerate(user_list):
-                user_list[idx]['part_index'] = UserEnum.Part(user['part_index'])
-                user_list[idx]['part'] = user.pop('part_index')
-                user_list[idx]['rest_type'] = UserEnum.RestType(user['rest_type'])
-                user_list[idx]['state'] = AttendanceEnum.UserAttendanceState(user['state'])
-                user_list[idx]['first_auth_time'] = str(user['first_auth_time'])
-                user_list[idx]['second_auth_time'] = str(user['second_auth_time'])
-
-            return user_list, 200
+            return AdminAttendanceDTO.serialize_admin_attendance_user.many(user_list), 200
     
 @attendance.route('/user')
 class AttendanceUserAPI(Resource):
@@ -235,22 +203,14 @@ class AttendanceUserAPI(Resource):
         # DB 예외처리
         try:
             # DB에서 회원 출석 정보 불러오기
-            database = Database()
+            database = get_database()
             sql = "SELECT * FROM user_attendance WHERE attendance_id = %s and user_id = %s;"
             user_attendance = database.execute_one(sql, (attendance_id, user_id))
         except Exception as e:
             return {'message': '서버에 오류가 발생했어요 :(\n지속적으로 발생하면 문의주세요!', 'error': str(e)}, 400
-        finally:
-            database.close()
 
-        # 회원 출석 정보가 존재할 시 처리
-        if user_attendance:
-            # 회원 출석 state, 출석 인증 시간을 문자열로 변경
-            user_attendance['state'] = AttendanceEnum.UserAttendanceState(user_attendance['state'])
-            user_attendance['first_auth_time'] = str(user_attendance['first_auth_time'])
-            user_attendance['second_auth_time'] = str(user_attendance['second_auth_time'])
-        
-        return user_attendance, 200
+        # 회원 출석 정보가 존재할 시 state, 출석 인증 시간을 문자열로 변경
+        return AdminAttendanceDTO.serialize_user_attendance(user_attendance), 200
 
     @attendance.expect(AdminAttendanceDTO.model_user_attendance, validate=True)
     @attendance.response(200, 'OK', AdminAttendanceDTO.response_message)
@@ -267,7 +227,7 @@ class AttendanceUserAPI(Resource):
         # DB 예외처리
         try:
             # 수정된 회원 출석 정보를 DB에 반영
-            database = Database()
+            database = get_database()
             sql = "INSERT INTO user_attendance (attendance_id, user_id, state, first_auth_time, second_auth_time) VALUES(%s, %s, %s, %s, %s) "\
                   "ON DUPLICATE KEY UPDATE state = %s, first_auth_time = %s, second_auth_time = %s;"
             values = (
@@ -284,7 +244,5 @@ class AttendanceUserAPI(Resource):
             database.commit()
         except Exception as e:
             return {'message': '서버에 오류가 발생했어요 :(\n지속적으로 발생하면 문의주세요!', 'error': str(e)}, 400
-        finally:
-            database.close()
 
         return {'message': '유저 출석 정보를 수정했어요 :)'}, 200
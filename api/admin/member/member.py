@@ -0,0 +1,60 @@
+from flask import request
+from flask_restx import Resource
+from database.database import get_database
+from utils.dto import AdminMemberDTO
+from utils.aes_cipher import AESCipher
+from utils.api_access_level_tool import api_access_level
+from utils import blind_index
+
+member = AdminMemberDTO.api
+
+# 검색 결과 최대 회원 수
+SEARCH_LIMIT = 50
+
+@member.route('/search')
+class AdminMemberSearchAPI(Resource):
+    # 이름/전화번호로 회원 검색 (전체 회원을 복호화하지 않고 blind index 토큰으로 조회)
+    @member.expect(AdminMemberDTO.query_member_search, validate=True)
+    @member.response(200, 'OK', [AdminMemberDTO.model_admin_member])
+    @member.response(400, 'Bad Request', AdminMemberDTO.response_message)
+    @member.doc(security='apiKey')
+    @api_access_level(2)
+    def get(self):
+        name = request.args.get('name', None)
+        phone_number = request.args.get('phone_number', None)
+        prefix = request.args.get('prefix', 'false').lower() in ('true', '1', 'yes', 'on')
+
+        try:
+            tokens = blind_index.search_tokens(name, phone_number, prefix)
+        except blind_index.SearchTermTooShortError as e:
+            return {'message': str(e)}, 400
+        if not tokens:
+            return {'message': '이름 또는 전화번호를 입력해주세요 :('}, 400
+
+        try:
+            # 모든 검색 조건의 토큰을 가진 회원만 조회
+            database = get_database()
+            conditions = ' OR '.join(['(kind = %s AND token = %s)'] * len(tokens))
+            sql = f"""
+                SELECT u.id, u.name, u.level, u.grade, u.part_index, u.rest_type
+                FROM users u
+                JOIN (
+                    SELECT user_id FROM user_blind_index
+                    WHERE {conditions}
+                    GROUP BY user_id HAVING COUNT(DISTINCT kind) = %s
+                ) AS bi ON u.id = bi.user_id
+                LIMIT %s;
+            """
+            values = [value for token in tokens for value in token] + [len(tokens), SEARCH_LIMIT]
+            user_list = database.execute_all(sql, tuple(values))
+        except Exception as e:
+            return {'message': '서버에 오류가 발생했어요 :(\n지속적으로 발생하면 문의주세요!', 'error': str(e)}, 400
+
+        # 검색된 회원의 이름만 복호화
+        crypt = AESCipher()
+        names = crypt.decrypt_many(user['name'] for user in user_list)
+        for idx, user in enumerate(user_list):
+            user_list[idx]['name'] = names[idx]
+
+        # index를 문자열로 변환
+        return AdminMemberDTO.serialize_admin_member.many(user_list), 200
@@ -1,6 +1,6 @@
 from flask import Flask, request
 from flask_restx import Resource, Namespace
-from database.database import Database
+from database.database import get_database
 from datetime import datetime, date
 from utils.dto import AdminNotificationDTO
 from flask_jwt_extended import jwt_required, get_jwt_identity
@@ -8,6 +8,7 @@ from utils.enum_tool import NotificationEnum
 from utils.aes_cipher import AESCipher
 from utils import fcm
 from utils.api_access_level_tool import api_access_level
+from utils.stream_tool import stream_json_response
 
 notification = AdminNotificationDTO.api
 
@@ -22,7 +23,7 @@ class NotificationByCategoryAPI(Resource):
         category = NotificationEnum.Category(request.args['category'])
 
         try:
-            database = Database()
+            database = get_database()
             sql = "SELECT id, category, member_category, date, day, time, location, schedule, message, memo FROM notification WHERE category = %s;"
             values = (category,)
             notification_list = database.execute_all(sql, values)
@@ -30,15 +31,8 @@ class NotificationByCategoryAPI(Resource):
             if not notification_list:
                 return [], 200
             else:
+                notification_list = AdminNotificationDTO.serialize_notification.many(notification_list)
                 for idx, notification in enumerate(notification_list):
-                    if notification['date']:
-                        notification_list[idx]['date'] = notification['date'].strftime('%Y-%m-%d')
-                    notification_list[idx]['schedule'] = notification['schedule'].strftime('%Y-%m-%dT%H:%M:%S')
-                    notification_list[idx]['day'] = NotificationEnum.DayCategory(notification['day'])
-                    notification_list[idx]['time'] = str(notification['time'])
-                    notification_list[idx]['category'] = NotificationEnum.Category(notification['category'])
-                    notification_list[idx]['member_category'] = NotificationEnum.MemberCategory(notification['member_category'])
-
                     if notification_list[idx]['member_category'] == '기타 선택':
                         sql = "SELECT user_id FROM notification_member WHERE notification_id = %s;"
                         values = (notification['id'],)
@@ -48,8 +42,6 @@ class NotificationByCategoryAPI(Resource):
                 return notification_list, 200
         except Exception as e:
             return {'message': '서버에 오류가 발생했어요 :(\n지속적으로 발생하면 문의주세요!', 'error': str(e)}, 400
-        finally:
-            database.close()
     
     @notification.expect(AdminNotificationDTO.model_notification_without_id, validate=True)
     @notification.response(201, 'Created', AdminNotificationDTO.response_message)
@@ -70,27 +62,26 @@ class NotificationByCategoryAPI(Resource):
                 f"{'파트' if category != 3 else ''} 회의가 {notification['schedule']}에 시작됩니다."
 
         try:
-            database = Database()
-
-            sql = "INSERT INTO notification (category, member_category, date, day, time, location, schedule, message, memo) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s);"
-            values = (notification['category'], notification['member_category'], notification['date'], notification['day'], notification['time'], \
-                      notification['location'], notification['schedule'], notification['message'], notification['memo'])
-            database.execute(sql, values)
-            id = database.cursor.lastrowid
-
-            if category == 3:
-                sql = "SELECT id FROM users WHERE rest_type = -1;"
-                notification['member_list'] = [user['id'] for user in database.execute_all(sql)]
-            elif category <= 2:
-                sql = "SELECT id FROM users WHERE rest_type = -1 AND part_index = %s;"
-                values = (category,)
-                notification['member_list'] = [user['id'] for user in database.execute_all(sql, values)]
-            
-            sql = "INSERT INTO notification_member (notification_id, user_id, read_flag, del_flag) VALUES (%s, %s, 0, 0);"
-            values = [(id, member) for member in notification['member_list']]
-            database.execute_many(sql, values)
-
-            database.commit()
+            database = get_database()
+
+            # 알림 정보와 알림 대상 회원을 하나의 트랜잭션으로 저장
+            with database.transaction():
+                sql = "INSERT INTO notification (category, member_category, date, day, time, location, schedule, message, memo) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s);"
+                values = (notification['category'], notification['member_category'], notification['date'], notification['day'], notification['time'], \
+                          notification['location'], notification['schedule'], notification['message'], notification['memo'])
+                database.execute(sql, values)
+                id = database.cursor.lastrowid
+
+                if category == 3:
+                    sql = "SELECT id FROM users WHERE rest_type = -1;"
+                    notification['member_list'] = [user['id'] for user in database.execute_all(sql)]
+                elif category <= 2:
+                    sql = "SELECT id FROM users WHERE rest_type = -1 AND part_index = %s;"
+                    values = (category,)
+                    notification['member_list'] = [user['id'] for user in database.execute_all(sql, values)]
+
+                values = [(id, member, 0, 0) for member in notification['member_list']]
+                database.bulk_insert('notification_member', ['notification_id', 'user_id', 'read_flag', 'del_flag'], values)
 
             if category in NotificationEnum.FcmTopic:
                 title = "회의 알림"
@@ -101,8 +92,6 @@ class NotificationByCategoryAPI(Resource):
                 pass
         except Exception as e:
             return {'message': '서버에 오류가 발생했어요 :(\n지속적으로 발생하면 문의주세요!', 'error': str(e)}, 400
-        finally:
-            database.close()
 
         return {'message': '알림 정보를 추가했어요 :)'}, 201
 
@@ -125,30 +114,29 @@ class NotificationByCategoryAPI(Resource):
                 f"{'파트' if category != 3 else ''} 회의가 {notification['schedule']}에 시작됩니다."
 
         try:
-            database = Database()
-
-            sql = "UPDATE notification SET category = %s, member_category = %s, date = %s, day = %s, time = %s, location = %s, schedule = %s, message = %s, memo = %s WHERE id = %s;"
-            values = (notification['category'], notification['member_category'], notification['date'], notification['day'], notification['time'], \
-                      notification['location'], notification['schedule'], notification['message'], notification['memo'], notification['id'])
-            database.execute(sql, values)
-
-            sql = "DELETE FROM notification_member WHERE notification_id = %s;"
-            values = (notification['id'],)
-            database.execute(sql, values)
-            
-            if category == 3:
-                sql = "SELECT id FROM users WHERE rest_type = -1;"
-                notification['member_list'] = [user['id'] for user in database.execute_all(sql)]
-            elif category <= 2:
-                sql = "SELECT id FROM users WHERE rest_type = -1 AND part_index = %s;"
-                values = (category,)
-                notification['member_list'] = [user['id'] for user in database.execute_all(sql, values)]
-
-            sql = "INSERT INTO notification_member (notification_id, user_id, read_flag, del_flag) VALUES (%s, %s, 0, 0);"
-            values = [(notification['id'], member) for member in notification['member_list']]
-            database.execute_many(sql, values)
-
-            database.commit()
+            database = get_database()
+
+            # 알림 정보 수정과 알림 대상 회원 교체를 하나의 트랜잭션으로 처리
+            with database.transaction():
+                sql = "UPDATE notification SET category = %s, member_category = %s, date = %s, day = %s, time = %s, location = %s, schedule = %s, message = %s, memo = %s WHERE id = %s;"
+                values = (notification['category'], notification['member_category'], notification['date'], notification['day'], notification['time'], \
+                          notification['location'], notification['schedule'], notification['message'], notification['memo'], notification['id'])
+                database.execute(sql, values)
+
+                sql = "DELETE FROM notification_member WHERE notification_id = %s;"
+                values = (notification['id'],)
+                database.execute(sql, values)
+
+                if category == 3:
+                    sql = "SELECT id FROM users WHERE rest_type = -1;"
+                    notification['member_list'] = [user['id'] for user in database.execute_all(sql)]
+                elif category <= 2:
+                    sql = "SELECT id FROM users WHERE rest_type = -1 AND part_index = %s;"
+                    values = (category,)
+                    notification['member_list'] = [user['id'] for user in database.execute_all(sql, values)]
+
+                values = [(notification['id'], member, 0, 0) for member in notification['member_list']]
+                database.bulk_insert('notification_member', ['notification_id', 'user_id', 'read_flag', 'del_flag'], values)
 
             if category in NotificationEnum.FcmTopic:
                 title = "회의 알림"
@@ -159,8 +147,6 @@ class NotificationByCategoryAPI(Resource):
                 pass
         except Exception as e:
             return {'message': '서버에 오류가 발생했어요 :(\n지속적으로 발생하면 문의주세요!', 'error': str(e)}, 400
-        finally:
-            database.close()
 
         return {'message': '알림 정보를 수정했어요 :)'}, 200
 
@@ -173,22 +159,20 @@ class NotificationByCategoryAPI(Resource):
         id = request.args['id']
 
         try:
-            database = Database()
-
-            sql = "DELETE FROM notification_member WHERE notification_id = %s;"
-            values = (id,)
-            database.execute(sql, values)
+            database = get_database()
 
-            sql = "DELETE FROM notification WHERE id = %s;"
-            database.execute(sql, values)
+            # 알림 대상 회원과 알림 정보를 하나의 트랜잭션으로 삭제
+            with database.transaction():
+                sql = "DELETE FROM notification_member WHERE notification_id = %s;"
+                values = (id,)
+                database.execute(sql, values)
 
-            database.commit()
+                sql = "DELETE FROM notification WHERE id = %s;"
+                database.execute(sql, values)
 
             fcm.remove_message(str(id))
         except Exception as e:
             return {'message': '서버에 오류가 발생했어요 :(\n지속적으로 발생하면 문의주세요!', 'error': str(e)}, 400
-        finally:
-            database.close()
 
         return {'message': '알림 정보를 삭제했어요 :)'}, 200
     
@@ -200,18 +184,19 @@ class NotificationUserListAPI(Resource):
     @api_access_level(2)
     def get(self):
         try:
-            database = Database()
+            # 회원 목록은 전체를 메모리에 올리지 않고 한 행씩 읽어온다.
+            database = get_database()
             sql = "SELECT id, name, grade FROM users;"
-            user_list = database.execute_all(sql)
-
-            cript = AESCipher()
-            for idx, user in enumerate(user_list):
-                user_list[idx]['name'] = cript.decrypt(user['name'])
+            user_list = database.execute_stream(sql)
         except Exception as e:
             return {'message': '서버에 오류가 발생했어요 :(\n지속적으로 발생하면 문의주세요!', 'error': str(e)}, 400
-        finally:
-            database.close()
-        return user_list, 200
+
+        cript = AESCipher()
+        def convert(user):
+            user['name'] = cript.decrypt(user['name'])
+            return user
+
+        return stream_json_response(user_list, convert)
 
 @notification.route('/payment-period')
 class NotificationPaymentPeriodAPI(Resource):
@@ -224,21 +209,14 @@ class NotificationPaymentPeriodAPI(Resource):
         start_month = date(datetime.today().year - 1, 6, 1).strftime('%Y-%m-%d')
 
         try:
-            database = Database()
+            database = get_database()
             sql = "SELECT date, start_date, end_date FROM monthly_payment_periods WHERE date between %s AND %s ORDER BY date;"
             values = (start_month, current_month)
             payment_period_list = database.execute_all(sql, values)
         except Exception as e:
             return {'message': '서버에 오류가 발생했어요 :(\n지속적으로 발생하면 문의주세요!', 'error': str(e)}, 400
-        finally:
-            database.close()
 
         if not payment_period_list:
             return [], 200
         else:
-            for idx, payment_period in enumerate(payment_period_list):
-                payment_period_list[idx]['date'] = payment_period['date'].strftime('%Y-%m-%d')
-                payment_period_list[idx]['start_date'] = payment_period['start_date'].strftime('%Y-%m-%d')
-                payment_period_list[idx]['end_date'] = payment_period['end_date'].strftime('%Y-%m-%d')
-            
-            return payment_period_list, 200
+            return AdminNotificationDTO.serialize_payment_period.many(payment_period_list), 200
@@ -0,0 +1,57 @@
+from flask import request
+from flask_restx import Resource
+from database import query_log, index_advisor
+from database.database import Database
+from utils.dto import AdminQueryDTO
+from utils.aes_cipher import decrypt_cache_stats
+from utils.api_access_level_tool import api_access_level
+
+query = AdminQueryDTO.api
+
+@query.route('/stats')
+class QueryStatsAPI(Resource):
+    # 쿼리 통계 요약 얻기
+    @query.expect(AdminQueryDTO.query_limit, validate=True)
+    @query.response(200, 'OK', AdminQueryDTO.model_query_summary)
+    @query.doc(security='apiKey')
+    @api_access_level(2)
+    def get(self):
+        limit = int(request.args.get('limit', 50))
+        return query_log.get_summary(limit), 200
+
+    # 쿼리 통계 초기화
+    @query.response(200, 'OK', AdminQueryDTO.response_message)
+    @query.doc(security='apiKey')
+    @api_access_level(2)
+    def delete(self):
+        query_log.reset_summary()
+        return {'message': '쿼리 통계를 초기화했어요 :)'}, 200
+
+@query.route('/pool')
+class PoolStatsAPI(Resource):
+    # 커넥션 풀 상태 얻기
+    @query.response(200, 'OK', AdminQueryDTO.model_database_pool)
+    @query.doc(security='apiKey')
+    @api_access_level(2)
+    def get(self):
+        return Database.pool_stats(), 200
+
+@query.route('/explain')
+class QueryExplainAPI(Resource):
+    # 쿼리 실행 계획 점검 결과 얻기 (개발 모드에서 explain_queries 설정 시 수집)
+    @query.expect(AdminQueryDTO.explain_filter, validate=True)
+    @query.response(200, 'OK', [AdminQueryDTO.model_explain_report])
+    @query.doc(security='apiKey')
+    @api_access_level(2)
+    def get(self):
+        problems_only = request.args.get('all', 'false').lower() not in ('true', '1', 'yes', 'on')
+        return index_advisor.get_reports(problems_only), 200
+
+@query.route('/decrypt')
+class DecryptCacheStatsAPI(Resource):
+    # 복호화 캐시 통계 얻기
+    @query.response(200, 'OK', AdminQueryDTO.model_decrypt_cache)
+    @query.doc(security='apiKey')
+    @api_access_level(2)
+    def get(self):
+        return decrypt_cache_stats(), 200
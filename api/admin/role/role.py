@@ -1,11 +1,11 @@
 from flask import Flask, request
 from flask_restx import Resource, Namespace
-from database.database import Database
+from database.database import get_database
 from datetime import datetime, date
 from utils.dto import AdminRoleDTO
 from flask_jwt_extended import jwt_required, get_jwt_identity
 from utils.enum_tool import AdminEnum
-from utils.api_access_level_tool import api_access_level
+from utils.api_access_level_tool import api_access_level, bump_token_generation
 
 role = AdminRoleDTO.api
 
@@ -17,22 +17,16 @@ class AdminRoleListAPI(Resource):
     @api_access_level(2)
     def get(self):
         try:
-            database = Database()
+            database = get_database()
             sql = "SELECT * FROM admin;"
             admin_list = database.execute_all(sql)
         except Exception as e:
             return {'message': '서버에 오류가 발생했어요 :(\n지속적으로 발생하면 문의주세요!', 'error': str(e)}, 400
-        finally:
-            database.close()
 
         if not admin_list:
             return [], 200
         else:
-            for idx, admin in enumerate(admin_list):
-                admin_list[idx]['start_date'] = admin['start_date'].strftime('%Y-%m-%d')
-                admin_list[idx]['end_date'] = admin['end_date'].strftime('%Y-%m-%d')
-                admin_list[idx]['role'] = AdminEnum.Role(admin['role'])
-            return admin_list, 200
+            return AdminRoleDTO.serialize_admin_role.many(admin_list), 200
 
 @role.route('')
 class AdminRoleAPI(Resource):
@@ -45,23 +39,17 @@ class AdminRoleAPI(Resource):
         id = request.args['id']
 
         try:
-            database = Database()
+            database = get_database()
             sql = "SELECT * FROM admin WHERE id = %s;"
             values = (id,)
             admin = database.execute_one(sql, values)
         except Exception as e:
             return {'message': '서버에 오류가 발생했어요 :(\n지속적으로 발생하면 문의주세요!', 'error': str(e)}, 400
-        finally:
-            database.close()
 
         if not admin:
             return None, 200
         else:
-            admin['start_date'] = admin['start_date'].strftime('%Y-%m-%d')
-            admin['end_date'] = admin['end_date'].strftime('%Y-%m-%d')
-            admin['role'] = AdminEnum.Role(admin['role'])
-
-            return admin, 200
+            return AdminRoleDTO.serialize_admin_role(admin), 200
     
     @role.expect(AdminRoleDTO.model_admin_role_without_id, validate=True)
     @role.response(201, 'Created', AdminRoleDTO.response_admin_role_message)
@@ -74,15 +62,16 @@ class AdminRoleAPI(Resource):
         admin['role'] = AdminEnum.Role(admin['role'])
 
         try:
-            database = Database()
+            database = get_database()
             sql = "INSERT INTO admin (user_id, role, start_date, end_date) VALUES (%s, %s, %s, %s);"
             values = (admin['user_id'], admin['role'], admin['start_date'], admin['end_date'])
             database.execute(sql, values)
             database.commit()
         except Exception as e:
             return {'message': '서버에 오류가 발생했어요 :(\n지속적으로 발생하면 문의주세요!', 'error': str(e)}, 400
-        finally:
-            database.close()
+
+        # 임원진 직책에 따라 접근 권한이 바뀌므로 토큰 세대 갱신
+        bump_token_generation(admin['user_id'])
 
         return {'message': '임원진 직책 정보를 추가했어요 :)'}, 201
 
@@ -97,15 +86,24 @@ class AdminRoleAPI(Resource):
         admin['role'] = AdminEnum.Role(admin['role'])
 
         try:
-            database = Database()
+            database = get_database()
+            sql = "SELECT user_id FROM admin WHERE id = %s;"
+            values = (admin['id'],)
+            previous = database.execute_one(sql, values)
+
             sql = "UPDATE admin SET user_id = %s, role = %s, start_date = %s, end_date = %s WHERE id = %s;"
             values = (admin['user_id'], admin['role'], admin['start_date'], admin['end_date'], admin['id'])
             database.execute(sql, values)
             database.commit()
         except Exception as e:
             return {'message': '서버에 오류가 발생했어요 :(\n지속적으로 발생하면 문의주세요!', 'error': str(e)}, 400
-        finally:
-            database.close()
+
+        # 직책이 바뀐 회원(이전 회원 포함)의 토큰 세대 갱신
+        user_ids = {admin['user_id']}
+        if previous:
+            user_ids.add(previous['user_id'])
+        for user_id in user_ids:
+            bump_token_generation(user_id)
 
         return {'message': '임원진 직책 정보를 수정했어요 :)'}, 200
     
@@ -118,15 +116,19 @@ class AdminRoleAPI(Resource):
         id = request.args['id']
 
         try:
-            database = Database()
-            sql = "DELETE FROM admin WHERE id = %s;"
+            database = get_database()
+            sql = "SELECT user_id FROM admin WHERE id = %s;"
             values = (id,)
+            admin = database.execute_one(sql, values)
+
+            sql = "DELETE FROM admin WHERE id = %s;"
             database.execute(sql, values)
             database.commit()
         except Exception as e:
             return {'message': '서버에 오류가 발생했어요 :(\n지속적으로 발생하면 문의주세요!', 'error': str(e)}, 400
-        finally:
-            database.close()
+
+        if admin:
+            bump_token_generation(admin['user_id'])
 
         return {'message': '임원진 직책 정보를 삭제했어요 :)'}, 200
     
@@ -141,14 +143,12 @@ class AdminRoleCheckAPI(Resource):
         user_id = request.args['user_id']
 
         try:
-            database = Database()
+            database = get_database()
             sql = "SELECT * FROM admin WHERE user_id = %s ORDER BY start_date DESC;"
             values = (user_id,)
             record_list = database.execute_all(sql, values)
         except Exception as e:
             return {'message': '서버에 오류가 발생했어요 :(\n지속적으로 발생하면 문의주세요!', 'error': str(e)}, 400
-        finally:
-            database.close()
 
         if not record_list:
             return {'current_role': None, 'record_list': []}, 200
@@ -156,13 +156,10 @@ class AdminRoleCheckAPI(Resource):
             current_date = datetime.today().date()
             current_role = None
 
-            for idx, record in enumerate(record_list):
+            for record in record_list:
                 if record['start_date'] <= current_date <= record['end_date']:
                     current_role = AdminEnum.Role(record['role'])
-                
-                record_list[idx]['start_date'] = record['start_date'].strftime('%Y-%m-%d')
-                record_list[idx]['end_date'] = record['end_date'].strftime('%Y-%m-%d')
-                record_list[idx]['role'] = AdminEnum.Role(record['role'])
+            record_list = AdminRoleDTO.serialize_admin_role.many(record_list)
 
             return {'current_role': current_role, 'record_list': record_list}, 200
 
@@ -174,14 +171,12 @@ class AdminAPIAccessLevelAPI(Resource):
         user_id = request.args['user_id']
 
         try:
-            database = Database()
+            database = get_database()
             sql = "SELECT api_access_level FROM users WHERE id = %s;"
             values = (user_id,)
             api_access_level = database.execute_one(sql, values)
         except Exception as e:
             return {'message': '서버에 오류가 발생했어요 :(\n지속적으로 발생하면 문의주세요!', 'error': str(e)}, 400
-        finally:
-            database.close()
 
         return {'api_access_level': api_access_level}, 200
     
@@ -191,14 +186,15 @@ class AdminAPIAccessLevelAPI(Resource):
         data = request.get_json()
 
         try:
-            database = Database()
+            database = get_database()
             sql = "UPDATE users SET api_access_level = %s WHERE id = %s;"
             values = (data['api_access_level'], data['user_id'])
             database.execute(sql, values)
             database.commit()
         except Exception as e:
             return {'message': '서버에 오류가 발생했어요 :(\n지속적으로 발생하면 문의주세요!', 'error': str(e)}, 400
-        finally:
-            database.close()
+
+        # 이미 발급된 토큰의 접근 권한 claim 무효화
+        bump_token_generation(data['user_id'])
 
         return {'message': 'API 접근 권한을 수정했어요 :)'}, 200
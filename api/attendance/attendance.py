@@ -1,6 +1,6 @@
 from flask import Flask, request
 from flask_restx import Resource, Namespace
-from database.database import Database
+from database.database import get_database
 import datetime
 from utils.dto import AttendanceDTO
 from flask_jwt_extended import jwt_required, get_jwt_identity
@@ -53,7 +53,7 @@ class AttendanceUserAPI(Resource):
         prev_attendance_count = int(request.args['prev_attendance_count'])
 
         try:
-            database = Database()
+            database = get_database()
 
             sql = """
                 SELECT a.id as attendance_id, a.category, a.date, a.first_auth_start_time, a.first_auth_end_time,
@@ -78,23 +78,11 @@ class AttendanceUserAPI(Resource):
             record_list = database.execute_all(sql, values)
         except Exception as e:
             return {'message': '서버에 오류가 발생했어요 :(\n지속적으로 발생하면 문의주세요!', 'error': str(e)}, 400
-        finally:
-            database.close()
 
-        for idx, record in enumerate(record_list):
-            record_list[idx]['date'] = record['date'].strftime('%Y-%m-%d')
-        
+        record_list = AttendanceDTO.serialize_record.many(record_list)
         record_list.extend([None] * (prev_attendance_count - len(record_list)))
 
-        attendance['date'] = attendance['date'].strftime('%Y-%m-%d')
-        attendance['first_auth_start_time'] = str(attendance['first_auth_start_time'])
-        attendance['first_auth_end_time'] = str(attendance['first_auth_end_time'])
-        attendance['second_auth_start_time'] = str(attendance['second_auth_start_time'])
-        attendance['second_auth_end_time'] = str(attendance['second_auth_end_time'])
-        attendance['first_auth_time'] = str(attendance['first_auth_time'])
-        attendance['second_auth_time'] = str(attendance['second_auth_time'])
-        attendance['category'] = AttendanceEnum.Category(attendance['category'])
-        attendance['state'] = AttendanceEnum.UserAttendanceState(attendance['state'])
+        attendance = AttendanceDTO.serialize_attendance(attendance)
 
         return {'attendance': attendance, 'record_list': record_list}, 200
     
@@ -110,7 +98,7 @@ class AttendanceUserAPI(Resource):
         user_attendance['state'] = AttendanceEnum.UserAttendanceState(user_attendance['state'])
 
         try:
-            database = Database()
+            database = get_database()
             sql = """
                 INSERT INTO user_attendance (attendance_id, user_id, state, first_auth_time, second_auth_time) 
                 VALUES(%s, %s, %s, %s, %s)
@@ -123,8 +111,6 @@ class AttendanceUserAPI(Resource):
             database.commit()
         except Exception as e:
             return {'message': '서버에 오류가 발생했어요 :(\n지속적으로 발생하면 문의주세요!', 'error': str(e)}, 400
-        finally:
-            database.close()
 
         return {'message': '회원의 출석 인증 정보를 수정했어요 :)'}, 200
     
@@ -139,7 +125,7 @@ class AttendanceDetailAPI(Resource):
         user_id = get_jwt_identity()
         
         try:
-            database = Database()
+            database = get_database()
             sql = """
                 SELECT a.category, a.date, ua.state 
                 FROM user_attendance ua 
@@ -151,17 +137,12 @@ class AttendanceDetailAPI(Resource):
             attendance_list = database.execute_all(sql, values)
         except Exception as e:
             return {'message': '서버에 오류가 발생했어요 :(\n지속적으로 발생하면 문의주세요!', 'error': str(e)}, 400
-        finally:
-            database.close()
 
         record_dictionary = {}
 
-        for idx, attendance in enumerate(attendance_list):
+        for attendance in attendance_list:
             week_of_month = get_week_of_month(attendance['date'])
-
-            attendance_list[idx]['date'] = attendance['date'].strftime('%Y-%m-%d')
-            attendance_list[idx]['category'] = AttendanceEnum.Category(attendance['category'])
-            attendance_list[idx]['state'] = AttendanceEnum.UserAttendanceState(attendance['state'])
+            attendance = AttendanceDTO.serialize_record_by_category(attendance)
 
             if attendance['category'] not in record_dictionary:
                 record_dictionary[attendance['category']] = []
@@ -1,13 +1,12 @@
 from flask_restx import Resource
-from flask_jwt_extended import (
-    create_access_token, create_refresh_token,
-    jwt_required, get_jwt_identity, get_jwt
-)
+from flask_jwt_extended import jwt_required, get_jwt_identity, get_jwt
 from flask_restx import Resource, Namespace
 from flask import request, current_app
 from utils.dto import AuthDTO
 import time
-from utils.api_access_level_tool import api_access_level
+from database.database import get_database
+from utils.api_access_level_tool import api_access_level, create_tokens
+from utils import jwt_blocklist_tool
 
 auth = AuthDTO.api
 
@@ -20,10 +19,12 @@ class TokenAPI(Resource):
     @api_access_level(1, refresh=True)
     @auth.doc(security='apiKey')
     def get(self):
-        # refresh token으로 갱신
+        # refresh token으로 갱신 (API 접근 권한은 갱신 시점에 다시 계산)
         user_id = get_jwt_identity()
-        access_token = create_access_token(identity=user_id)
-        refresh_token = create_refresh_token(identity=user_id)
+        try:
+            access_token, refresh_token = create_tokens(get_database(), user_id)
+        except Exception as e:
+            return {'message': '서버에 오류가 발생했어요 :(\n지속적으로 발생하면 문의주세요!', 'error': str(e)}, 400
         token = { 'access_token': access_token, 'refresh_token': refresh_token }
         return token, 200
 
@@ -33,8 +34,10 @@ class TokenTestAPI(Resource):
     @api_access_level(0)
     def get(self):
         user_id = request.args['user_id']
-        access_token = create_access_token(identity=user_id)
-        refresh_token = create_refresh_token(identity=user_id)
+        try:
+            access_token, refresh_token = create_tokens(get_database(), user_id)
+        except Exception as e:
+            return {'message': '서버에 오류가 발생했어요 :(\n지속적으로 발생하면 문의주세요!', 'error': str(e)}, 400
         token = { 'access_token': access_token, 'refresh_token': refresh_token }
         return token, 200
 
@@ -53,9 +56,9 @@ class LogoutAPI(Resource):
         # memcache(jwt_blocklist)에 보관될 시간 계산
         token_expires = int(token['exp'] - time.time())
 
-        # memcache(jwt_blocklist)에 보관 (= 토큰 파괴)
+        # memcache(jwt_blocklist)에 보관하고 폐기 로그에 기록 (= 토큰 파괴)
         mc = current_app.extensions['memcache_client']
-        mc.set(jti, "", token_expires + 10) # 오차 고려하여 10초 추가 보관
+        jwt_blocklist_tool.revoke_token(mc, jti, token_expires + 10) # 오차 고려하여 10초 추가 보관
 
         # 결과 메시지
         message = f"{ttype.capitalize()} 토큰이 성공적으로 제거되었어요 :)"
@@ -1,19 +1,18 @@
-import configparser
+from utils.config_tool import get_config
 import requests
 import hashlib
 import re
 import uuid
 from flask import Flask, request, session, current_app
 from flask_restx import Resource, Namespace
-from flask_jwt_extended import create_access_token, create_refresh_token
-from database.database import Database
+from database.database import get_database
 import random, sms
 from utils.dto import OAuthDTO
 from utils.enum_tool import NotificationEnum
 from utils import fcm
+from utils.api_access_level_tool import create_tokens
 
-config = configparser.ConfigParser()
-config.read('config/config.ini', encoding='utf-8')
+config = get_config()
 
 client_id = config['naver_login']['client_id']
 client_secret = config['naver_login']['client_secret']
@@ -54,32 +53,30 @@ class NaverLogin(Resource):
         user_id = hashlib.sha256(name.encode('utf-8') + phone_number.encode('utf-8')).hexdigest()
         
         try:
-            database = Database()
+            database = get_database()
             sql = "SELECT is_signed FROM users WHERE id = %s;"
             values = (user_id,)
             is_signed = database.execute_one(sql, values)
             if is_signed is None:
                 return {'message': '판도라큐브 회원 정보가 없어요 :('}, 401
             
-            access_token = create_access_token(identity=user_id)
-            refresh_token = create_refresh_token(identity=user_id)
+            access_token, refresh_token = create_tokens(database, user_id)
             token = {'access_token': access_token, 'refresh_token': refresh_token}
             
             is_signed = is_signed['is_signed']
             if is_signed:
                 return token, 200
             
-            sql = "INSERT INTO identifier (identifier, user_id, is_signed) VALUES (%s, %s, %s);"
-            values = (naver_identifier, user_id, 0)
-            database.execute(sql, values)
-            sql = "UPDATE users SET is_signed = 1 WHERE id = %s;"
-            values = (user_id,)
-            database.execute(sql, values)
-            database.commit()
+            # 식별자 등록과 가입 상태 변경을 하나의 트랜잭션으로 처리
+            with database.transaction():
+                sql = "INSERT INTO identifier (identifier, user_id, is_signed) VALUES (%s, %s, %s);"
+                values = (naver_identifier, user_id, 0)
+                database.execute(sql, values)
+                sql = "UPDATE users SET is_signed = 1 WHERE id = %s;"
+                values = (user_id,)
+                database.execute(sql, values)
         except Exception as e:
             return {'message': '서버에 오류가 발생했어요 :(\n지속적으로 발생하면 문의주세요!', 'error': str(e)}, 400
-        finally:
-            database.close()
         
         return token, 200
 
@@ -161,9 +158,10 @@ class OauthUserCheckAPI(Resource):
     def post(self):
         user_info = request.get_json()
         user_id = hashlib.sha256(str(user_info['name'] + user_info['phone_number']).encode('utf-8')).hexdigest()
+        access_token = refresh_token = None
 
         try:
-            database = Database()
+            database = get_database()
             sql = "SELECT id, part_index FROM users WHERE id = %s;"
             values = (user_id,)
             user = database.execute_one(sql, values)
@@ -176,12 +174,9 @@ class OauthUserCheckAPI(Resource):
 
                 fcm.subscribe([user_info['fcm_token']], NotificationEnum.FcmTopic(user['part_index']))
                 fcm.subscribe([user_info['fcm_token']], 'global')
+
+                access_token, refresh_token = create_tokens(database, user_id)
         except Exception as e:
             return {'message': '서버에 오류가 발생했어요 :(\n지속적으로 발생하면 문의주세요!', 'error': str(e)}, 400
-        finally:
-            database.close()
-
-        access_token = create_access_token(identity=user_id) if user else None
-        refresh_token = create_refresh_token(identity=user_id) if user else None
 
         return {'is_member': user is not None, 'access_token': access_token, 'refresh_token': refresh_token}, 200
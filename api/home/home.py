@@ -1,10 +1,12 @@
 from flask import Flask, request
 from flask_restx import Resource, Namespace
 from flask_jwt_extended import jwt_required, get_jwt_identity
-from database.database import Database
+from database.database import get_database
 from utils.dto import HomeDTO
 from datetime import datetime, timedelta
 from utils.api_access_level_tool import api_access_level
+from utils.single_flight_tool import single_flight
+from utils.etag_tool import conditional_get, time_bucket, EXTERNAL_MAX_AGE
 
 home = HomeDTO.api
 
@@ -16,24 +18,18 @@ class HomeAttendanceAPI(Resource):
     @api_access_level(1)
     def get(self):
         try:
-            database = Database()
+            database = get_database()
 
             sql = "SELECT * FROM schedules WHERE title LIKE %s AND start_date >= CURDATE() ORDER BY start_date;"
             values = ("%회의%",)
             meeting_list = database.execute_all(sql, values)
         except Exception as e:
             return {'message': '서버에 오류가 발생했어요 :(\n지속적으로 발생하면 문의주세요!', 'error': str(e)}, 400
-        finally:
-            database.close()
 
         if not meeting_list:
             return [], 200
         else:
-            for meeting in meeting_list:
-                meeting['start_date'] = meeting['start_date'].strftime('%Y-%m-%d')
-                meeting['start_time'] = (datetime.min + meeting['start_time']).strftime('%H:%M')
-
-            return meeting_list, 200
+            return HomeDTO.serialize_schedule.many(meeting_list), 200
 
 @home.route('/schedule')
 @home.response(200, 'Success', HomeDTO.model_schedule_info)
@@ -41,16 +37,16 @@ class HomeAttendanceAPI(Resource):
 class HomeScheduleAPI(Resource):
     @home.doc(security='apiKey')
     @api_access_level(1)
+    @conditional_get(('schedules',), vary=lambda: datetime.today().date(), max_age=EXTERNAL_MAX_AGE)  # upcoming_list가 날짜에 따라 바뀜, 일정은 app 밖에서 수정됨
+    @single_flight(('schedules',), key=lambda: (datetime.today().date(), time_bucket()), ttl=EXTERNAL_MAX_AGE, stale=0)
     def get(self):
         try:
-            database = Database()
+            database = get_database()
 
             sql = "SELECT * FROM schedules ORDER BY start_date;"
             schedule_list = database.execute_all(sql)
         except Exception as e:
             return {'message': '서버에 오류가 발생했어요 :(\n지속적으로 발생하면 문의주세요!', 'error': str(e)}, 400
-        finally:
-            database.close()
 
         if not schedule_list:
             return {'all_list': schedule_list, 'upcoming_list': []}, 200
@@ -58,14 +54,9 @@ class HomeScheduleAPI(Resource):
             upcoming_list = []
             today = datetime.today().date()
             limit_day = today + timedelta(days=7)
-            for idx, schedule in enumerate(schedule_list):
-                if schedule['start_date'] >= today and schedule['start_date'] <= limit_day:
-                    upcoming_list.append(schedule)
-                schedule_list[idx]['start_date'] = schedule['start_date'].strftime('%Y-%m-%d')
-                if schedule['end_date']:
-                    schedule_list[idx]['end_date'] = schedule['end_date'].strftime('%Y-%m-%d')
-                if schedule['start_time']:
-                    schedule_list[idx]['start_time'] = (datetime.min + schedule['start_time']).strftime('%H:%M')
+            upcoming_list = [schedule for schedule in schedule_list
+                                   if today <= schedule['start_date'] <= limit_day]
+            schedule_list = HomeDTO.serialize_schedule.many(schedule_list)
 
         return {'all_list': schedule_list, 'upcoming_list': upcoming_list}, 200
 
@@ -80,7 +71,7 @@ class HomeProductAPI(Resource):
         user_id = get_jwt_identity()
 
         try:
-            database = Database()
+            database = get_database()
 
             sql = """
                 SELECT p.category, rl.rent_day, datediff(rl.deadline, now()) as d_day
@@ -93,13 +84,8 @@ class HomeProductAPI(Resource):
             rent_product_list = database.execute_all(sql, values)
         except Exception as e:
             return {'message': '서버에 오류가 발생했어요 :(\n지속적으로 발생하면 문의주세요!', 'error': str(e)}, 400
-        finally:
-            database.close()
 
         if not rent_product_list:
             return [], 200
         else:
-            for idx, rent_product in enumerate(rent_product_list):
-                rent_product_list[idx]['rent_day'] = rent_product['rent_day'].strftime('%Y-%m-%d')
-
-            return rent_product_list, 200
+            return HomeDTO.serialize_rent_product.many(rent_product_list), 200
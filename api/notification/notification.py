@@ -1,9 +1,10 @@
 from flask import Flask, request
 from flask_restx import Resource, Namespace
-from database.database import Database
+from database.database import get_database
 from utils.dto import NotificationDTO
 from flask_jwt_extended import jwt_required, get_jwt_identity
 from utils.api_access_level_tool import api_access_level
+from utils.single_flight_tool import single_flight
 
 notification = NotificationDTO.api
 
@@ -15,12 +16,13 @@ class NotificationAPI(Resource):
     @notification.response(400, 'Bad Request', NotificationDTO.response_notification_message)
     @notification.doc(security='apiKey')
     @api_access_level(1)
+    @single_flight(('notification', 'notification_member'), key=get_jwt_identity)  # 회원별 응답
     def get(self):
         user_id = get_jwt_identity()
 
         # DB 예외처리
         try:
-            database = Database()
+            database = get_database()
             sql = """
                 SELECT n.id, n.date, n.day, n.time, n.location, n.schedule, n.message, nm.is_read 
                 FROM notification AS n 
@@ -32,16 +34,8 @@ class NotificationAPI(Resource):
             notifications = database.execute_all(sql, values)
         except Exception as e:
             return {'message': '서버에 오류가 발생했어요 :(\n지속적으로 발생하면 문의주세요!', 'error': str(e)}, 400
-        finally:
-            database.close()
 
-        for idx, notification in enumerate(notifications):
-            notifications[idx]['date'] = notification['date'].strftime('%Y-%m-%d')
-            notifications[idx]['schedule'] = notification['schedule'].strftime('%Y-%m-%dT%H:%M:%S')
-            notifications[idx]['time'] = str(notification['time'])
-            notifications[idx]['is_read'] = bool(notification['is_read'])
-
-        return notifications, 200
+        return NotificationDTO.serialize_user_notification.many(notifications), 200
     
     # 회원 알림 정보 수정
     @notification.expect(NotificationDTO.model_notification_status, validate=True)
@@ -54,15 +48,13 @@ class NotificationAPI(Resource):
         
         # DB 예외처리
         try:
-            database = Database()
+            database = get_database()
             sql = "UPDATE notification_member SET is_read = %s WHERE notification_id = %s;"
             values = (int(notification_status['is_read']), notification_status['id'])
             database.execute(sql, values)
             database.commit()
         except Exception as e:
             return {'message': '서버에 오류가 발생했어요 :(\n지속적으로 발생하면 문의주세요!', 'error': str(e)}, 400
-        finally:
-            database.close()
 
         return {'message': '회원 알림 상태 정보를 수정했어요 :)'}, 200
     
@@ -77,14 +69,12 @@ class NotificationAPI(Resource):
 
         # DB 예외처리
         try:
-            database = Database()
+            database = get_database()
             sql = "DELETE FROM notification_member WHERE notification_id = %s;"
             values = (notification_id,)
             database.execute(sql, values)
             database.commit()
         except Exception as e:
             return {'message': '서버에 오류가 발생했어요 :(\n지속적으로 발생하면 문의주세요!', 'error': str(e)}, 400
-        finally:
-            database.close()
 
         return {'message': '회원 알림 상태 정보를 삭제했어요 :)'}, 200
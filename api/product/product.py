@@ -1,11 +1,13 @@
-from flask_restx import Resource, Namespace
+from flask_restx import Resource
 from flask_jwt_extended import jwt_required, get_jwt_identity
-from database.database import Database
+from database.database import get_database
 from datetime import datetime, timedelta
 from utils.aes_cipher import AESCipher
 from utils.api_access_level_tool import api_access_level
+from utils.dto import ProductDTO
+from utils.etag_tool import conditional_get
 
-product = Namespace('product')
+product = ProductDTO.api
 crypt = AESCipher()
 
 @product.route("/<string:product_code>")
@@ -15,7 +17,7 @@ class Product(Resource):
     @api_access_level(1)
     @product.doc(security='apiKey')
     def get(self, product_code):
-        database = Database()
+        database = get_database()
         sql = "SELECT * FROM products WHERE code = %s;"
         values = (product_code,)
         product = database.execute_one(sql, values)
@@ -36,8 +38,6 @@ class Product(Resource):
             rent_user = database.execute_one(sql, values)
             product['status']['rent_user'] = crypt.decrypt(rent_user['name'])
         
-        database.close()
-        
         return product, 200
 
 @product.route("/list")
@@ -46,14 +46,15 @@ class Product(Resource):
 class ProductList(Resource):
     @jwt_required()
     @product.doc(security='apiKey')
+    @conditional_get(('products', 'rent_list', 'users'))
     def get(self):        
-        database = Database()
+        database = get_database()
         sql = "SELECT * FROM products;"
-        product_list = database.execute_all(sql)
-        
+        product_list = database.execute_rows(sql, tables=('products',))
+
+        # Row는 응답 직전에 dict로 변환
+        product_list = ProductDTO.serialize_product.many(product_list)
         for idx, product in enumerate(product_list):
-            product_list[idx]['status'] = { 'value': product['status'], 'rent_user': None }
-            
             sql = "SELECT * FROM rent_list WHERE product_code = %s and return_day IS NULL;"
             values = (product['code'],)
             rent_log = database.execute_one(sql, values)
@@ -64,8 +65,6 @@ class ProductList(Resource):
                 rent_user = database.execute_one(sql, values)
                 product_list[idx]['status']['rent_user'] = crypt.decrypt(rent_user['name'])
         
-        database.close()
-        
         if not product_list:
             message = { 'message': '물품이 존재하지 않아요 :(' }
             return message, 400
@@ -79,7 +78,7 @@ class SpecificProductList(Resource):
     @jwt_required()
     @product.doc(security='apiKey')
     def get(self, product_name):
-        database = Database()
+        database = get_database()
         sql = "SELECT * FROM products WHERE name LIKE %s;"
         values = (f"%{product_name}%",)
         product_list = database.execute_all(sql, values)
@@ -96,8 +95,6 @@ class SpecificProductList(Resource):
                 values = (rent_log['user_id'],)
                 rent_user = database.execute_one(sql, values)
                 product_list[idx]['status']['rent_user'] = crypt.decrypt(rent_user['name'])
-                
-        database.close()
         
         if not product_list:
             message = { 'message': '해당 물품이 존재하지 않아요 :(' }
@@ -112,28 +109,29 @@ class RentProduct(Resource):
     @jwt_required()
     def post(self, product_code):
         user_id = get_jwt_identity()
-        database = Database()
+        database = get_database()
         sql = "SELECT * FROM products WHERE code = %s;"
         values = (product_code,)
         product = database.execute_one(sql, values)
         
         if product and product['is_available']: # 물품 대여에 대한 로직
-            # 물품 정보를 대여중인 상태로 업데이트
             status = "대여중"
-            sql = "UPDATE products SET is_available = %s, status = %s WHERE code = %s;"
-            values = (0, status, product_code)
-            database.execute(sql, values)
-            database.commit()
-
-            # 물품 대여 내역 추가
             now = datetime.now()
             rent_day = now.date()
             deadline = rent_day + timedelta(days=30)
-            sql = "INSERT INTO rent_list(product_code, user_id, deadline, rent_day, return_day) "\
-                "VALUES(%s, %s, %s, %s, NULL);"
-            values = (product_code, user_id, deadline, rent_day)
-            database.execute(sql, values)
-            database.commit()
+
+            # 물품 상태 변경과 대여 내역 추가를 하나의 트랜잭션으로 처리
+            with database.transaction():
+                # 물품 정보를 대여중인 상태로 업데이트
+                sql = "UPDATE products SET is_available = %s, status = %s WHERE code = %s;"
+                values = (0, status, product_code)
+                database.execute(sql, values)
+
+                # 물품 대여 내역 추가
+                sql = "INSERT INTO rent_list(product_code, user_id, deadline, rent_day, return_day) "\
+                    "VALUES(%s, %s, %s, %s, NULL);"
+                values = (product_code, user_id, deadline, rent_day)
+                database.execute(sql, values)
 
             # 물품 정보가 변경 되었으므로 물품 상세 정보 재조회
             sql = "SELECT * FROM products WHERE code = %s;"
@@ -160,10 +158,8 @@ class RentProduct(Resource):
             rent_data['d_day'] = d_day
             rent_data['return_day'] = None
 
-            database.close()
             return rent_data, 200
         else:
-            database.close()
             message = {}
             if not product:
                 message['message'] = '등록되지 않은 물품이에요 :('
@@ -184,7 +180,7 @@ class ReturnProduct(Resource):
     @product.doc(security='apiKey')
     def put(self, product_code):
         user_id = get_jwt_identity()
-        database = Database()
+        database = get_database()
         sql = "SELECT * FROM products WHERE code = %s;"
         values = (product_code,)
         product = database.execute_one(sql, values)
@@ -200,21 +196,22 @@ class ReturnProduct(Resource):
                 if not rent_data:
                     return { 'message': '데이터가 올바르지 않아요 :(\n지속적으로 발생 시 문의해주세요!' }, 500
                 
-                # 물품 대여 내역에 반납일자 반영
                 now = datetime.now()
                 return_day = now.date()
                 status = "대여 가능"
-                sql = "UPDATE rent_list SET return_day = %s "\
-                    "WHERE product_code = %s and user_id = %s and return_day IS NULL;"
-                values = (return_day, product_code, user_id)
-                database.execute(sql, values)
-                database.commit()
 
-                # 물품 정보 수정
-                sql = "UPDATE products SET is_available = %s, status = %s WHERE code = %s;"
-                values = (1, status, product_code)
-                database.execute(sql, values)
-                database.commit()
+                # 반납일자 반영과 물품 상태 변경을 하나의 트랜잭션으로 처리
+                with database.transaction():
+                    # 물품 대여 내역에 반납일자 반영
+                    sql = "UPDATE rent_list SET return_day = %s "\
+                        "WHERE product_code = %s and user_id = %s and return_day IS NULL;"
+                    values = (return_day, product_code, user_id)
+                    database.execute(sql, values)
+
+                    # 물품 정보 수정
+                    sql = "UPDATE products SET is_available = %s, status = %s WHERE code = %s;"
+                    values = (1, status, product_code)
+                    database.execute(sql, values)
 
                 # 물품 정보가 변경 되었으므로 물품 상세 정보 재조회
                 sql = "SELECT * FROM products WHERE code = %s;"
@@ -233,13 +230,9 @@ class ReturnProduct(Resource):
                 return_data['d_day'] = None
                 return_data['return_day'] = return_day.strftime('%Y-%m-%d')
 
-                database.close()
-
                 return return_data, 200    
             else:
-                database.close()
                 return { 'message': '반납을 할 수 없는 물품이에요 :(' }, 400
         else:
             # 대여 가능한 경우
-            database.close()
             return { 'message': '대여 중인 물품만 반납할 수 있어요 :(' }, 400
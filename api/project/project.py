@@ -1,11 +1,12 @@
 from flask import Flask, request
 from flask_restx import Resource, Namespace
-from database.database import Database
+from database.database import get_database
 from utils.aes_cipher import AESCipher
 from utils.dto import ProjectDTO
 from flask_jwt_extended import jwt_required, get_jwt_identity
-from utils.enum_tool import ProjectEnum
 from utils.api_access_level_tool import api_access_level
+from utils.single_flight_tool import single_flight
+from utils.etag_tool import conditional_get, time_bucket, EXTERNAL_MAX_AGE
 
 project = ProjectDTO.api
 crypt = AESCipher()
@@ -23,7 +24,7 @@ class ProjectListAPI(Resource):
         # DB 예외 처리
         try:
             # DB에서 user_id값에 맞는 프로젝트 목록 불러오기
-            database = Database()
+            database = get_database()
             sql = """
                 SELECT p.* 
                 FROM projects p 
@@ -32,35 +33,17 @@ class ProjectListAPI(Resource):
                 ORDER BY p.start_date DESC;
             """
             values = (user_id,)
-            project_list = database.execute_all(sql, values)
+            project_list = database.execute_rows(sql, values)
         except Exception as e:
             return {'message': '서버에 오류가 발생했어요 :(\n지속적으로 발생하면 문의주세요!', 'error': str(e)}, 400
-        finally:
-            database.close()
 
         if not project_list: # 프로젝트를 한 적이 없을 때 처리
             return [], 200
         else:
+            # Row는 응답 직전에 dict로 변환 (index, date, platform을 응답 형태로 변환)
+            project_list = ProjectDTO.serialize_project.many(project_list)
             for idx, project in enumerate(project_list):
-                # index를 문자열로 변환
-                project_list[idx]['type'] = ProjectEnum.Type(project['type'])
-                project_list[idx]['status'] = ProjectEnum.Status(project['status'])
-
-                # date를 문자열로 변환
-                if project['start_date']:
-                    project_list[idx]['start_date'] = project['start_date'].strftime('%Y-%m-%d')
-                if project['end_date']:
-                    project_list[idx]['end_date'] = project['end_date'].strftime('%Y-%m-%d')
-
-                # platform을 리스트로 변환
-                project_list[idx]['platform'] = project['platform'].split(',') if project['platform'] else []
-
-                # index를 Boolean 값으로 변경
-                project_list[idx]['is_finding_member'] = bool(project['is_finding_member'])
-                project_list[idx]['is_able_inquiry'] = bool(project['is_able_inquiry'])
-
                 try:
-                    database = Database()
                     sql = """
                         SELECT u.is_signed, u.name, u.level, u.part_index, u.profile_image, pm.is_pm
                         FROM project_members AS pm
@@ -71,13 +54,12 @@ class ProjectListAPI(Resource):
                     members = database.execute_all(sql, values)
                 except Exception as e:
                     return {'message': '서버에 오류가 발생했어요 :(\n지속적으로 발생하면 문의주세요!', 'error': str(e)}, 400
-                finally:
-                    database.close()
 
                 pm_idx = None
+                names = crypt.decrypt_many(member['name'] for member in members)
+                members = ProjectDTO.serialize_member.many(members)
                 for i, member in enumerate(members):
-                    member['name'] = crypt.decrypt(member['name'])
-                    member['is_signed'] = bool(member['is_signed'])
+                    member['name'] = names[i]
                     is_pm = member.pop('is_pm')
                     if is_pm:
                         pm_idx = i
@@ -93,41 +75,25 @@ class ProjectAllListAPI(Resource):
     @project.response(400, 'Bad Request', ProjectDTO.response_message)
     @project.doc(security='apiKey')
     @api_access_level(0)
+    @conditional_get(('projects', 'project_members', 'users'), max_age=EXTERNAL_MAX_AGE)  # 프로젝트는 app 밖에서 수정됨
+    @single_flight(('projects', 'project_members', 'users'), key=time_bucket, ttl=EXTERNAL_MAX_AGE, stale=0)
     def get(self):
         # DB 예외 처리
         try:
             # 전체 프로젝트 목록 불러오기
-            database = Database()
+            database = get_database()
             sql = "SELECT * FROM projects ORDER BY start_date DESC;"
-            project_list = database.execute_all(sql)
+            project_list = database.execute_rows(sql)
         except Exception as e:
             return {'message': '서버에 오류가 발생했어요 :(\n지속적으로 발생하면 문의주세요!', 'error': str(e)}, 400
-        finally:
-            database.close()
 
         if not project_list: # 프로젝트를 한 적이 없을 때 처리
             return [], 200
         else:
+            # Row는 응답 직전에 dict로 변환 (index, date, platform을 응답 형태로 변환)
+            project_list = ProjectDTO.serialize_project.many(project_list)
             for idx, project in enumerate(project_list):
-                # index를 문자열로 변환
-                project_list[idx]['type'] = ProjectEnum.Type(project['type'])
-                project_list[idx]['status'] = ProjectEnum.Status(project['status'])
-
-                # date를 문자열로 변환
-                if project['start_date']:
-                    project_list[idx]['start_date'] = project['start_date'].strftime('%Y-%m-%d')
-                if project['end_date']:
-                    project_list[idx]['end_date'] = project['end_date'].strftime('%Y-%m-%d')
-
-                # platform을 리스트로 변환
-                project_list[idx]['platform'] = project['platform'].split(',') if project['platform'] else []
-
-                # index를 Boolean 값으로 변경
-                project_list[idx]['is_finding_member'] = bool(project['is_finding_member'])
-                project_list[idx]['is_able_inquiry'] = bool(project['is_able_inquiry'])
-
                 try:
-                    database = Database()
                     sql = """
                         SELECT u.is_signed, u.name, u.level, u.part_index, u.profile_image, pm.is_pm
                         FROM project_members AS pm
@@ -138,13 +104,12 @@ class ProjectAllListAPI(Resource):
                     members = database.execute_all(sql, values)
                 except Exception as e:
                     return {'message': '서버에 오류가 발생했어요 :(\n지속적으로 발생하면 문의주세요!', 'error': str(e)}, 400
-                finally:
-                    database.close()
 
                 pm_idx = None
+                names = crypt.decrypt_many(member['name'] for member in members)
+                members = ProjectDTO.serialize_member.many(members)
                 for i, member in enumerate(members):
-                    member['name'] = crypt.decrypt(member['name'])
-                    member['is_signed'] = bool(member['is_signed'])
+                    member['name'] = names[i]
                     is_pm = member.pop('is_pm')
                     if is_pm:
                         pm_idx = i
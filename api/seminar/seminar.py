@@ -1,6 +1,6 @@
 from flask import Flask, request
 from flask_restx import Resource, Namespace
-from database.database import Database
+from database.database import get_database
 from utils.dto import SeminarDTO
 from flask_jwt_extended import jwt_required, get_jwt_identity
 from utils.enum_tool import SeminarEnum
@@ -22,23 +22,18 @@ class SeminarUserAPI(Resource):
         # DB 예외 처리
         try:
             # DB에서 user_id값에 맞는 세미나 목록 불러오기
-            database = Database()
+            database = get_database()
             sql = "SELECT * FROM seminars WHERE user_id = %s;"
             values = (user_id,)
-            seminar_list = database.execute_all(sql, values)
+            seminar_list = database.execute_all(sql, values, tables=('seminars',))
         except Exception as e:
             return {'message': '서버에 오류가 발생했어요 :(\n지속적으로 발생하면 문의주세요!', 'error': str(e)}, 400
-        finally:
-            database.close()
 
         if not seminar_list: # 세미나를 한 적이 없을 때 처리
             return [], 200
         else:
-            for idx, seminar in enumerate(seminar_list):
-                # date 및 category를 문자열로 변경
-                seminar_list[idx]['date'] = seminar['date'].strftime('%Y-%m-%d')
-                seminar_list[idx]['category'] = SeminarEnum.Category(seminar['category'])
-            return seminar_list, 200
+            # date 및 category를 문자열로 변경
+            return SeminarDTO.serialize_seminar.many(seminar_list), 200
         
     # 세미나 정보 추가
     @seminar.expect(SeminarDTO.query_user_id, SeminarDTO.model_seminar, validate=True)
@@ -58,15 +53,13 @@ class SeminarUserAPI(Resource):
         # DB 예외 처리
         try:
             # 세미나 정보를 DB에 추가
-            database = Database()
+            database = get_database()
             sql = "INSERT INTO seminars (user_id, title, url, category, date) VALUES (%s, %s, %s, %s, %s);"
             values = (user_id, seminar['title'], seminar['url'], seminar['category'], seminar['date'])
             database.execute(sql, values)
             database.commit()
         except Exception as e:
             return {'message': '서버에 오류가 발생했어요 :(\n지속적으로 발생하면 문의주세요!', 'error': str(e)}, 400
-        finally:
-            database.close()
 
         return {'message': '세미나 정보를 추가했어요 :)'}, 201
 
@@ -88,15 +81,13 @@ class SeminarUserAPI(Resource):
         # DB 예외 처리
         try:
             # 수정된 사항을 DB에 반영
-            database = Database()
+            database = get_database()
             sql = "UPDATE seminars SET user_id = %s, title = %s, url = %s, category = %s, date = %s WHERE id = %s;"
             values = (user_id, seminar['title'], seminar['url'], seminar['category'], seminar['date'], seminar['id'])
             database.execute(sql, values)
             database.commit()
         except Exception as e:
             return {'message': '서버에 오류가 발생했어요 :(\n지속적으로 발생하면 문의주세요!', 'error': str(e)}, 400
-        finally:
-            database.close()
 
         return {'message': '세미나 정보를 수정했어요 :)'}, 200
 
@@ -112,14 +103,12 @@ class SeminarUserAPI(Resource):
         # DB 예외 처리
         try:
             # 세미나 정보를 DB에서 삭제
-            database = Database()
+            database = get_database()
             sql = "DELETE FROM seminars WHERE id = %s;"
             values = (seminar_id,)
             database.execute(sql, values)
             database.commit()
         except Exception as e:
             return {'message': '서버에 오류가 발생했어요 :(\n지속적으로 발생하면 문의주세요!', 'error': str(e)}, 400
-        finally:
-            database.close()
 
         return {'message': '세미나 정보를 삭제했어요 :)'}, 200
@@ -1,6 +1,6 @@
 from flask import Flask, request
 from flask_restx import Resource, Namespace
-from database.database import Database
+from database.database import get_database
 from utils.dto import WarningDTO
 from flask_jwt_extended import jwt_required, get_jwt_identity
 from utils.enum_tool import WarningEnum
@@ -20,14 +20,12 @@ class WarningUserAPI(Resource):
         # DB 예외 처리
         try:
             # DB에서 user_id값에 맞는 경고 목록 불러오기
-            database = Database()
+            database = get_database()
             sql = "SELECT id, category, date, description, comment FROM warnings WHERE user_id = %s ORDER BY date;"
             values = (user_id,)
             warning_list = database.execute_all(sql, values)
         except Exception as e:
             return {'message': '서버에 오류가 발생했어요 :(\n지속적으로 발생하면 문의주세요!', 'error': str(e)}, 400
-        finally:
-            database.close()
 
         if not warning_list:  # 경고를 받은 적이 없을 때 처리
             return {
@@ -42,9 +40,6 @@ class WarningUserAPI(Resource):
             total_warning = total_add_warning = total_remove_warning = 0
             add_list, remove_list = [], []
             for idx, warning in enumerate(warning_list):
-                # date를 문자열로 변환
-                warning_list[idx]['date'] = warning['date'].strftime('%Y-%m-%d')
-                
                 # 누적 경고 횟수 계산
                 if warning['category'] == 0:
                     total_warning = 0
@@ -65,8 +60,8 @@ class WarningUserAPI(Resource):
                 # 실제 경고 점수 계산
                 warning_list[idx]['value'] = warning['category'] / 2.0
 
-                # category를 문자열로 변경
-                warning_list[idx]['category'] = WarningEnum.Category(warning['category'])
+                # date, category를 문자열로 변경
+                warning_list[idx] = WarningDTO.serialize_warning(warning)
             return {
                 'warning_add_list': add_list,
                 'warning_remove_list': remove_list,
@@ -11,15 +11,21 @@ from api.accounting.accounting import accounting
 from api.home.home import home
 from api.attendance.attendance import attendance
 from api.notification.notification import notification
-from api.admin.admin import admin
+from api.admin.admin import admin, api as admin_api
+from database.database import Database, close_database, handle_pool_exhausted
 from flask_jwt_extended import JWTManager
 from utils import fcm
-import memcache
-import configparser
+from utils.json_tool import output_json
+from utils import swagger_tool
+from utils import jwt_blocklist_tool, memcache_tool
+from utils.config_tool import get_config
 import datetime
+import logging
+import os
+import threading
 
-config = configparser.ConfigParser()
-config.read_file(open('config/config.ini'))
+config = get_config()
+logger = logging.getLogger(__name__)
 
 app = Flask(__name__)
 authorizations = {
@@ -29,7 +35,9 @@ authorizations = {
         'name': 'Authorization'
     }
 }
-api = Api(app, authorizations=authorizations)
+api = Api(app, authorizations=authorizations, **swagger_tool.API_OPTIONS)
+# 응답 JSON 직렬화에 orjson 사용
+api.representations['application/json'] = output_json
 
 jwt = JWTManager(app)
 
@@ -39,7 +47,8 @@ app.config['JWT_SECRET_KEY'] = config['JWT']['JWT_SECRET_KEY']
 app.config['JWT_ACCESS_TOKEN_EXPIRES'] = datetime.timedelta(minutes=int(config['JWT']['JWT_ACCESS_TOKEN_EXPIRES']))
 app.config['JWT_REFRESH_TOKEN_EXPIRES'] = datetime.timedelta(days=int(config['JWT']['JWT_REFRESH_TOKEN_EXPIRES']))
 
-mc = memcache.Client([config['memcached']['sockaddr']])
+# 요청 스레드별로 커넥션을 대여하는 memcache 클라이언트
+mc = memcache_tool.get_client()
 
 app.config['SESSION_TYPE'] = config['session']['session_type']
 app.config['SESSION_PERMANENT'] = bool(config['session']['session_permanent'])
@@ -48,11 +57,11 @@ app.config['SESSION_MEMCACHED'] = mc
 
 app.permanent_session_lifetime = datetime.timedelta(minutes=int(config['session']['session_lifetime']) + 100)
 
+# 로그아웃된 토큰과 토큰 세대가 갱신되기 전에 발급된 access token 차단
+# 워커 내부 필터로 확인하고, 필터에 걸린 경우에만 memcache를 조회한다.
 @jwt.token_in_blocklist_loader
 def check_if_token_is_revoked(jwt_header, jwt_payload):
-    jti = jwt_payload["jti"]
-    token = mc.get(jti)
-    return token is not None
+    return jwt_blocklist_tool.is_revoked(mc, jwt_payload)
 
 app.extensions['jwt_manager'] = jwt
 app.extensions['memcache_client'] = mc
@@ -81,6 +90,12 @@ def before_request():
     # 서버를 이용할 수 없는 경우
     if not available:
         return {'message': "서버 점검 중이에요. :("}, 503
+
+# 커넥션 풀 포화 시 503 응답
+app.after_request(handle_pool_exhausted)
+
+# request 종료 시 DB 세션 반납
+app.teardown_request(close_database)
     
 api.add_namespace(auth, '/auth')
 api.add_namespace(oauth, '/oauth')
@@ -96,7 +111,41 @@ api.add_namespace(notification, '/notification')
 
 app.register_blueprint(admin)
 
-fcm.load_messages()
+# swagger.json은 요청마다 생성하지 않고 시작 시 생성한 파일로 응답
+swagger_tool.install(app, [(api, 'swagger'), (admin_api, 'admin-swagger')])
+
+# 커넥션 풀 미리 채우기 (실패한 경우 /ready에서 다시 시도)
+def warm_up():
+    try:
+        Database.warm_up()
+        app.extensions['ready_pid'] = os.getpid()
+    except Exception:
+        logger.exception('커넥션 풀 warm-up 중 오류가 발생했어요 :(')
+    return app.extensions.get('ready_pid') == os.getpid()
+
+# 워커 프로세스 시작 작업 (프로세스당 한 번, 각 워커의 첫 request에서 실행)
+# import 시점(preload 후 fork 전)에 실행하면 부모 프로세스의 커넥션이 워커에 복제되므로 fork 이후에 실행한다.
+_startup_lock = threading.Lock()
+
+@app.before_request
+def start_worker():
+    if app.extensions.get('worker_pid') == os.getpid():
+        return
+    with _startup_lock:
+        if app.extensions.get('worker_pid') == os.getpid():
+            return
+        app.extensions['worker_pid'] = os.getpid()
+        warm_up()
+
+        # DB에 저장된 알림을 워커의 스케줄러에 등록 (스케줄러 스레드는 fork 후 복제되지 않으므로 워커 안에서 시작)
+        fcm.load_messages()
+
+# readiness 확인 (warm-up 완료 전에는 503, 실패했던 경우 다시 시도)
+@app.route('/ready')
+def ready():
+    if app.extensions.get('ready_pid') != os.getpid() and not warm_up():
+        return {'message': '서버를 준비 중이에요 :('}, 503
+    return {'message': '서버가 준비되었어요 :)'}, 200
 
 if __name__ == "__main__":
     app.run(debug=True, host='0.0.0.0', port=5000)
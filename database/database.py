@@ -1,10 +1,16 @@
+import os
+import time
+import threading
 import pymysql
-import configparser
-from pymysqlpool.pool import Pool
+from utils.config_tool import get_config
+from flask import g, request, jsonify, has_request_context
+from database.pool import ConnectionPool, PoolExhaustedError
 from functools import wraps
+from contextlib import contextmanager
+from database import query_log, query_cache, index_advisor
+from database.row import RowCursor, SSRowCursor
 
-config = configparser.ConfigParser()
-config.read_file(open('config/config.ini'))
+config = get_config()
 
 db_config = {
         'host': config['database']['host'],
@@ -16,55 +22,405 @@ db_config = {
     'cursorclass': pymysql.cursors.DictCursor,
 }
 
+# 읽기 전용 replica 설정 ([database_replica] 섹션이 있을 때만 사용, 생략된 값은 primary 설정을 따른다.)
+replica_db_config = None
+if config.has_section('database_replica'):
+    replica_section = config['database_replica']
+    replica_db_config = {
+        'host': replica_section.get('host', config['database']['host']),
+        'user': replica_section.get('user', config['database']['user']),
+        'password': replica_section.get('password', config['database']['password']),
+        'db': replica_section.get('db', config['database']['db']),
+        'port': int(replica_section.get('port', config['database']['port'])),
+        'charset': replica_section.get('charset', config['database']['charset']),
+        'cursorclass': pymysql.cursors.DictCursor,
+    }
+
+# 커넥션 풀 설정 (최소/최대 커넥션 수, 대기 제한 시간(초), 최대 대기 request 수)
+POOL_MIN_SIZE = config['database'].getint('pool_min_size', fallback=1)
+POOL_MAX_SIZE = config['database'].getint('pool_max_size', fallback=10)
+POOL_TIMEOUT = config['database'].getfloat('pool_timeout', fallback=5.0)
+POOL_MAX_WAITERS = config['database'].getint('pool_max_waiters', fallback=POOL_MAX_SIZE * 2)
+
+# 서버 시작 시 미리 열어둘 커넥션 수
+POOL_WARM_UP_SIZE = config['database'].getint('pool_warm_up_size', fallback=POOL_MIN_SIZE)
+
+# 커넥션 검증(ping) 없이 재사용 가능한 유휴 시간 (초)
+VALIDATION_INTERVAL = config['database'].getint('validation_interval', fallback=30)
+
+# 다중 행 쿼리 1개의 최대 크기 (byte, MySQL max_allowed_packet 보다 작아야 한다.)
+MAX_PACKET_SIZE = config['database'].getint('max_packet_size', fallback=1024 * 1024)
+
+# 커넥션이 끊어졌을 때 발생하는 MySQL 클라이언트 오류 코드
+# 2006: server has gone away, 2013: lost connection, 2055: lost connection (system error)
+CONNECTION_ERROR_CODES = (2006, 2013, 2055)
+
+# 커넥션 오류 여부 확인
+def is_connection_error(error):
+    if isinstance(error, pymysql.err.InterfaceError):
+        return True
+    if isinstance(error, pymysql.err.OperationalError):
+        return bool(error.args) and error.args[0] in CONNECTION_ERROR_CODES
+    return False
+
 class Database:
     _pool = None
+    _replica_pool = None
+    _pool_pid = None    # 풀을 생성한 프로세스 (fork 된 워커는 부모의 커넥션을 공유하지 않도록 새로 생성)
+    _pool_lock = threading.Lock()
+
+    # replica=True인 경우 replica에서 읽기를 수행하다가, 첫 쓰기 쿼리 시 primary로 전환된다.
+    def __init__(self, use_pool = True, replica = False):
+        self.use_pool = use_pool
+        self.replica = replica and use_pool and replica_db_config is not None
+        self.transaction_depth = 0    # 중첩된 transaction() 블록 수
+        self.written_tables = set()   # commit 시 캐시를 무효화할 테이블
+        self._connect()
+
+    @classmethod
+    def _get_pool(cls, replica=False):
+        pool = cls._replica_pool if replica else cls._pool
+        if pool is not None and cls._pool_pid == os.getpid():
+            return pool
+
+        # 여러 스레드가 동시에 풀을 생성하지 않도록 lock 안에서 다시 확인
+        with cls._pool_lock:
+            if cls._pool_pid != os.getpid():
+                cls.dispose_pools()
+            pool = cls._replica_pool if replica else cls._pool
+            if pool is None:
+                pool = ConnectionPool(
+                    replica_db_config if replica else db_config,
+                    min_size=POOL_MIN_SIZE, max_size=POOL_MAX_SIZE,
+                    timeout=POOL_TIMEOUT, max_waiters=POOL_MAX_WAITERS
+                )
+                pool.init()
+                if replica:
+                    cls._replica_pool = pool
+                else:
+                    cls._pool = pool
+        return pool
+
+    # 풀 참조 제거 (fork 전 preload 단계에서 만든 풀은 닫지 않고 버려서 부모의 소켓에 영향을 주지 않는다.)
+    @classmethod
+    def dispose_pools(cls):
+        cls._pool = None
+        cls._replica_pool = None
+        cls._pool_pid = os.getpid()
+
+    # 커넥션 풀 warm-up (size 만큼 커넥션을 미리 열고 SELECT 1로 검증)
+    @classmethod
+    def warm_up(cls, size=POOL_WARM_UP_SIZE):
+        pools = [cls._get_pool()]
+        if replica_db_config is not None:
+            pools.append(cls._get_pool(replica=True))
 
-    def __init__(self, use_pool = True):
-        if use_pool:
-            if Database._pool is None:
-                Database._pool = Pool(**db_config)
-                Database._pool.init()
-            self.conn = Database._pool.get_conn()
+        for pool in pools:
+            conns = []
+            try:
+                for _ in range(min(size, pool.max_size)):
+                    conns.append(pool.get_conn())
+                for conn in conns:
+                    with conn.cursor() as cursor:
+                        cursor.execute("SELECT 1;")
+                    conn.last_used = time.monotonic()
+            finally:
+                for conn in conns:
+                    pool.release(conn)
+
+    # 커넥션 풀 상태 통계
+    @classmethod
+    def pool_stats(cls):
+        stats = {'primary': cls._pool.stats() if cls._pool else None}
+        if replica_db_config is not None:
+            stats['replica'] = cls._replica_pool.stats() if cls._replica_pool else None
+        return stats
+
+    def _connect(self):
+        if self.use_pool:
+            try:
+                self.conn = Database._get_pool(self.replica).get_conn()
+            except PoolExhaustedError:
+                if has_request_context():
+                    g.pool_exhausted = True
+                raise
         else:
             self.conn = pymysql.connect(**db_config)
 
-        self.use_pool = use_pool
-        self.conn.ping(reconnect=True)
-        self.conn.commit()
+        self.in_transaction = False    # commit/rollback 되지 않은 쿼리가 있는지 여부
+
+        # 유휴 시간이 길었던 커넥션만 검증 (새 커넥션 및 최근 사용된 커넥션은 생략)
+        last_used = getattr(self.conn, 'last_used', None)
+        if last_used is not None and time.monotonic() - last_used > VALIDATION_INTERVAL:
+            self.conn.ping(reconnect=True)
+        self._open_cursors()
+
+    def _open_cursors(self):
         self.cursor = self.conn.cursor()
+        self.row_cursor = self.conn.cursor(RowCursor)    # execute_rows 용 (tuple 기반 Row 반환)
+        self.last_cursor = self.cursor
+
+    # 쓰기 쿼리 전 replica 세션을 primary로 전환 (이후 읽기도 primary에서 수행하여 쓴 내용을 바로 읽을 수 있다.)
+    def _use_primary(self):
+        if self.replica:
+            self.close()
+            self.replica = False
+            self._connect()
 
-    def ping_reconnect(func):
+    # 커넥션 오류로 쿼리가 실패하면 재연결 후 한 번만 재시도 (실행 시간 및 결과 행 수 기록)
+    def retry_on_disconnect(func):
         @wraps(func)
-        def wrapper(self, *args, **kwargs):
-            self.conn.ping(reconnect=True)
-            return func(self, *args, **kwargs)
+        def wrapper(self, query, args=None):
+            start = time.perf_counter()
+            self.last_cursor = self.cursor
+            try:
+                result = func(self, query, args)
+            except (pymysql.err.OperationalError, pymysql.err.InterfaceError) as e:
+                # 트랜잭션 도중 끊어진 경우 앞선 쿼리가 유실되므로 재시도하지 않는다.
+                if not is_connection_error(e) or self.in_transaction:
+                    raise
+                self.conn.ping(reconnect=True)
+                self._open_cursors()
+                result = func(self, query, args)
+            query_log.record_query(query, args, time.perf_counter() - start, self.last_cursor.rowcount)
+            self.in_transaction = True
+            self.conn.last_used = time.monotonic()
+            self._explain(query, args)
+            return result
+        return wrapper
+
+    # tables가 주어진 읽기 쿼리는 결과를 memcache에 캐시 (해당 테이블에 쓰기가 commit 되면 무효화)
+    # 캐시를 채우는 쿼리는 primary에서 실행 (복제가 늦은 replica의 이전 결과가 새 버전 키로 저장되지 않도록)
+    def cached_query(func):
+        @wraps(func)
+        def wrapper(self, query, args=None, tables=None, ttl=query_cache.QUERY_CACHE_TTL):
+            # commit 되지 않은 쓰기가 있으면 캐시를 사용하지 않는다.
+            if not tables or self.written_tables:
+                return func(self, query, args)
+
+            key = query_cache.make_key(func.__name__, query, args, tables)
+            hit, result = query_cache.load(key)
+            if not hit:
+                self._use_primary()
+                result = func(self, query, args)
+                query_cache.store(key, result, ttl)
+            return result
         return wrapper
 
-    @ping_reconnect
+    @retry_on_disconnect
     def execute(self, query, args={}):
+        self._use_primary()
         self.cursor.execute(query, args)
-        
-    @ping_reconnect
+        self._mark_written(query)
+
+    @retry_on_disconnect
     def execute_many(self, query, args=[]):
+        self._use_primary()
         self.cursor.executemany(query, args)
+        self._mark_written(query)
+
+    # 개발 모드에서 처음 실행되는 SELECT 쿼리의 실행 계획 점검 (full scan, filesort 경고)
+    def _explain(self, query, args):
+        if not index_advisor.ENABLED:
+            return
+        try:
+            index_advisor.explain(self.conn, query, args)
+        except pymysql.err.MySQLError:
+            pass
 
-    @ping_reconnect
+    def _mark_written(self, query):
+        table = query_cache.written_table(query)
+        if table:
+            self.written_tables.add(table)
+
+    @cached_query
+    @retry_on_disconnect
     def execute_one(self, query, args={}):
         self.cursor.execute(query, args)
         row = self.cursor.fetchone()    # fetchone()은 한번 호출에 하나의 Row 만을 가져올 때 사용된다.
         return row
 
-    @ping_reconnect
+    @cached_query
+    @retry_on_disconnect
     def execute_all(self, query, args={}):
         self.cursor.execute(query, args)
         row = self.cursor.fetchall()    # fetchall() 메서드는 모든 데이터를 한꺼번에 가져올 때 사용된다.
         return row
 
+    # execute_all과 같지만 행을 dict 대신 컬럼 인덱스를 공유하는 tuple 기반 Row로 반환 (넓은 SELECT * 목록 조회용)
+    @cached_query
+    @retry_on_disconnect
+    def execute_rows(self, query, args={}):
+        self.last_cursor = self.row_cursor
+        self.row_cursor.execute(query, args)
+        return self.row_cursor.fetchall()
+
+    # 여러 행을 한 번에 INSERT (update_columns가 주어지면 키 중복 시 해당 컬럼을 UPDATE)
+    # 행은 max_packet_size를 넘지 않도록 나누어 다중 행 VALUES 쿼리로 실행하며, 변경된 행 수를 반환한다.
+    def bulk_insert(self, table, columns, rows, update_columns=None, max_packet_size=MAX_PACKET_SIZE):
+        placeholder = '(' + ', '.join(['%s'] * len(columns)) + ')'
+        prefix = f"INSERT INTO {table} ({', '.join(columns)}) VALUES "
+        suffix = ''
+        if update_columns:
+            suffix = ' ON DUPLICATE KEY UPDATE ' + ', '.join([f'{column} = VALUES({column})' for column in update_columns])
+
+        rowcount = 0
+        for chunk in self._chunk_rows(rows, len(prefix) + len(suffix), len(placeholder), max_packet_size):
+            sql = prefix + ', '.join([placeholder] * len(chunk)) + suffix + ';'
+            self.execute(sql, [value for row in chunk for value in row])
+            rowcount += self.cursor.rowcount
+        return rowcount
+
+    def bulk_upsert(self, table, columns, rows, update_columns, max_packet_size=MAX_PACKET_SIZE):
+        return self.bulk_insert(table, columns, rows, update_columns, max_packet_size)
+
+    # 여러 행을 key_columns 기준으로 한 번에 UPDATE (행은 columns 순서의 값으로 구성)
+    # 값 목록을 UNION ALL 파생 테이블로 만들어 JOIN UPDATE 하며, 변경된 행 수를 반환한다.
+    def bulk_update(self, table, columns, rows, key_columns, max_packet_size=MAX_PACKET_SIZE):
+        set_columns = [column for column in columns if column not in key_columns]
+        first_select = 'SELECT ' + ', '.join([f'%s AS {column}' for column in columns])
+        next_select = ' UNION ALL SELECT ' + ', '.join(['%s'] * len(columns))
+        prefix = f"UPDATE {table} AS t JOIN ("
+        suffix = ") AS u ON " + ' AND '.join([f't.{column} = u.{column}' for column in key_columns]) \
+            + " SET " + ', '.join([f't.{column} = u.{column}' for column in set_columns]) + ';'
+
+        rowcount = 0
+        for chunk in self._chunk_rows(rows, len(prefix) + len(suffix) + len(first_select), len(next_select), max_packet_size):
+            sql = prefix + first_select + next_select * (len(chunk) - 1) + suffix
+            self.execute(sql, [value for row in chunk for value in row])
+            rowcount += self.cursor.rowcount
+        return rowcount
+
+    # 이스케이프된 크기 기준으로 행 목록을 max_packet_size 이하의 묶음으로 나누기
+    def _chunk_rows(self, rows, base_size, row_overhead, max_packet_size):
+        chunk, chunk_size = [], base_size
+        for row in rows:
+            row = tuple(row)
+            row_size = len(self.conn.escape(row)) + row_overhead
+            if chunk and chunk_size + row_size > max_packet_size:
+                yield chunk
+                chunk, chunk_size = [], base_size
+            chunk.append(row)
+            chunk_size += row_size
+        if chunk:
+            yield chunk
+
+    # unbuffered 서버 측 커서로 결과를 한 행씩 읽어오는 iterator 반환 (rows=True면 Row로 반환)
+    # (모든 행을 읽거나 iterator를 닫기 전까지 같은 세션에서 다른 쿼리를 실행할 수 없다.)
+    def execute_stream(self, query, args=None, rows=False):
+        start = time.perf_counter()
+        cursor = self.conn.cursor(SSRowCursor if rows else pymysql.cursors.SSDictCursor)
+        try:
+            cursor.execute(query, args)
+        except Exception:
+            cursor.close()
+            raise
+        self.in_transaction = True
+        return self._iter_stream(cursor, query, args, start)
+
+    def _iter_stream(self, cursor, query, args, start):
+        rows = 0
+        try:
+            for row in cursor:
+                rows += 1
+                yield row
+        finally:
+            cursor.close()    # 남은 행은 버리고 커서 정리
+            query_log.record_query(query, args, time.perf_counter() - start, rows)
+            self.conn.last_used = time.monotonic()
+            self._explain(query, args)
+
+    # 트랜잭션 블록 (정상 종료 시 commit, 예외 발생 시 rollback 후 예외 전파)
+    # 중첩된 블록은 SAVEPOINT로 처리되어 예외 발생 시 해당 블록의 변경만 되돌린다.
+    @contextmanager
+    def transaction(self):
+        self._use_primary()
+
+        if self.transaction_depth > 0:
+            savepoint = f'savepoint_{self.transaction_depth}'
+            self.execute(f'SAVEPOINT {savepoint};')
+            self.transaction_depth += 1
+            try:
+                yield self
+            except BaseException:
+                self.execute(f'ROLLBACK TO SAVEPOINT {savepoint};')
+                raise
+            else:
+                self.execute(f'RELEASE SAVEPOINT {savepoint};')
+            finally:
+                self.transaction_depth -= 1
+            return
+
+        self.transaction_depth += 1
+        try:
+            yield self
+        except BaseException:
+            self.transaction_depth -= 1
+            self.rollback()
+            raise
+        self.transaction_depth -= 1
+        self.commit()
+
+    # transaction() 블록 안에서는 블록이 끝날 때 한 번만 commit 된다.
     def commit(self):
+        if self.transaction_depth > 0:
+            return
         self.conn.commit()
+        self.in_transaction = False
+
+        # 변경된 테이블을 읽는 캐시 무효화
+        query_cache.invalidate(self.written_tables)
+        self.written_tables.clear()
+
+    def rollback(self):
+        self.conn.rollback()
+        self.in_transaction = False
+        self.written_tables.clear()
 
+    # 반납한 커넥션은 참조를 지워 다시 반납되지 않도록 한다. (primary 전환 중 커넥션을 얻지 못한 경우 등)
     def close(self):
+        if self.conn is None:
+            return
+
+        # commit 되지 않은 트랜잭션은 반납 전에 정리 (다음 사용자가 이전 스냅샷을 보지 않도록)
+        if self.in_transaction:
+            try:
+                self.rollback()
+            except pymysql.err.MySQLError:
+                pass
+
+        conn, self.conn = self.conn, None
         if self.use_pool:
-            Database._pool.release(self.conn)
+            conn.last_used = time.monotonic()
+            Database._get_pool(self.replica).release(conn)
         else:
-            self.conn.close()
\ No newline at end of file
+            conn.close()
+
+# request 단위로 공유되는 DB 세션 얻기 (request 당 커넥션 1회 대여)
+# GET 요청은 replica에서 읽고, 쓰기가 발생하면 그 시점부터 primary를 사용한다.
+def get_database():
+    if 'database' not in g:
+        g.database = Database(replica=request.method == 'GET' and not g.get('read_primary', False))
+    return g.database
+
+# 이후 request의 읽기를 primary에서 수행 (복제가 늦은 replica의 이전 데이터를 현재 테이블 버전의 응답으로 사용하면 안 되는 경우)
+# DB 세션은 실제로 쿼리를 실행할 때 대여한다.
+def read_from_primary():
+    g.read_primary = True
+    if 'database' in g:
+        g.database._use_primary()
+
+# 커넥션 풀 포화로 DB 세션을 얻지 못한 request는 503으로 응답 (after_request에 등록)
+def handle_pool_exhausted(response):
+    if g.pop('pool_exhausted', False):
+        response = jsonify({'message': '요청이 많아 서버가 혼잡해요 :(\n잠시 후 다시 시도해주세요!'})
+        response.status_code = 503
+        response.headers['Retry-After'] = '1'
+    return response
+
+# request 종료 시 DB 세션 반납 (teardown_request에 등록)
+def close_database(exception=None):
+    database = g.pop('database', None)
+    if database is not None:
+        database.close()
+    query_log.report_request()
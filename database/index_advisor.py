@@ -0,0 +1,112 @@
+import re
+import sys
+import time
+import threading
+from utils.config_tool import get_config
+import pymysql
+from database import query_log
+
+config = get_config()
+
+# 개발 모드에서만 쿼리 실행 계획(EXPLAIN) 수집
+ENABLED = config['database'].getboolean('explain_queries', fallback=False)
+
+# 실행 계획 점검 대상 (SELECT 문만)
+SELECT_PATTERN = re.compile(r'^\s*SELECT\b', re.IGNORECASE)
+
+# 배포 전 점검할 주요 쿼리 (SQL, 예시 인자)
+HOT_QUERIES = [
+    # 홈 회의 일정, 일정 목록
+    ("SELECT * FROM schedules WHERE title LIKE %s AND start_date >= CURDATE() ORDER BY start_date;", ('%회의%',)),
+    # 물품 대여 상태, 대여 중인 물품 목록
+    ("SELECT * FROM rent_list WHERE product_code = %s and return_day IS NULL;", ('P0001',)),
+    ("SELECT * FROM rent_list WHERE product_code = %s and user_id = %s and return_day IS NULL;", ('P0001', 'user')),
+    ("SELECT p.category, rl.rent_day, datediff(rl.deadline, now()) as d_day FROM rent_list rl "
+     "JOIN products p ON rl.product_code = p.code WHERE rl.user_id = %s AND rl.return_day IS NULL ORDER BY d_day;", ('user',)),
+    # 알림 목록, 알림 대상 회원
+    ("SELECT n.id, n.date, n.day, n.time, n.location, n.schedule, n.message, nm.is_read FROM notification AS n "
+     "JOIN notification_member AS nm ON n.id = nm.notification_id AND nm.user_id = %s AND nm.is_sent = 1 "
+     "ORDER BY n.date DESC;", ('user',)),
+    ("SELECT user_id FROM notification_member WHERE notification_id = %s;", (1,)),
+    # 프로젝트 목록, 프로젝트 멤버
+    ("SELECT p.* FROM projects p JOIN project_members pm ON p.id = pm.project_id WHERE pm.user_id = %s "
+     "ORDER BY p.start_date DESC;", ('user',)),
+    ("SELECT u.is_signed, u.name, u.level, u.part_index, u.profile_image, pm.is_pm FROM project_members AS pm "
+     "JOIN users AS u ON pm.user_id = u.id WHERE pm.project_id = %s;", (1,)),
+    # 출석 기록, 출석 회원 목록
+    ("SELECT a.date, ua.state FROM user_attendance ua JOIN attendance a ON ua.attendance_id = a.id "
+     "WHERE ua.user_id = %s AND a.category = %s AND a.date <= %s ORDER BY a.date DESC LIMIT %s;", ('user', 0, '2024-03-02', 10)),
+    ("SELECT u.id, u.name, u.grade, u.part_index, u.rest_type, ua.first_auth_time, ua.second_auth_time, ua.state "
+     "FROM users u LEFT JOIN user_attendance ua ON u.id = ua.user_id WHERE ua.attendance_id = %s;", (1,)),
+    # 회비 내역, 경고 내역, 세미나 목록
+    ("SELECT date, amount, category FROM membership_fees WHERE user_id = %s AND date BETWEEN %s AND %s ORDER BY date;",
+     ('user', '2023-06-01', '2024-03-01')),
+    ("SELECT id, category, date, description, comment FROM warnings WHERE user_id = %s ORDER BY date;", ('user',)),
+    ("SELECT * FROM seminars WHERE user_id = %s;", ('user',)),
+]
+
+_lock = threading.Lock()
+_explained = {}    # SQL별 실행 계획 점검 결과
+
+# 실행 계획에서 문제가 되는 부분 찾기 (full scan, filesort, 임시 테이블)
+def find_problems(plan):
+    problems = []
+    for row in plan:
+        table = row.get('table')
+        extra = row.get('Extra') or ''
+        if row.get('type') == 'ALL':
+            problems.append(f"full scan on {table} (rows={row.get('rows')})")
+        if 'Using filesort' in extra:
+            problems.append(f'filesort on {table}')
+        if 'Using temporary' in extra:
+            problems.append(f'temporary table on {table}')
+    return problems
+
+# 쿼리 실행 계획 확인 (각 SQL은 처음 실행될 때 한 번만 점검)
+def explain(conn, query, args=None):
+    sql = query_log.normalize_sql(query)
+    if sql in _explained or not SELECT_PATTERN.match(sql):
+        return _explained.get(sql)
+
+    with conn.cursor(pymysql.cursors.DictCursor) as cursor:
+        cursor.execute('EXPLAIN ' + query, args)
+        plan = cursor.fetchall()
+
+    result = {
+        'sql': sql,
+        'plan': [dict(row) for row in plan],
+        'problems': find_problems(plan),
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S')
+    }
+    with _lock:
+        _explained[sql] = result
+
+    if result['problems']:
+        query_log.slow_query_logger.warning(f"index advisor: {', '.join(result['problems'])} sql={sql}")
+    return result
+
+# 수집된 실행 계획 목록 (problems_only=True면 문제가 있는 쿼리만)
+def get_reports(problems_only=True):
+    with _lock:
+        reports = list(_explained.values())
+    if problems_only:
+        reports = [report for report in reports if report['problems']]
+    return reports
+
+# 주요 쿼리 실행 계획 점검 (배포 전 프로젝트 루트에서 python -m database.index_advisor 로 실행)
+# full scan이 있으면 종료 코드 1, filesort 등은 경고만 출력
+if __name__ == '__main__':
+    from database.database import Database
+
+    database = Database(use_pool=False)
+    failed = False
+    for query, args in HOT_QUERIES:
+        report = explain(database.conn, query, args)
+        full_scan = any(row.get('type') == 'ALL' for row in report['plan'])
+        status = 'FAIL' if full_scan else 'WARN' if report['problems'] else 'OK'
+        failed = failed or full_scan
+        print(f"[{status}] {report['sql']}")
+        for problem in report['problems']:
+            print(f'    - {problem}')
+    database.close()
+    sys.exit(1 if failed else 0)
@@ -0,0 +1,79 @@
+import os
+import re
+import importlib.util
+import pymysql
+from database.database import Database
+
+# 버전별 마이그레이션 파일 (V001__설명.sql 형식, 버전 순서대로 한 번씩 적용)
+# SQL로 처리할 수 없는 데이터 변환은 migrate(database) 함수를 가진 V001__설명.py 파일로 작성한다.
+MIGRATION_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'migrations')
+MIGRATION_FILE_PATTERN = re.compile(r'^V(\d+)__(\w+)\.(sql|py)$')
+
+# 이미 존재하는 인덱스/컬럼 (수동으로 먼저 적용된 경우)
+# 1060: duplicate column name, 1061: duplicate key name
+ALREADY_APPLIED_ERROR_CODES = (1060, 1061)
+
+# 마이그레이션 파일 목록 [(버전, 파일 이름)]
+def get_migrations():
+    migrations = []
+    for file_name in os.listdir(MIGRATION_DIR):
+        match = MIGRATION_FILE_PATTERN.match(file_name)
+        if match:
+            migrations.append((int(match.group(1)), file_name))
+    return sorted(migrations)
+
+# Python 마이그레이션 파일의 migrate 함수 실행
+def run_python_migration(database, file_name):
+    spec = importlib.util.spec_from_file_location(file_name[:-len('.py')], os.path.join(MIGRATION_DIR, file_name))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    module.migrate(database)
+
+# 주석을 제거하고 ;로 끝나는 SQL 문 단위로 나누기
+def split_statements(script):
+    lines = [line for line in script.splitlines() if not line.strip().startswith('--')]
+    return [statement.strip() + ';' for statement in '\n'.join(lines).split(';') if statement.strip()]
+
+def migrate():
+    database = Database(use_pool=False)
+    try:
+        sql = """
+            CREATE TABLE IF NOT EXISTS schema_migrations (
+                version INT PRIMARY KEY,
+                name VARCHAR(255) NOT NULL,
+                applied_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP
+            );
+        """
+        database.execute(sql)
+        database.commit()
+
+        applied = {row['version'] for row in database.execute_all("SELECT version FROM schema_migrations;")}
+        for version, file_name in get_migrations():
+            if version in applied:
+                continue
+
+            if file_name.endswith('.py'):
+                run_python_migration(database, file_name)
+                statements = []
+            else:
+                with open(os.path.join(MIGRATION_DIR, file_name), encoding='utf-8') as file:
+                    statements = split_statements(file.read())
+
+            for statement in statements:
+                try:
+                    database.execute(statement)
+                except pymysql.err.OperationalError as e:
+                    if e.args[0] not in ALREADY_APPLIED_ERROR_CODES:
+                        raise
+                    print(f'  skip ({e.args[1]})')
+
+            sql = "INSERT INTO schema_migrations (version, name) VALUES (%s, %s);"
+            database.execute(sql, (version, file_name))
+            database.commit()
+            print(f'applied {file_name}')
+    finally:
+        database.close()
+
+# 프로젝트 루트에서 python -m database.migrate 로 실행
+if __name__ == '__main__':
+    migrate()
@@ -0,0 +1,38 @@
+-- 주요 조회 쿼리용 인덱스 (python -m database.index_advisor 점검 결과 full scan 이었던 쿼리)
+
+-- 홈 회의 일정 (start_date >= CURDATE() ORDER BY start_date, title LIKE '%회의%'는 인덱스를 사용할 수 없어 범위 조회 후 필터링)
+CREATE INDEX idx_schedules_start_date ON schedules (start_date);
+
+-- 물품 대여 상태 (product_code, return_day IS NULL), 반납 시 대여 내역 확인
+CREATE INDEX idx_rent_list_product_return ON rent_list (product_code, return_day, user_id);
+
+-- 홈 대여 중인 물품 목록 (user_id, return_day IS NULL)
+CREATE INDEX idx_rent_list_user_return ON rent_list (user_id, return_day);
+
+-- 알림 목록 (user_id, is_sent = 1)
+CREATE INDEX idx_notification_member_user_sent ON notification_member (user_id, is_sent, notification_id);
+
+-- 알림 대상 회원 조회, 알림 수정/삭제 시 대상 회원 삭제
+CREATE INDEX idx_notification_member_notification ON notification_member (notification_id);
+
+-- 출석 기록 (user_id로 조회 후 attendance JOIN)
+CREATE INDEX idx_user_attendance_user ON user_attendance (user_id, attendance_id);
+
+-- 출석 회원 목록, 출석 삭제 시 회원 출석 삭제
+CREATE INDEX idx_user_attendance_attendance ON user_attendance (attendance_id);
+
+-- 출석 정보 조회 (category, date)
+CREATE INDEX idx_attendance_category_date ON attendance (category, date);
+
+-- 프로젝트 목록 (user_id), 프로젝트 멤버 (project_id)
+CREATE INDEX idx_project_members_user ON project_members (user_id, project_id);
+CREATE INDEX idx_project_members_project ON project_members (project_id);
+
+-- 회비 내역 (user_id, date BETWEEN ... ORDER BY date)
+CREATE INDEX idx_membership_fees_user_date ON membership_fees (user_id, date);
+
+-- 경고 내역 (user_id ORDER BY date)
+CREATE INDEX idx_warnings_user_date ON warnings (user_id, date);
+
+-- 세미나 목록 (user_id)
+CREATE INDEX idx_seminars_user ON seminars (user_id);
@@ -0,0 +1,8 @@
+-- 암호화된 회원 이름/전화번호 검색용 HMAC 토큰 (UserSync가 관리, utils/blind_index.py 참고)
+CREATE TABLE IF NOT EXISTS user_blind_index (
+    user_id VARCHAR(255) NOT NULL,
+    kind VARCHAR(16) NOT NULL,
+    token CHAR(64) NOT NULL,
+    PRIMARY KEY (kind, token, user_id),
+    KEY idx_user_blind_index_user (user_id)
+);
@@ -0,0 +1,17 @@
+from utils.aes_cipher import AESCipher
+from utils import blind_index
+
+# 짧은 이름 앞부분(1글자)과 전화번호 뒤 4자리 토큰을 새 기준의 토큰으로 교체
+# 토큰은 원문으로만 만들 수 있으므로 회원 정보를 복호화하여 모든 회원의 토큰을 다시 생성한다. (유효한 토큰은 그대로 다시 생성됨)
+def migrate(database):
+    user_list = database.execute_all("SELECT id, name, phone_number FROM users;")
+
+    crypt = AESCipher()
+    index_rows = []
+    for user in user_list:
+        name = crypt.decrypt(user['name']) if user['name'] else ''
+        phone_number = crypt.decrypt(user['phone_number']) if user['phone_number'] else ''
+        index_rows += [(user['id'], kind, token) for kind, token in blind_index.user_tokens(name, phone_number)]
+
+    database.execute("DELETE FROM user_blind_index;")
+    database.bulk_insert('user_blind_index', ['user_id', 'kind', 'token'], index_rows)
@@ -0,0 +1,128 @@
+import time
+import bisect
+import threading
+import pymysql
+
+# 커넥션 대기 시간 히스토그램 구간 (ms)
+WAIT_TIME_BUCKETS = (1, 5, 10, 50, 100, 500, 1000, 5000)
+
+# 커넥션 풀이 포화되어 제한 시간 내에 커넥션을 얻지 못했을 때 발생
+class PoolExhaustedError(Exception):
+    pass
+
+# 최소/최대 크기와 대기열 제한이 있는 thread-safe 커넥션 풀
+class ConnectionPool:
+    def __init__(self, db_config, min_size=1, max_size=10, timeout=5.0, max_waiters=None):
+        self.db_config = db_config
+        self.min_size = min_size
+        self.max_size = max_size
+        self.timeout = timeout
+        self.max_waiters = max_waiters if max_waiters is not None else max_size * 2
+
+        self._lock = threading.Condition()
+        self._idle = []        # 반납되어 재사용 가능한 커넥션
+        self._size = 0         # 생성된(생성 중 포함) 커넥션 수
+        self._waiters = 0      # 커넥션을 기다리는 스레드 수
+
+        # 통계
+        self._checkouts = 0
+        self._timeouts = 0
+        self._rejected = 0
+        self._wait_time_total = 0.0
+        self._wait_time_buckets = [0] * (len(WAIT_TIME_BUCKETS) + 1)
+
+    # 최소 크기만큼 커넥션 미리 생성
+    def init(self):
+        with self._lock:
+            count = self.min_size - self._size
+            self._size += max(count, 0)
+        for _ in range(count):
+            self._idle_append(self._create())
+
+    def _idle_append(self, conn):
+        with self._lock:
+            self._idle.append(conn)
+            self._lock.notify()
+
+    def _create(self):
+        try:
+            return pymysql.connect(**self.db_config)
+        except Exception:
+            with self._lock:
+                self._size -= 1
+                self._lock.notify()
+            raise
+
+    # 커넥션 대여 (최대 크기에 도달하면 timeout 까지 대기)
+    def get_conn(self):
+        start = time.monotonic()
+        with self._lock:
+            if not self._idle and self._size >= self.max_size and self._waiters >= self.max_waiters:
+                self._rejected += 1
+                raise PoolExhaustedError(f'connection pool is saturated ({self._waiters} waiters)')
+
+            self._waiters += 1
+            try:
+                while not self._idle and self._size >= self.max_size:
+                    remaining = self.timeout - (time.monotonic() - start)
+                    if remaining <= 0:
+                        self._timeouts += 1
+                        raise PoolExhaustedError(f'timed out after {self.timeout}s waiting for a connection')
+                    self._lock.wait(remaining)
+            finally:
+                self._waiters -= 1
+
+            self._record_wait(time.monotonic() - start)
+            if self._idle:
+                return self._idle.pop()
+            self._size += 1
+
+        # 새 커넥션 생성은 lock 밖에서 수행
+        return self._create()
+
+    # 커넥션 반납 (끊어진 커넥션은 버린다.)
+    def release(self, conn):
+        if conn.open:
+            self._idle_append(conn)
+        else:
+            with self._lock:
+                self._size -= 1
+                self._lock.notify()
+
+    def _record_wait(self, wait_time):
+        wait_ms = wait_time * 1000
+        self._checkouts += 1
+        self._wait_time_total += wait_ms
+        self._wait_time_buckets[bisect.bisect_left(WAIT_TIME_BUCKETS, wait_ms)] += 1
+
+    # 풀 상태 통계
+    def stats(self):
+        with self._lock:
+            histogram = [
+                {'le': bound, 'count': count}
+                for bound, count in zip(WAIT_TIME_BUCKETS + ('+Inf',), self._wait_time_buckets)
+            ]
+            return {
+                'size': self._size,
+                'in_use': self._size - len(self._idle),
+                'idle': len(self._idle),
+                'waiters': self._waiters,
+                'min_size': self.min_size,
+                'max_size': self.max_size,
+                'checkouts': self._checkouts,
+                'timeouts': self._timeouts,
+                'rejected': self._rejected,
+                'avg_wait_time': round(self._wait_time_total / self._checkouts, 3) if self._checkouts else 0.0,
+                'wait_time_histogram': histogram
+            }
+
+    # 모든 유휴 커넥션 종료
+    def destroy(self):
+        with self._lock:
+            idle, self._idle = self._idle, []
+            self._size -= len(idle)
+        for conn in idle:
+            try:
+                conn.close()
+            except pymysql.err.Error:
+                pass
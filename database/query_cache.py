@@ -0,0 +1,89 @@
+import re
+import time
+import hashlib
+from flask import g, has_app_context
+from utils.config_tool import get_config
+from utils import memcache_tool
+
+config = get_config()
+
+# 캐시된 쿼리 결과 기본 보관 시간 (초)
+QUERY_CACHE_TTL = config['memcached'].getint('query_cache_ttl', fallback=300)
+
+# 쓰기 쿼리에서 변경되는 테이블 추출
+WRITE_TABLE_PATTERN = re.compile(r'^\s*(?:INSERT\s+(?:IGNORE\s+)?INTO|REPLACE\s+INTO|UPDATE|DELETE\s+FROM)\s+`?(\w+)`?', re.IGNORECASE)
+
+# 프로세스 공용 memcache 클라이언트 (app 밖의 스케줄러 등에서도 같은 커넥션 풀 사용)
+def get_client():
+    return memcache_tool.get_client()
+
+def version_key(table):
+    return f'query_cache_version_{table}'
+
+# 쓰기 쿼리가 변경하는 테이블 이름 (쓰기 쿼리가 아니면 None)
+def written_table(query):
+    match = WRITE_TABLE_PATTERN.match(query)
+    return match.group(1).lower() if match else None
+
+# 요청 안에서 이미 조회한 테이블 버전 (요청마다 테이블당 한 번만 memcache를 조회한다.)
+def _request_versions():
+    if not has_app_context():
+        return None
+    if 'table_versions' not in g:
+        g.table_versions = {}
+    return g.table_versions
+
+# 테이블별 현재 버전 {테이블: 버전} (memcache를 사용할 수 없어 버전을 얻지 못한 테이블은 제외된다.)
+def get_versions(tables):
+    memo = _request_versions()
+    if memo is not None and all(table in memo for table in tables):
+        return {table: memo[table] for table in tables}
+
+    versions = _fetch_versions([table for table in tables if memo is None or table not in memo])
+    if memo is not None:
+        memo.update(versions)
+        versions = {table: memo[table] for table in tables if table in memo}
+    return versions
+
+def _fetch_versions(tables):
+    mc = get_client()
+    keys = {version_key(table): table for table in tables}
+    versions = mc.get_multi(list(keys))
+
+    # 버전이 없는(처음 사용되거나 eviction 된) 테이블은 새 버전으로 시작하여 이전 캐시가 되살아나지 않도록 한다.
+    missing = [key for key in keys if key not in versions]
+    if missing:
+        version = time.time_ns()
+        for key in missing:
+            mc.add(key, version)
+        versions.update(mc.get_multi(missing))
+
+    return {keys[key]: version for key, version in versions.items()}
+
+# 테이블 버전과 쿼리로 캐시 키 생성 (테이블 버전이 바뀌면 이전 키는 더 이상 사용되지 않는다.)
+def make_key(kind, query, args, tables):
+    versions = get_versions(tables)
+    parts = [kind, query, repr(args)] + [f'{version_key(table)}={versions.get(table, 0)}' for table in tables]
+    return 'query_cache_' + hashlib.sha1('\n'.join(parts).encode('utf-8')).hexdigest()
+
+# 캐시된 결과 조회 (없으면 (False, None))
+def load(key):
+    cached = get_client().get(key)
+    if cached is None:
+        return False, None
+    return True, cached[0]
+
+def store(key, result, ttl=QUERY_CACHE_TTL):
+    get_client().set(key, (result,), ttl)
+
+# 테이블 버전 갱신 (해당 테이블을 읽는 캐시 무효화)
+def invalidate(tables):
+    if not tables:
+        return
+    version = time.time_ns()
+    get_client().set_multi({version_key(table): version for table in tables})
+
+    # 같은 요청의 이후 조회는 갱신된 버전을 사용
+    memo = _request_versions()
+    if memo is not None:
+        memo.update({table: version for table in tables})
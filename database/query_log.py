@@ -0,0 +1,144 @@
+import re
+import time
+import logging
+import threading
+from utils.config_tool import get_config
+from collections import deque
+from flask import g, request, has_app_context, has_request_context
+
+config = get_config()
+
+# 느린 쿼리 기준 시간 (ms)
+SLOW_QUERY_THRESHOLD = config['database'].getint('slow_query_threshold', fallback=200)
+
+# request 당 쿼리 수 경고 기준 (N+1 쿼리 탐지용)
+QUERY_COUNT_THRESHOLD = config['database'].getint('query_count_threshold', fallback=20)
+
+# 느린 쿼리 로그 파일 경로
+SLOW_QUERY_LOG = config['database'].get('slow_query_log', fallback='slow_query.log')
+
+# 최근 기록 보관 개수
+HISTORY_SIZE = 100
+
+slow_query_logger = logging.getLogger('slow_query')
+slow_query_logger.setLevel(logging.INFO)
+if not slow_query_logger.handlers:
+    handler = logging.FileHandler(SLOW_QUERY_LOG, encoding='utf-8')
+    handler.setFormatter(logging.Formatter('%(asctime)s %(levelname)s %(message)s'))
+    slow_query_logger.addHandler(handler)
+
+_lock = threading.Lock()
+_query_stats = {}                               # SQL별 누적 통계
+_slow_queries = deque(maxlen=HISTORY_SIZE)      # 최근 느린 쿼리 목록
+_flagged_requests = deque(maxlen=HISTORY_SIZE)  # 최근 쿼리 수 초과 request 목록
+
+# 다중 행 쿼리에서 반복되는 VALUES 묶음 및 UNION ALL SELECT 묶음
+REPEATED_VALUES = re.compile(r'(\(%s(?:, %s)*\))(?:, \1)+')
+REPEATED_SELECTS = re.compile(r'( UNION ALL SELECT %s(?:, %s)*)(?:\1)+')
+
+# SQL 문자열의 공백을 정리하여 통계 키로 사용 (다중 행 쿼리는 행 수와 관계없이 같은 키)
+def normalize_sql(sql):
+    sql = re.sub(r'\s+', ' ', sql).strip()
+    sql = REPEATED_VALUES.sub(r'\1, ...', sql)
+    return REPEATED_SELECTS.sub(r'\1 ...', sql)
+
+# 인자 값은 기록하지 않고 형태만 기록 (개인정보 보호)
+def describe_args(args):
+    if not args:
+        return ''
+    if isinstance(args, dict):
+        return f"dict[{', '.join(args.keys())}]"
+    if isinstance(args, (list, tuple)) and isinstance(args[0], (list, tuple, dict)):
+        return f"{type(args).__name__}[{len(args)}] x {describe_args(args[0])}"
+    if isinstance(args, (list, tuple)):
+        return f"{type(args).__name__}[{len(args)}]"
+    return type(args).__name__
+
+# 현재 쿼리를 호출한 endpoint (request 밖에서는 background)
+def current_endpoint():
+    if has_request_context():
+        return request.endpoint or request.path
+    return '(background)'
+
+# 쿼리 실행 기록
+def record_query(sql, args, elapsed, rows):
+    sql = normalize_sql(sql)
+    endpoint = current_endpoint()
+    elapsed_ms = elapsed * 1000
+
+    # request 단위 쿼리 수 집계
+    if has_app_context():
+        g.query_count = g.get('query_count', 0) + 1
+        g.query_time = g.get('query_time', 0.0) + elapsed_ms
+
+    with _lock:
+        stat = _query_stats.get(sql)
+        if stat is None:
+            stat = _query_stats[sql] = {'count': 0, 'total_time': 0.0, 'max_time': 0.0, 'rows': 0, 'endpoints': set()}
+        stat['count'] += 1
+        stat['total_time'] += elapsed_ms
+        stat['max_time'] = max(stat['max_time'], elapsed_ms)
+        stat['rows'] += max(rows, 0)
+        stat['endpoints'].add(endpoint)
+
+    if elapsed_ms >= SLOW_QUERY_THRESHOLD:
+        slow_query = {
+            'sql': sql,
+            'args': describe_args(args),
+            'elapsed': round(elapsed_ms, 2),
+            'rows': rows,
+            'endpoint': endpoint,
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S')
+        }
+        with _lock:
+            _slow_queries.append(slow_query)
+        slow_query_logger.info(f"slow query {slow_query['elapsed']}ms rows={rows} endpoint={endpoint} args={slow_query['args']} sql={sql}")
+
+# request 종료 시 쿼리 수 검사 (teardown 시 호출)
+def report_request():
+    query_count = g.pop('query_count', 0)
+    query_time = g.pop('query_time', 0.0)
+
+    if query_count > QUERY_COUNT_THRESHOLD:
+        flagged_request = {
+            'endpoint': current_endpoint(),
+            'query_count': query_count,
+            'query_time': round(query_time, 2),
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S')
+        }
+        with _lock:
+            _flagged_requests.append(flagged_request)
+        slow_query_logger.warning(f"too many queries ({query_count}, {flagged_request['query_time']}ms) endpoint={flagged_request['endpoint']}")
+
+# 쿼리 통계 요약 (총 소요 시간 내림차순)
+def get_summary(limit=50):
+    with _lock:
+        query_list = [
+            {
+                'sql': sql,
+                'count': stat['count'],
+                'total_time': round(stat['total_time'], 2),
+                'avg_time': round(stat['total_time'] / stat['count'], 2),
+                'max_time': round(stat['max_time'], 2),
+                'rows': stat['rows'],
+                'endpoints': sorted(stat['endpoints'])
+            }
+            for sql, stat in _query_stats.items()
+        ]
+        slow_query_list = list(_slow_queries)
+        flagged_request_list = list(_flagged_requests)
+
+    query_list.sort(key=lambda query: query['total_time'], reverse=True)
+
+    return {
+        'query_list': query_list[:limit],
+        'slow_query_list': slow_query_list,
+        'flagged_request_list': flagged_request_list
+    }
+
+# 쿼리 통계 초기화
+def reset_summary():
+    with _lock:
+        _query_stats.clear()
+        _slow_queries.clear()
+        _flagged_requests.clear()
@@ -0,0 +1,100 @@
+import threading
+import pymysql
+
+# 컬럼 구성별 Row 클래스 (같은 컬럼 구성의 결과는 컬럼 인덱스를 공유)
+_row_classes = {}
+_lock = threading.Lock()
+
+# tuple 기반 결과 행 (행마다 dict를 만들지 않고 클래스에 공유된 컬럼 인덱스로 조회)
+# row['name'], row.name, row[0] 모두 사용 가능하며, JSON 응답 직전에 to_dict()로 변환한다.
+class Row(tuple):
+    __slots__ = ()
+    _columns = ()
+    _index = {}
+
+    def __getitem__(self, key):
+        if isinstance(key, str):
+            return tuple.__getitem__(self, self._index[key])
+        return tuple.__getitem__(self, key)
+
+    def __getattr__(self, name):
+        try:
+            return tuple.__getitem__(self, self._index[name])
+        except KeyError:
+            raise AttributeError(name) from None
+
+    def __contains__(self, key):
+        return key in self._index
+
+    # memcache 저장 시 동적으로 생성된 클래스 대신 컬럼 구성으로 pickle
+    def __reduce__(self):
+        return make_row, (self._columns, tuple(self))
+
+    def get(self, key, default=None):
+        position = self._index.get(key)
+        return default if position is None else tuple.__getitem__(self, position)
+
+    def keys(self):
+        return self._columns
+
+    def items(self):
+        return zip(self._columns, self)
+
+    # JSON 변환용 dict (converters: 컬럼별 변환 함수, 예: {'date': lambda d: d.strftime('%Y-%m-%d')})
+    def to_dict(self, converters=None):
+        data = dict(zip(self._columns, self))
+        if converters:
+            for column, convert in converters.items():
+                if column in data:
+                    data[column] = convert(data[column])
+        return data
+
+# 컬럼 구성에 맞는 Row 클래스 얻기 (처음 한 번만 생성)
+def row_class(columns):
+    columns = tuple(columns)
+    cls = _row_classes.get(columns)
+    if cls is None:
+        with _lock:
+            cls = _row_classes.get(columns)
+            if cls is None:
+                cls = type('Row', (Row,), {
+                    '__slots__': (),
+                    '_columns': columns,
+                    '_index': {column: position for position, column in enumerate(columns)}
+                })
+                _row_classes[columns] = cls
+    return cls
+
+def make_row(columns, values):
+    return row_class(columns)(values)
+
+# Row 목록을 JSON 변환용 dict 목록으로 변환
+def to_dicts(rows, converters=None):
+    return [row.to_dict(converters) for row in rows]
+
+# 결과 행을 Row로 반환하는 커서 (중복된 컬럼 이름은 DictCursor와 같이 '테이블.컬럼'으로 구분)
+class RowCursorMixin:
+    def _do_get_result(self):
+        super()._do_get_result()
+        columns = []
+        if self.description:
+            for field in self._result.fields:
+                name = field.name
+                if name in columns:
+                    name = field.table_name + '.' + name
+                columns.append(name)
+            self._row_class = row_class(columns)
+        if columns and self._rows:
+            self._rows = [self._conv_row(row) for row in self._rows]
+
+    def _conv_row(self, row):
+        if row is None:
+            return None
+        return self._row_class(row)
+
+class RowCursor(RowCursorMixin, pymysql.cursors.Cursor):
+    pass
+
+# unbuffered 서버 측 커서 (execute_stream 용)
+class SSRowCursor(RowCursorMixin, pymysql.cursors.SSCursor):
+    pass
@@ -1,9 +1,8 @@
 from notion.notion import NotionDatabase
 import re
-import configparser
+from utils.config_tool import get_config
 
-config = configparser.ConfigParser()
-config.read_file(open('config/config.ini'))
+config = get_config()
 MEMBERS_DB = config['NOTION']['MEMBERS_DB']
 
 class Members():
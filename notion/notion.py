@@ -1,12 +1,11 @@
 import requests
 import json
-import configparser
+from utils.config_tool import get_config
 
 api_url = 'https://api.notion.com/v1/{api}'
 api_version = '2022-06-28'
 
-config = configparser.ConfigParser()
-config.read_file(open('config/config.ini'))
+config = get_config()
 NOTION_API_SECRET_TOKEN = config['NOTION']['NOTION_API_SECRET_TOKEN']
 
 headers = {
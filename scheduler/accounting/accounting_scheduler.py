@@ -1,12 +1,10 @@
 from abc import abstractmethod, ABCMeta
-import gspread # 5.10.0
+import threading
 from datetime import datetime, date
-from google.oauth2.service_account import Credentials
-import configparser
+from utils.config_tool import get_config
 import json
 
-config = configparser.ConfigParser(interpolation=None)
-config.read_file(open('config/config.ini'))
+config = get_config(raw=True)
 
 def convert_to_dict(config):
     dictionary = {}
@@ -17,9 +15,10 @@ def convert_to_dict(config):
     return dictionary
 
 class AccountingScheduler(metaclass=ABCMeta):
-    # 구글 시트 연결 및 변수 선언
-    _client = gspread.service_account_from_dict(convert_to_dict(config))
-    _spreadsheet = _client.open_by_url(config['google_sheet']['url'])
+    # 구글 시트 연결 및 변수 선언 (연결은 처음 사용할 때 한 번만 수행)
+    _client = None
+    _opened_spreadsheet = None
+    _connect_lock = threading.Lock()
     _worksheet = None
     _sheet_data = None
     _db_data = None
@@ -28,6 +27,22 @@ class AccountingScheduler(metaclass=ABCMeta):
     _last_update = None
     _last_synchronization = None
 
+    @property # 구글 시트 (모든 스케줄러가 하나의 연결을 공유)
+    def _spreadsheet(self):
+        return AccountingScheduler._open_spreadsheet()
+
+    @classmethod
+    def _open_spreadsheet(cls):
+        if AccountingScheduler._opened_spreadsheet is None:
+            with AccountingScheduler._connect_lock:
+                if AccountingScheduler._opened_spreadsheet is None:
+                    import gspread # 5.10.0
+
+                    client = gspread.service_account_from_dict(convert_to_dict(config))
+                    AccountingScheduler._opened_spreadsheet = client.open_by_url(config['google_sheet']['url'])
+                    AccountingScheduler._client = client
+        return AccountingScheduler._opened_spreadsheet
+
     @property # 구글 시트 데이터
     def sheet_data(self):
         if not self._sheet_data:
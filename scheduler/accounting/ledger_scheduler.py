@@ -157,14 +157,12 @@ class LedgerScheduler(AbstractAccountingScheduler):
         sql = "SELECT * FROM accountings "\
             f"WHERE date between '{start_date}' and '{end_date}' ORDER BY id;"
 
-        raw_data = database.execute_all(sql)
-        database.close()
-
-        # 데이터를 구글 시트 데이터 형식에 맞게 처리
+        # 데이터를 한 행씩 읽어오며 구글 시트 데이터 형식에 맞게 처리
         db_data = []
-        for row in raw_data:
+        for row in database.execute_stream(sql):
             row['date'] = row['date'].strftime('%Y-%m-%d')
             db_data.append(list(row.values()))
+        database.close()
         return db_data
     
     # 문자열이 날짜 형식인지 확인
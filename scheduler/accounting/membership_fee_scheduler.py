@@ -84,8 +84,7 @@ class MembershipFeeScheduler(AccountingScheduler):
 
         database.execute_many(sql, values)
 
-        # 수정된 데이터를 UPDATE
-        sql = "UPDATE membership_fees SET category = %s WHERE date = %s AND user_id = %s;"
+        # 수정된 데이터를 UPDATE (변경된 칸들을 묶어서 실행)
         values = []
 
         for sheet_idx, pos in modified:
@@ -94,7 +93,7 @@ class MembershipFeeScheduler(AccountingScheduler):
             value = (modified_data[pos], monthly_date, modified_data[0])
             values.append(value)
 
-        database.execute_many(sql, values)
+        database.bulk_update('membership_fees', ['category', 'date', 'user_id'], values, key_columns=['date', 'user_id'])
 
         database.commit()
         database.close()
@@ -153,12 +152,10 @@ class MembershipFeeScheduler(AccountingScheduler):
         sql = "SELECT user_id, GROUP_CONCAT(amount ORDER BY date) as amounts, GROUP_CONCAT(category ORDER BY date) as categories FROM membership_fees "\
             f"WHERE date between '{start_date}' and '{end_date}' GROUP BY user_id ORDER BY user_id;"
 
-        raw_data = database.execute_all(sql)
-        database.close()
-
-        # 데이터를 구글 시트 데이터 형식에 맞게 처리
+        # 데이터를 한 행씩 읽어오며 구글 시트 데이터 형식에 맞게 처리
         db_data = []
-        for row in raw_data:
+        for row in database.execute_stream(sql):
             db_data.append([row['user_id'], int(row['amounts'].split(',')[-1])])
             db_data[-1].extend(map(int, row['categories'].split(',')))
+        database.close()
         return db_data
\ No newline at end of file
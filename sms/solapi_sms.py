@@ -5,12 +5,11 @@ import hmac
 import hashlib
 import requests
 import platform
-import configparser
+from utils.config_tool import get_config
 
 __all__ = ['send_msg']
 
-config = configparser.ConfigParser()
-config.read('config/config.ini')
+config = get_config()
 
 url = config['sms']['sms_url']
 api_key = config['sms']['sms_api_key']
@@ -7,12 +7,12 @@ import re
 from notion.members import Members
 from database.database import Database
 from utils.aes_cipher import AESCipher
+from utils import blind_index
 from utils.user_tool import UserTool
 
 class UserSync:
     def __init__(self):
         self.pcube_members = None
-        self.warnings_info = ['warnings', 'half_warnings', 'total_warnings']
 
     def sync_users(self):
         if not self.pcube_members:
@@ -22,63 +22,89 @@ class UserSync:
         members = [data for data in self.pcube_members
                          if data['phone_number'] is not None and data['phone_number'] != '']
         
-        # 유저 관련 정보만 얻기
-        for data in members:
-            for key in self.warnings_info:
-                del data[key]
-                
-        # 삽입 전 데이터 전처리
-        crypt = AESCipher()
-        for data in members:
-            # 휴대폰 번호 ###-####-#### 형태로 변경
-            data['phone_number'] = re.sub(r'\D', '', data['phone_number'])
-            data['phone_number'] = re.sub(r'(\d{3})(\d{4})(\d{4})', r'\1-\2-\3', data['phone_number'])
-            
-            # 식별자의 경우 식별자가 있을 경우, 그대로 사용하고 없으면 암호화하여 생성
-            data['id'] = data['id'] if data['id'] is not None and data['id'] != '' else hashlib.sha256(str(data['name'] + data['phone_number']).encode('utf-8')).hexdigest()
-            
-            # 그 외의 데이터 암호화
-            data['name'] = crypt.encrypt(str(data['name']))
-            data['univ'] = crypt.encrypt(str(data['univ']))
-            data['etc_message'] = crypt.encrypt(str(data['etc_message']))
-            data['absent_reason'] = crypt.encrypt(str(data['absent_reason']))
-            data['absent_detail_reason'] = crypt.encrypt(str(data['absent_detail_reason']))
-            data['phone_number'] = crypt.encrypt(str(data['phone_number']))
-            data['major'] = crypt.encrypt(str(data['major']))
-            data['student_id'] = crypt.encrypt(str(data['student_id']))
-            
-            # INT를 사용하는 데이터는 index로 변환
-            data['rank'] = UserTool.rank_to_index(data['rank'])
-            data['part'] = UserTool.part_to_index(data['part'])
-            data['rest_type'] = UserTool.rest_type_to_index(data['rest_type'])
-            
-            data['grade'] = -1 if data['grade'] is None else data['grade']
-        
-        # SQL Insert 작업을 위해 데이터 형식 맞춰주기
-        members = [tuple(data.values()) for data in members]
-        if not members:
-            raise ValueError("데이터가 올바르지 않아요 :(")
         columns = ['id', 'name', 'level', 'grade', 'part_index',
                    'univ', 'last_cleaning', 'rest_type', 'etc_message',
                    'absent_reason', 'absent_detail_reason', 'phone_number',
                    'join_date', 'birth_date', 'birth_month', 'birth_day',
                    'major', 'student_id', 'is_next_birth', 'return_plan_date',
                    'workshop_count', 'gogoma']
-        columns_str = ', '.join(columns)
-        placeholders = ', '.join(['%s'] * len(columns))
-        updates = ', '.join([f'{col}=VALUES({col})' for col in columns if col != 'id'])
+
+        # 삽입 전 데이터 전처리 (회원 dict를 수정하지 않고 columns 순서의 tuple로 바로 변환)
+        phone_numbers = []
+        for data in members:
+            # 휴대폰 번호 ###-####-#### 형태로 변경
+            phone_number = re.sub(r'\D', '', data['phone_number'])
+            phone_numbers.append(re.sub(r'(\d{3})(\d{4})(\d{4})', r'\1-\2-\3', phone_number))
+
+        # 개인정보 암호화 (컬럼 단위로 한 번에 처리)
+        crypt = AESCipher()
+        encrypted = {
+            key: crypt.encrypt_many(str(data[key]) for data in members)
+            for key in ['name', 'univ', 'etc_message', 'absent_reason', 'absent_detail_reason', 'major', 'student_id']
+        }
+        encrypted['phone_number'] = crypt.encrypt_many(phone_numbers)
+
+        rows = []
+        for idx, data in enumerate(members):
+            # 식별자의 경우 식별자가 있을 경우, 그대로 사용하고 없으면 암호화하여 생성
+            user_id = data['id'] if data['id'] is not None and data['id'] != '' else hashlib.sha256(str(data['name'] + phone_numbers[idx]).encode('utf-8')).hexdigest()
+
+            rows.append((
+                user_id,
+                encrypted['name'][idx],
+                UserTool.rank_to_index(data['rank']),    # INT를 사용하는 데이터는 index로 변환
+                -1 if data['grade'] is None else data['grade'],
+                UserTool.part_to_index(data['part']),
+                encrypted['univ'][idx],
+                data['last_cleaning'],
+                UserTool.rest_type_to_index(data['rest_type']),
+                encrypted['etc_message'][idx],
+                encrypted['absent_reason'][idx],
+                encrypted['absent_detail_reason'][idx],
+                encrypted['phone_number'][idx],
+                data['join_date'],
+                data['birth_date'],
+                data['birth_month'],
+                data['birth_day'],
+                encrypted['major'][idx],
+                encrypted['student_id'][idx],
+                data['is_next_birth'],
+                data['return_plan_date'],
+                data['workshop_count'],
+                data['gogoma']
+            ))
+
+        if not rows:
+            raise ValueError("데이터가 올바르지 않아요 :(")
+
+        # 이름/전화번호 검색용 blind index 토큰 (암호화 전 값으로 생성)
+        index_rows = [
+            (row[0], kind, token)
+            for row, data, phone_number in zip(rows, members, phone_numbers)
+            for kind, token in blind_index.user_tokens(data['name'], phone_number)
+        ]
+        updates = [col for col in columns if col != 'id']
         
-        # 유저 정보 동기화
         database = Database()
-        sql = f"INSERT INTO users ({columns_str}) VALUES ({placeholders}) ON DUPLICATE KEY UPDATE {updates};"
-        database.execute_many(sql, members)
-        database.commit()
-        
-        # 탈퇴자 조회 후 모든 데이터 제거
-        sql = f"DELETE FROM users WHERE level = {UserTool.rank_to_index('탈퇴자')};"
-        database.execute(sql)
-        database.commit()
-        database.close()
+        try:
+            # 유저 정보 동기화와 탈퇴자 제거를 하나의 트랜잭션으로 처리
+            with database.transaction():
+                # 유저 정보 동기화 (다중 행 INSERT로 묶어서 실행)
+                database.bulk_upsert('users', columns, rows, updates)
+
+                # 탈퇴자 조회 후 모든 데이터 제거
+                sql = f"DELETE FROM users WHERE level = {UserTool.rank_to_index('탈퇴자')};"
+                database.execute(sql)
+
+                # 동기화된 회원의 검색 토큰 재생성 및 삭제된 회원의 토큰 제거
+                sql = "DELETE FROM user_blind_index WHERE user_id IN %s;"
+                database.execute(sql, ([row[0] for row in rows],))
+                database.bulk_insert('user_blind_index', ['user_id', 'kind', 'token'], index_rows)
+
+                sql = "DELETE FROM user_blind_index WHERE user_id NOT IN (SELECT id FROM users);"
+                database.execute(sql)
+        finally:
+            database.close()
         
         print('sync_user() finished.')
     
@@ -1,32 +1,70 @@
 import base64
 import hashlib
+from functools import lru_cache
 from Cryptodome.Cipher import AES
-import configparser
+from utils.config_tool import get_config
 
-config = configparser.ConfigParser()
-config.read_file(open('config/config.ini'))
+config = get_config()
 SECRET_KEY = config['database']['encryption_key']
 
+# 암호화 키 (모든 AESCipher 인스턴스가 공유하도록 모듈 로드 시 한 번만 생성)
+KEY = hashlib.sha256(SECRET_KEY.encode()).digest()
+
+# 복호화 결과 캐시 크기 (IV가 고정되어 있어 같은 암호문은 항상 같은 값으로 복호화된다.)
+DECRYPT_CACHE_SIZE = config['database'].getint('decrypt_cache_size', fallback=4096)
+
+# 고정 IV
+IV = (chr(0) * 16).encode('utf8')
+
 BS = 16
 pad = (lambda s: s + (BS - len(s) % BS) * chr(BS - len(s) % BS).encode())
 unpad = (lambda s: s[:-ord(s[len(s)-1:])])
 
+@lru_cache(maxsize=DECRYPT_CACHE_SIZE)
+def _decrypt(enc):
+    enc = base64.b64decode(enc)
+    cipher = AES.new(KEY, AES.MODE_CBC, IV)
+    dec = cipher.decrypt(enc)
+    return unpad(dec).decode('utf-8')
+
+# 복호화 캐시 통계
+def decrypt_cache_stats():
+    info = _decrypt.cache_info()
+    total = info.hits + info.misses
+    return {
+        'hits': info.hits,
+        'misses': info.misses,
+        'hit_rate': round(info.hits / total, 4) if total else 0.0,
+        'size': info.currsize,
+        'max_size': info.maxsize
+    }
+
+def clear_decrypt_cache():
+    _decrypt.cache_clear()
+
 class AESCipher(object):
     def __init__(self):
-        self.key = hashlib.sha256(SECRET_KEY.encode()).digest()
+        self.key = KEY
     
     def encrypt(self, message):
         message = message.encode()
         raw = pad(message)
-        cipher = AES.new(self.key, AES.MODE_CBC, self.__iv().encode('utf8'))
+        cipher = AES.new(self.key, AES.MODE_CBC, IV)
         enc = cipher.encrypt(raw)
         return base64.b64encode(enc).decode('utf-8')
     
+    # 복호화 결과는 LRU 캐시에 보관
     def decrypt(self, enc):
-        enc = base64.b64decode(enc)
-        cipher = AES.new(self.key, AES.MODE_CBC, self.__iv().encode('utf8'))
-        dec = cipher.decrypt(enc)
-        return unpad(dec).decode('utf-8')
-    
-    def __iv(self):
-        return chr(0) * 16
+        return _decrypt(enc)
+
+    # 여러 값을 한 번에 암호화 (중복된 값은 한 번만 암호화하며, 입력 순서대로 반환)
+    def encrypt_many(self, messages):
+        messages = list(messages)
+        encrypted = {message: self.encrypt(message) for message in set(messages)}
+        return [encrypted[message] for message in messages]
+
+    # 여러 값을 한 번에 복호화 (중복된 암호문은 한 번만 복호화하며, 입력 순서대로 반환)
+    def decrypt_many(self, encs):
+        encs = list(encs)
+        decrypted = {enc: _decrypt(enc) for enc in set(encs)}
+        return [decrypted[enc] for enc in encs]
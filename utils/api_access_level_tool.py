@@ -1,36 +1,75 @@
+import time
 from functools import wraps
 from flask import current_app
-from utils.enum_tool import AdminEnum
-from flask_jwt_extended import get_jwt_identity, verify_jwt_in_request
+from flask_jwt_extended import (
+    create_access_token, create_refresh_token,
+    get_jwt, verify_jwt_in_request
+)
+from utils.jwt_blocklist_tool import GENERATION_CLAIM, generation_key, bump_generation
 
-# memcached에 저장되어 있는 사용자의 API 접근 권한 불러오기
-def get_access_level(user_id):
-    mc = current_app.extensions['memcache_client']
-    access_level = mc.get('api_access_level_' + user_id)
-    return access_level
+# JWT에 포함되는 API 접근 권한 claim
+ACCESS_LEVEL_CLAIM = 'access_level'
+
+# claim이 없는 (이전에 발급된) 토큰의 접근 권한
+DEFAULT_ACCESS_LEVEL = 1
+
+# 현재 임원진 직책이 있는 회원의 접근 권한
+ADMIN_ACCESS_LEVEL = 2
 
-# memcached에 사용자의 API 접근 권한 저장하기 (수정 必)
-def store_access_level(user_id, role):
+# 사용자의 현재 토큰 세대 (없으면 새로 시작)
+def get_token_generation(user_id):
     mc = current_app.extensions['memcache_client']
-    mc.set('api_access_level_' + user_id, 2)
+    key = generation_key(user_id)
+    generation = mc.get(key)
+    if generation is None:
+        mc.add(key, time.time_ns())
+        generation = mc.get(key) or 0
+    return generation
 
-# memcached에서 사용자의 API 접근 권한 제거하기
-def erase_access_level(user_id):
+# 토큰 세대 갱신 (이전 세대의 access token은 더 이상 사용할 수 없고, refresh 시 권한을 다시 계산한다.)
+def bump_token_generation(user_id):
     mc = current_app.extensions['memcache_client']
-    mc.delete('api_access_level_' + user_id)
+    bump_generation(mc, user_id)
+
+# DB에서 사용자의 실제 API 접근 권한 계산 (users.api_access_level과 현재 임원진 직책 중 높은 권한)
+# 권한 변경 직후의 재발급에서 복제가 늦은 replica의 이전 권한을 읽지 않도록 primary에서 조회한다.
+def load_access_level(database, user_id):
+    database._use_primary()
+    sql = """
+        SELECT u.api_access_level,
+               EXISTS(SELECT 1 FROM admin a WHERE a.user_id = u.id AND CURDATE() BETWEEN a.start_date AND a.end_date) AS is_admin
+        FROM users u WHERE u.id = %s;
+    """
+    user = database.execute_one(sql, (user_id,))
+    if not user:
+        return DEFAULT_ACCESS_LEVEL
+
+    access_level = user['api_access_level'] if user['api_access_level'] is not None else DEFAULT_ACCESS_LEVEL
+    if user['is_admin']:
+        access_level = max(access_level, ADMIN_ACCESS_LEVEL)
+    return access_level
+
+# 접근 권한과 토큰 세대를 claim으로 포함한 access/refresh token 발급
+def create_tokens(database, user_id):
+    claims = {
+        ACCESS_LEVEL_CLAIM: load_access_level(database, user_id),
+        GENERATION_CLAIM: get_token_generation(user_id)
+    }
+    access_token = create_access_token(identity=user_id, additional_claims=claims)
+    refresh_token = create_refresh_token(identity=user_id, additional_claims=claims)
+    return access_token, refresh_token
 
 # API 접근 권한을 설정하는 데코레이터 생성 함수
+# 접근 권한은 발급 시 서명된 claim에서 읽으므로 요청마다 DB/memcache를 조회하지 않는다.
 def api_access_level(access_level, **extargs):
     def decorator(func):
         @wraps(func)
         def wrapper(*args, **kwargs):
             if not access_level == 0:
-                verify_jwt_in_request(extargs)
-                user_id = get_jwt_identity()
-                # user_access_level = get_access_level(user_id)
-                user_access_level = 2
+                verify_jwt_in_request(**extargs)
+                user_access_level = get_jwt().get(ACCESS_LEVEL_CLAIM, DEFAULT_ACCESS_LEVEL)
                 if user_access_level < access_level:
                     return {'message': 'API에 대한 접근 권한이 없어요 :('}, 401
             return current_app.ensure_sync(func)(*args, **kwargs)
         return wrapper
-    return decorator
\ No newline at end of file
+    return decorator
@@ -0,0 +1,79 @@
+import re
+import hmac
+import hashlib
+import unicodedata
+from utils.config_tool import get_config
+
+config = get_config()
+
+# 검색용 HMAC 키 (설정이 없으면 암호화 키에서 용도별로 분리하여 생성)
+BLIND_INDEX_KEY = config['database'].get('blind_index_key', fallback=None)
+if BLIND_INDEX_KEY:
+    KEY = BLIND_INDEX_KEY.encode()
+else:
+    KEY = hmac.new(config['database']['encryption_key'].encode(), b'user_blind_index', hashlib.sha256).digest()
+
+# 검색 토큰 종류
+NAME = 'name'                  # 이름 완전 일치
+NAME_PREFIX = 'name_prefix'    # 이름 앞부분 일치
+PHONE = 'phone'                # 전화번호 완전 일치
+PHONE_SUFFIX = 'phone_suffix'  # 전화번호 뒷자리 일치
+
+# 값의 종류가 적은 짧은 조각은 토큰 빈도 분석이나 전수 대입으로 원문을 추측할 수 있으므로 토큰을 만들지 않는다.
+NAME_PREFIX_MIN_LENGTH = max(2, config['database'].getint('blind_index_name_prefix_min_length', fallback=2))
+PHONE_SUFFIX_LENGTH = 8        # 앞 3자리(010 등)를 제외한 번호
+
+# 검색 조건이 토큰을 만들 수 없을 만큼 짧은 경우
+class SearchTermTooShortError(ValueError):
+    pass
+
+def normalize_name(name):
+    return re.sub(r'\s+', '', unicodedata.normalize('NFC', str(name))).casefold()
+
+def normalize_phone_number(phone_number):
+    return re.sub(r'\D', '', str(phone_number))
+
+# 토큰 종류와 값으로 HMAC 토큰 생성 (같은 값이라도 종류가 다르면 다른 토큰)
+def make_token(kind, value):
+    return hmac.new(KEY, f'{kind}:{value}'.encode('utf-8'), hashlib.sha256).hexdigest()
+
+def name_tokens(name):
+    name = normalize_name(name)
+    if not name:
+        return []
+    tokens = [(NAME, make_token(NAME, name))]
+    tokens += [(NAME_PREFIX, make_token(NAME_PREFIX, name[:length])) for length in range(NAME_PREFIX_MIN_LENGTH, len(name) + 1)]
+    return tokens
+
+def phone_number_tokens(phone_number):
+    phone_number = normalize_phone_number(phone_number)
+    if not phone_number:
+        return []
+    tokens = [(PHONE, make_token(PHONE, phone_number))]
+    if len(phone_number) > PHONE_SUFFIX_LENGTH:
+        tokens.append((PHONE_SUFFIX, make_token(PHONE_SUFFIX, phone_number[-PHONE_SUFFIX_LENGTH:])))
+    return tokens
+
+# 회원 한 명의 검색 토큰 목록 [(종류, 토큰)]
+def user_tokens(name, phone_number):
+    return name_tokens(name) + phone_number_tokens(phone_number)
+
+# 검색 조건을 조회할 (종류, 토큰) 목록으로 변환 (모든 조건을 만족하는 회원을 찾는다.)
+# prefix=True면 이름 앞부분 검색, 8자리 전화번호는 뒷자리 검색
+# 토큰이 없는 짧은 조건(이름 앞부분, 전화번호 일부)은 SearchTermTooShortError
+def search_tokens(name=None, phone_number=None, prefix=False):
+    tokens = []
+    name = normalize_name(name or '')
+    if name:
+        if prefix and len(name) < NAME_PREFIX_MIN_LENGTH:
+            raise SearchTermTooShortError(f'이름은 {NAME_PREFIX_MIN_LENGTH}글자 이상 입력해주세요 :(')
+        kind = NAME_PREFIX if prefix else NAME
+        tokens.append((kind, make_token(kind, name)))
+
+    phone_number = normalize_phone_number(phone_number or '')
+    if phone_number:
+        if len(phone_number) < PHONE_SUFFIX_LENGTH:
+            raise SearchTermTooShortError(f'전화번호는 뒤 {PHONE_SUFFIX_LENGTH}자리 이상 입력해주세요 :(')
+        kind = PHONE_SUFFIX if len(phone_number) == PHONE_SUFFIX_LENGTH else PHONE
+        tokens.append((kind, make_token(kind, phone_number)))
+    return tokens
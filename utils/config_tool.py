@@ -0,0 +1,21 @@
+import threading
+import configparser
+
+CONFIG_PATH = 'config/config.ini'
+
+_configs = {}
+_lock = threading.Lock()
+
+# config.ini를 프로세스당 한 번만 읽어 모든 모듈이 공유
+# raw=True면 '%'를 치환하지 않는다. (구글 시트 private key 등)
+def get_config(raw=False):
+    config = _configs.get(raw)
+    if config is None:
+        with _lock:
+            config = _configs.get(raw)
+            if config is None:
+                config = configparser.ConfigParser(interpolation=None) if raw else configparser.ConfigParser()
+                with open(CONFIG_PATH, encoding='utf-8') as file:
+                    config.read_file(file)
+                _configs[raw] = config
+    return config
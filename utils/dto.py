@@ -1,11 +1,70 @@
-from flask_restx import Namespace, fields
+from datetime import datetime
+from functools import lru_cache
+from flask_restx import Namespace, fields, inputs
+from utils.enum_tool import AttendanceEnum, NotificationEnum, AccountingEnum, SeminarEnum, UserEnum, WarningEnum, ProjectEnum, AdminEnum
 
+@lru_cache(maxsize=None)
 def nullable(field):
     class NullableField(field):
         __schema_type__ = [field.__schema_type__, "null"]
         __schema_example__ = f"nullable {field.__schema_type__}"
     return NullableField
 
+# date -> 'YYYY-MM-DD' (None은 그대로)
+def date_string(value):
+    return value.strftime('%Y-%m-%d') if value is not None else None
+
+# datetime -> 'YYYY-MM-DDTHH:MM:SS' (None은 그대로)
+def datetime_string(value):
+    return value.strftime('%Y-%m-%dT%H:%M:%S') if value is not None else None
+
+# time/timedelta -> 'HH:MM:SS' (None은 그대로)
+def time_string(value):
+    return str(value) if value is not None else None
+
+# timedelta(TIME 컬럼) -> 'HH:MM' (None은 그대로)
+def hour_minute_string(value):
+    return (datetime.min + value).strftime('%H:%M') if value is not None else None
+
+# 콤마로 구분된 문자열 -> 리스트
+def comma_list(value):
+    return value.split(',') if value else []
+
+# 결과 행 직렬화기 (응답 모델별로 한 번만 생성하여 결과 목록 전체에 적용)
+# converters: {컬럼: 변환 함수}, rename: {컬럼: 응답 필드 이름}, drop: 응답에서 제외할 컬럼
+# dict 행은 그대로 수정하고, tuple 기반 Row는 dict로 변환한다.
+# model이 주어지면 Date/Boolean 필드는 변환 함수를 따로 지정하지 않아도 된다.
+class RowSerializer:
+    def __init__(self, converters=None, rename=None, drop=(), model=None):
+        converters = dict(converters or {})
+        for name, field in (model or {}).items():
+            if isinstance(field, fields.Date):
+                converters.setdefault(name, date_string)
+            elif isinstance(field, fields.Boolean):
+                converters.setdefault(name, bool)
+        self.converters = tuple(converters.items())
+        self.rename = tuple((rename or {}).items())
+        self.drop = tuple(drop)
+
+    def __call__(self, row):
+        if row is None:
+            return None
+        if not isinstance(row, dict):
+            row = row.to_dict()
+        for column, convert in self.converters:
+            if column in row:
+                row[column] = convert(row[column])
+        for column, name in self.rename:
+            if column in row:
+                row[name] = row.pop(column)
+        for column in self.drop:
+            row.pop(column, None)
+        return row
+
+    # 결과 목록 전체 직렬화
+    def many(self, rows):
+        return [self(row) for row in rows]
+
 class AttendanceDTO:
     api = Namespace('attendance', description='회원 출석 기능')
 
@@ -48,6 +107,25 @@ class AttendanceDTO:
         'record_list': fields.List(fields.Nested(model_record), description='최근 4건의 출석 여부')
     })
 
+    serialize_attendance = RowSerializer({
+        'first_auth_start_time': str,
+        'first_auth_end_time': str,
+        'second_auth_start_time': str,
+        'second_auth_end_time': str,
+        'first_auth_time': str,
+        'second_auth_time': str,
+        'category': AttendanceEnum.Category,
+        'state': AttendanceEnum.UserAttendanceState
+    }, model=model_attendance)
+
+    serialize_record = RowSerializer(model=model_record)
+
+    serialize_record_by_category = RowSerializer({
+        'date': date_string,
+        'category': AttendanceEnum.Category,
+        'state': AttendanceEnum.UserAttendanceState
+    })
+
     response_message = api.model('response_message', {
         'message': fields.String(description='결과 메시지')
     })
@@ -102,6 +180,21 @@ class AdminNotificationDTO:
         'end_date': fields.String(description='납부 마감일')
     })
 
+    serialize_notification = RowSerializer({
+        'date': date_string,
+        'schedule': datetime_string,
+        'day': NotificationEnum.DayCategory,
+        'time': str,
+        'category': NotificationEnum.Category,
+        'member_category': NotificationEnum.MemberCategory
+    })
+
+    serialize_payment_period = RowSerializer({
+        'date': date_string,
+        'start_date': date_string,
+        'end_date': date_string
+    })
+
     response_message = api.model('response_message', {
         'message': fields.String(description='결과 메시지')
     })
@@ -167,6 +260,35 @@ class AdminAttendanceDTO:
         'second_auth_time': nullable(fields.String)(description='2차 인증 시간', example='16:55:00 (nullable)')
     })
 
+    serialize_attendance_info = RowSerializer({
+        'category': AttendanceEnum.Category,
+        'first_auth_start_time': str,
+        'first_auth_end_time': str,
+        'second_auth_start_time': str,
+        'second_auth_end_time': str
+    }, model=model_attendance_info)
+
+    serialize_attendance = RowSerializer({
+        'first_auth_start_time': str,
+        'first_auth_end_time': str,
+        'second_auth_start_time': str,
+        'second_auth_end_time': str
+    })
+
+    serialize_admin_attendance_user = RowSerializer({
+        'part_index': UserEnum.Part,
+        'rest_type': UserEnum.RestType,
+        'state': AttendanceEnum.UserAttendanceState,
+        'first_auth_time': str,
+        'second_auth_time': str
+    }, rename={'part_index': 'part'})
+
+    serialize_user_attendance = RowSerializer({
+        'state': AttendanceEnum.UserAttendanceState,
+        'first_auth_time': str,
+        'second_auth_time': str
+    })
+
     model_attendance_without_id = api.model('model_attendance_without_id', {
         'category': fields.String(description='출석 종류', example='정기'),
         'date': fields.Date(description='출석 날짜', example='2023-09-19'),
@@ -253,6 +375,11 @@ class WarningDTO:
     warning_response_message = api.model('warning_reponse_message', {
         'message': fields.String(description='결과 메시지', example="경고 정보를 수정했어요 :)")
     })
+
+    serialize_warning = RowSerializer({
+        'date': date_string,
+        'category': WarningEnum.Category
+    })
     
 class AccountingDTO:
     api = Namespace('accounting', description='회원 회비 납부 내역')
@@ -289,6 +416,21 @@ class AccountingDTO:
         'total_amount': fields.Integer(description='동아리 계좌 총 금액', example=900000)
     })
 
+    serialize_monthly_payment = RowSerializer({
+        'date': date_string,
+        'category': AccountingEnum.PaymentState
+    })
+
+    serialize_payment_period = RowSerializer({
+        'start_date': date_string,
+        'end_date': date_string
+    })
+
+    serialize_accounting = RowSerializer({
+        'date': date_string,
+        'payment_method': AccountingEnum.PaymentMethod
+    })
+
     accounting_response_message = api.model('accounting_response_message', {
         'message': fields.String(description='결과 메시지', example="데이터베이스 오류가 발생했어요 :(")
     })
@@ -330,6 +472,18 @@ class AdminAccountingDTO:
         'payment_period_list': fields.List(fields.Nested(model_payment_period))
     })
 
+    serialize_user_payment = RowSerializer({
+        'date': date_string,
+        'level': UserEnum.Level,
+        'category': AccountingEnum.PaymentState
+    })
+
+    serialize_payment_period = RowSerializer({
+        'date': date_string,
+        'start_date': date_string,
+        'end_date': date_string
+    })
+
     response_message = api.model('response_message', {
         'message': fields.String(description='결과 메시지', example="결과 메시지")
     })
@@ -364,6 +518,24 @@ class HomeDTO:
         'upcoming_list': fields.List(fields.Nested(model_upcoming_schedule_info)),
     })
 
+    serialize_schedule = RowSerializer({
+        'start_date': date_string,
+        'end_date': date_string,
+        'start_time': hour_minute_string
+    })
+
+    serialize_rent_product = RowSerializer({
+        'rent_day': date_string
+    })
+
+class ProductDTO:
+    api = Namespace('product')
+
+    # 대여 중인 회원은 대여 기록을 조회한 뒤 채운다.
+    serialize_product = RowSerializer({
+        'status': lambda status: {'value': status, 'rent_user': None}
+    })
+
 class SeminarDTO:
     api = Namespace('seminar', description='세미나 내역')
 
@@ -394,6 +566,11 @@ class SeminarDTO:
         'message': fields.String(description='결과 메시지', example="결과 메시지 입니다 :)")
     })
 
+    serialize_seminar = RowSerializer({
+        'date': date_string,
+        'category': SeminarEnum.Category
+    })
+
 class UserDTO:
     api = Namespace('user', description='내 정보')
 
@@ -427,6 +604,20 @@ class UserDTO:
         'project_list': fields.List(fields.Nested(model_user_project), description='회원 프로젝트 목록')
     })
 
+    serialize_user_profile = RowSerializer({
+        'level': UserEnum.Level,
+        'part_index': UserEnum.Part,
+        'rest_type': UserEnum.RestType
+    }, rename={'part_index': 'part'})
+
+    serialize_user_project = RowSerializer({
+        'type': ProjectEnum.Type,
+        'status': ProjectEnum.Status,
+        'start_date': date_string,
+        'end_date': date_string,
+        'platform': comma_list
+    }, model=model_user_project)
+
     response_message = api.model('response_message', {
         'message': fields.String(description='결과 메시지', example="결과 메시지")
     })
@@ -466,6 +657,10 @@ class ProjectDTO:
         'members': fields.List(fields.Nested(model_member), description="PM을 제외한 프로젝트 멤버 목록")
     })
 
+    serialize_project = UserDTO.serialize_user_project
+
+    serialize_member = RowSerializer(model=model_member)
+
     response_message = api.model('response_message', {
         'message': fields.String(description='결과 메시지', example="결과 메시지")
     })
@@ -541,6 +736,12 @@ class NotificationDTO:
         'is_read': fields.Boolean(description='읽음 여부')
     })
 
+    serialize_user_notification = RowSerializer({
+        'date': date_string,
+        'schedule': datetime_string,
+        'time': str
+    }, model=model_user_notification)
+
     response_notification_message = api.model('response_notification_message', {
         'message': fields.String(description='결과 메시지', example="결과 메시지")
     })
@@ -575,6 +776,12 @@ class AdminRoleDTO:
         'record_list': fields.List(fields.Nested(model_admin_role_user_record))
     })
 
+    serialize_admin_role = RowSerializer({
+        'start_date': date_string,
+        'end_date': date_string,
+        'role': AdminEnum.Role
+    })
+
     query_admin_id = api.parser().add_argument(
         'id', type=int, help='임원진 직책 ID'
     )
@@ -585,4 +792,120 @@ class AdminRoleDTO:
 
     response_admin_role_message = api.model('response_admin_role_message', {
         'message': fields.String(description='결과 메시지', example="결과 메시지")
-    })
\ No newline at end of file
+    })
+
+class AdminMemberDTO:
+    api = Namespace('member', description='임원진 회원 검색')
+
+    model_admin_member = api.model('model_admin_member', {
+        'id': fields.String(description='회원 ID'),
+        'name': fields.String(description='이름', example='홍길동'),
+        'level': fields.String(description='회원 등급', enum=['탈퇴자', '정회원', '수습회원', '명예회원', '수습회원(휴학)', '졸업생']),
+        'grade': fields.Integer(description='학년', example=2),
+        'part': fields.String(description='소속 파트', enum=['디자인', '아트', '프로그래밍']),
+        'rest_type': fields.String(description='활동 상태', enum=['활동', '일반휴학', '군휴학'])
+    })
+
+    query_member_search = api.parser().add_argument(
+        'name', type=str, help='이름 (prefix=true면 2글자 이상 앞부분 일치)'
+    ).add_argument(
+        'phone_number', type=str, help='전화번호 (8자리면 뒷자리 일치)'
+    ).add_argument(
+        'prefix', type=inputs.boolean, help='이름 앞부분 검색 여부', default=False
+    )
+
+    response_message = api.model('response_admin_member_message', {
+        'message': fields.String(description='결과 메시지', example="결과 메시지")
+    })
+
+    serialize_admin_member = RowSerializer({
+        'level': UserEnum.Level,
+        'part_index': UserEnum.Part,
+        'rest_type': UserEnum.RestType
+    }, rename={'part_index': 'part'})
+
+class AdminQueryDTO:
+    api = Namespace('query', description='임원진 DB 쿼리 통계')
+
+    model_query_stat = api.model('model_query_stat', {
+        'sql': fields.String(description='SQL 문', example='SELECT * FROM products;'),
+        'count': fields.Integer(description='실행 횟수', example=120),
+        'total_time': fields.Float(description='총 소요 시간(ms)', example=84.2),
+        'avg_time': fields.Float(description='평균 소요 시간(ms)', example=0.7),
+        'max_time': fields.Float(description='최대 소요 시간(ms)', example=3.1),
+        'rows': fields.Integer(description='총 결과 행 수', example=1200),
+        'endpoints': fields.List(fields.String(description='호출한 endpoint', example='product_product_list'))
+    })
+
+    model_slow_query = api.model('model_slow_query', {
+        'sql': fields.String(description='SQL 문', example='SELECT * FROM accountings;'),
+        'args': fields.String(description='인자 형태', example='tuple[2]'),
+        'elapsed': fields.Float(description='소요 시간(ms)', example=312.5),
+        'rows': fields.Integer(description='결과 행 수', example=5000),
+        'endpoint': fields.String(description='호출한 endpoint', example='accounting_accounting_list_api'),
+        'timestamp': fields.String(description='기록 시각', example='2024-03-02T12:30:00')
+    })
+
+    model_flagged_request = api.model('model_flagged_request', {
+        'endpoint': fields.String(description='endpoint', example='product_product_list'),
+        'query_count': fields.Integer(description='request 당 쿼리 수', example=64),
+        'query_time': fields.Float(description='request 당 쿼리 소요 시간(ms)', example=120.4),
+        'timestamp': fields.String(description='기록 시각', example='2024-03-02T12:30:00')
+    })
+
+    model_query_summary = api.model('model_query_summary', {
+        'query_list': fields.List(fields.Nested(model_query_stat)),
+        'slow_query_list': fields.List(fields.Nested(model_slow_query)),
+        'flagged_request_list': fields.List(fields.Nested(model_flagged_request))
+    })
+
+    model_wait_time_bucket = api.model('model_wait_time_bucket', {
+        'le': fields.String(description='대기 시간 구간 상한(ms)', example='10'),
+        'count': fields.Integer(description='구간 내 대여 횟수', example=42)
+    })
+
+    model_pool_stats = api.model('model_pool_stats', {
+        'size': fields.Integer(description='생성된 커넥션 수', example=8),
+        'in_use': fields.Integer(description='사용 중인 커넥션 수', example=6),
+        'idle': fields.Integer(description='유휴 커넥션 수', example=2),
+        'waiters': fields.Integer(description='커넥션 대기 중인 request 수', example=0),
+        'min_size': fields.Integer(description='최소 커넥션 수', example=1),
+        'max_size': fields.Integer(description='최대 커넥션 수', example=10),
+        'checkouts': fields.Integer(description='누적 대여 횟수', example=1024),
+        'timeouts': fields.Integer(description='대기 시간 초과 횟수', example=0),
+        'rejected': fields.Integer(description='대기열 초과로 거절된 횟수', example=0),
+        'avg_wait_time': fields.Float(description='평균 대기 시간(ms)', example=0.02),
+        'wait_time_histogram': fields.List(fields.Nested(model_wait_time_bucket))
+    })
+
+    model_database_pool = api.model('model_database_pool', {
+        'primary': fields.Nested(model_pool_stats, allow_null=True, description='primary 커넥션 풀'),
+        'replica': fields.Nested(model_pool_stats, allow_null=True, description='replica 커넥션 풀 (설정 시)')
+    })
+
+    model_explain_report = api.model('model_explain_report', {
+        'sql': fields.String(description='SQL 문', example='SELECT * FROM rent_list WHERE product_code = %s and return_day IS NULL;'),
+        'plan': fields.List(fields.Raw(description='EXPLAIN 결과 행', example={'table': 'rent_list', 'type': 'ALL', 'key': None, 'rows': 5000, 'Extra': 'Using where'})),
+        'problems': fields.List(fields.String(description='실행 계획 문제', example='full scan on rent_list (rows=5000)')),
+        'timestamp': fields.String(description='점검 시각', example='2024-03-02T12:30:00')
+    })
+
+    model_decrypt_cache = api.model('model_decrypt_cache', {
+        'hits': fields.Integer(description='캐시 적중 횟수', example=9800),
+        'misses': fields.Integer(description='캐시 미적중 횟수', example=200),
+        'hit_rate': fields.Float(description='캐시 적중률', example=0.98),
+        'size': fields.Integer(description='캐시된 항목 수', example=200),
+        'max_size': fields.Integer(description='최대 캐시 항목 수', example=4096)
+    })
+
+    explain_filter = api.parser().add_argument(
+        'all', type=inputs.boolean, help='문제가 없는 쿼리도 포함할지 여부', default=False
+    )
+
+    query_limit = api.parser().add_argument(
+        'limit', type=int, help='조회할 쿼리 통계 개수', default=50
+    )
+
+    response_message = api.model('response_message', {
+        'message': fields.String(description='결과 메시지', example="결과 메시지")
+    })
@@ -25,24 +25,30 @@ class EnumData:
     
 # 열거형 집합의 메타 클래스
 class EnumMeta(type):
+    # 클래스 생성 시 index -> string, string -> index 변환표를 한 번만 생성
+    def __init__(cls, name, bases, namespace):
+        super().__init__(name, bases, namespace)
+        cls._strings = {}
+        cls._indexes = {}
+        for data in namespace.values():
+            if isinstance(data, EnumData):
+                cls._strings.setdefault(data.index, data.string)
+                cls._indexes.setdefault(data.string, data.index)
+
     # 인스턴스를 함수 형태로 호출 시 동작 정의
     def __call__(cls, value):
-        for data in cls.__dict__.values():
-            if isinstance(data, EnumData):
-                if isinstance(value, int) and data.index == value:
-                    return data.string
-                if isinstance(value, str) and data.string == value:
-                    return data.index
+        if isinstance(value, int):
+            return cls._strings.get(value)
+        if isinstance(value, str):
+            return cls._indexes.get(value)
         return None
     
     # in 연산자 동작 정의
     def __contains__(cls, value):
-        for data in cls.__dict__.values():
-            if isinstance(data, EnumData):
-                if isinstance(value, int) and data.index == value:
-                    return True
-                elif isinstance(value, str) and data.string == value:
-                    return True
+        if isinstance(value, int):
+            return value in cls._strings
+        if isinstance(value, str):
+            return value in cls._indexes
         return False
 
 # 열거형 집합 클래스
@@ -0,0 +1,79 @@
+import time
+import hashlib
+from functools import wraps
+from flask import current_app, request
+from werkzeug.wrappers import Response as BaseResponse
+from database import query_cache
+from database.database import read_from_primary
+from utils.config_tool import get_config
+
+config = get_config()
+
+# 목록 응답을 클라이언트가 캐시하되 매번 ETag로 재검증하도록 설정
+CACHE_CONTROL = 'private, no-cache'
+
+# app 밖에서(DB 직접 수정 등) 쓰기가 일어나 테이블 버전이 갱신되지 않는 테이블의 ETag 유지 시간 (초)
+EXTERNAL_MAX_AGE = config['memcached'].getint('etag_external_max_age', fallback=60)
+
+# 현재 시간 구간 번호 (max_age 초마다 바뀐다.)
+def time_bucket(max_age=EXTERNAL_MAX_AGE):
+    return int(time.time() // max_age)
+
+# 요청 경로, 쿼리 스트링, 읽는 테이블들의 버전으로 strong ETag 생성
+# 테이블 버전을 하나라도 얻지 못하면(memcache 장애 등) None을 반환하여 조건부 응답을 하지 않는다.
+# max_age가 주어지면 그 시간 단위로 ETag가 바뀌어 테이블 버전에 잡히지 않는 변경도 max_age 안에 반영된다.
+def make_etag(tables, vary=None, max_age=None):
+    versions = query_cache.get_versions(tables)
+    if len(versions) != len(tables):
+        return None
+
+    parts = [request.path, request.query_string.decode('latin-1'), repr(vary)]
+    if max_age:
+        parts.append(f'bucket={time_bucket(max_age)}')
+    parts += [f'{table}={versions[table]}' for table in sorted(tables)]
+    return hashlib.sha1('\n'.join(parts).encode('utf-8')).hexdigest()
+
+# 조건부 GET 데코레이터 (tables: 응답을 만들 때 읽는 테이블, vary: 테이블 외에 응답을 바꾸는 값을 반환하는 함수)
+# max_age: app 밖에서 쓰기가 일어나는 테이블을 읽는 경우 ETag를 유지하는 최대 시간 (초, EXTERNAL_MAX_AGE)
+#          이 경우 이전 응답이 새 ETag로 응답되지 않도록 해당 테이블은 query cache에 넣지 않고, single_flight도 같은 시간 구간으로 나눈다.
+# If-None-Match가 현재 ETag와 같으면 handler(쿼리)를 실행하지 않고 304로 응답한다.
+# 버전은 쿼리 실행 전에 읽으므로 실행 중에 쓰기가 있어도 다음 요청에서 새 ETag가 된다.
+# handler는 primary에서 읽는다. (replica는 버전이 갱신된 쓰기를 아직 반영하지 않았을 수 있으므로)
+def conditional_get(tables, vary=None, max_age=None):
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            etag = make_etag(tables, vary() if vary else None, max_age)
+            if etag is None:
+                return current_app.ensure_sync(func)(*args, **kwargs)
+
+            if request.if_none_match.contains(etag):
+                response = current_app.response_class(status=304)
+                response.set_etag(etag)
+                response.headers['Cache-Control'] = CACHE_CONTROL
+                return response
+
+            read_from_primary()
+            response = current_app.ensure_sync(func)(*args, **kwargs)
+
+            # 스트리밍 응답 등 Response 객체
+            if isinstance(response, BaseResponse):
+                if response.status_code == 200:
+                    response.set_etag(etag)
+                    response.headers['Cache-Control'] = CACHE_CONTROL
+                return response
+
+            # (data, code[, headers]) 형태의 응답
+            if isinstance(response, tuple):
+                data, code, headers = (response + (None, None))[:3]
+            else:
+                data, code, headers = response, 200, None
+            if code not in (None, 200):
+                return response
+
+            headers = dict(headers or {})
+            headers['ETag'] = f'"{etag}"'
+            headers['Cache-Control'] = CACHE_CONTROL
+            return data, 200, headers
+        return wrapper
+    return decorator
@@ -1,16 +1,40 @@
-from apscheduler.schedulers.background import BackgroundScheduler
-import firebase_admin
-from firebase_admin import credentials, messaging
+import threading
 from datetime import datetime
 from database.database import Database
 from utils.enum_tool import NotificationEnum
 
-scheduler = BackgroundScheduler()
-scheduler.start()
-
 cred_path = "config/firebase-adminsdk.json"
-cred = credentials.Certificate(cred_path)
-firebase_admin.initialize_app(cred)
+
+# 스케줄러와 Firebase 앱은 import 시점이 아닌 처음 사용할 때 한 번만 초기화
+_scheduler = None
+_firebase_app = None
+_lock = threading.Lock()
+
+# 알림 예약 스케줄러 (처음 호출 시 생성 및 시작)
+def get_scheduler():
+    global _scheduler
+    if _scheduler is None:
+        with _lock:
+            if _scheduler is None:
+                from apscheduler.schedulers.background import BackgroundScheduler
+
+                scheduler = BackgroundScheduler()
+                scheduler.start()
+                _scheduler = scheduler
+    return _scheduler
+
+# Firebase 앱 초기화 후 messaging 모듈 반환
+def get_messaging():
+    global _firebase_app
+    if _firebase_app is None:
+        with _lock:
+            if _firebase_app is None:
+                import firebase_admin
+                from firebase_admin import credentials
+
+                _firebase_app = firebase_admin.initialize_app(credentials.Certificate(cred_path))
+    from firebase_admin import messaging
+    return messaging
 
 # DB에 저장된 알림 정보를 스케줄러에 등록 (서버 시작 시 호출 필요)
 def load_messages():
@@ -78,6 +102,7 @@ def update_user_notification(id, targets):
 # FCM 알림 전송
 def send_message(id, title, body, tokens=None, topic=None, targets=None):
     try:
+        messaging = get_messaging()
         if topic:  # topic이 설정된 경우
             message = messaging.Message(
                 notification=messaging.Notification(
@@ -115,6 +140,8 @@ def send_message(id, title, body, tokens=None, topic=None, targets=None):
 
 # FCM 알림 예약
 def schedule_message(id, title, body, time, date=None, day=None, tokens=None, topic=None, targets=None):
+    scheduler = get_scheduler()
+
     # 같은 id의 알림이 존재할 시 삭제
     if scheduler.get_job(id) is not None:
         remove_message(id)
@@ -130,13 +157,14 @@ def schedule_message(id, title, body, time, date=None, day=None, tokens=None, to
 
 # FCM 알림 예약 취소
 def remove_message(id):
-    if scheduler.get_job(id) is not None:
-        scheduler.remove_job(id)
+    # 스케줄러가 시작되지 않았다면 예약된 알림도 없다.
+    if _scheduler is not None and _scheduler.get_job(id) is not None:
+        _scheduler.remove_job(id)
 
 # FCM 알림 구독
 def subscribe(tokens, topic):
     try:
-        response = messaging.subscribe_to_topic(tokens, topic)
+        response = get_messaging().subscribe_to_topic(tokens, topic)
         return response
     except Exception as e:
         print(f'FCM 알림 구독 중 오류가 발생했어요 :(\nError: {str(e)}')
@@ -145,7 +173,7 @@ def subscribe(tokens, topic):
 # FCM 알림 구독 취소
 def unsubscribe(tokens, topic):
     try:
-        response = messaging.unsubscribe_from_topic(tokens, topic)
+        response = get_messaging().unsubscribe_from_topic(tokens, topic)
         return response
     except Exception as e:
         print(f'FCM 알림 구독 취소 중 오류가 발생했어요 :(\nError: {str(e)}')
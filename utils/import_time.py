@@ -0,0 +1,77 @@
+import re
+import sys
+import subprocess
+from utils.config_tool import get_config
+
+config = get_config()
+
+# 모듈별 import 시간 예산 (ms)
+IMPORT_TIME_BUDGET = config['server'].getint('import_time_budget', fallback=1000)
+
+# import 시 검사할 모듈 (app은 워커의 실제 시작 비용)
+TARGET_MODULES = [
+    'app',
+    'database.database',
+    'utils.dto',
+    'utils.fcm',
+    'api.auth.oauth',
+    'api.admin.admin',
+    'scheduler.accounting.membership_fee_scheduler',
+]
+
+# 처음 사용할 때 불러와야 하는 무거운 모듈 (import 시점에 로드되면 실패)
+LAZY_MODULES = ['firebase_admin', 'apscheduler', 'gspread']
+
+# python -X importtime 출력: "import time: self [us] | cumulative | imported package"
+IMPORT_TIME_PATTERN = re.compile(r'^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)')
+
+# 새 인터프리터에서 모듈을 import하고 (모듈, 누적 시간 us) 목록 반환
+def measure(module):
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip().splitlines()[-1] if result.stderr.strip() else f'{module} import 실패')
+
+    imports = []
+    for line in result.stderr.splitlines():
+        match = IMPORT_TIME_PATTERN.match(line)
+        if match:
+            imports.append((match.group(4), int(match.group(2))))
+    return imports
+
+# 모듈별 import 시간과 지연 로드 대상 모듈 로드 여부 검사
+def check(modules=None, budget=IMPORT_TIME_BUDGET):
+    reports = []
+    for module in modules or TARGET_MODULES:
+        try:
+            imports = measure(module)
+        except RuntimeError as e:
+            reports.append({'module': module, 'elapsed': None, 'eager': [], 'error': str(e)})
+            continue
+
+        cumulative = dict(imports)
+        elapsed = cumulative.get(module, 0) / 1000
+        eager = sorted({name.split('.')[0] for name, _ in imports if name.split('.')[0] in LAZY_MODULES})
+        reports.append({
+            'module': module,
+            'elapsed': elapsed,
+            'eager': eager,
+            'error': None if elapsed <= budget else f'{elapsed:.1f}ms > {budget}ms'
+        })
+    return reports
+
+# python -m utils.import_time [모듈 ...]
+# 예산 초과 또는 지연 로드 대상 모듈이 import 시점에 로드되면 종료 코드 1
+if __name__ == '__main__':
+    failed = False
+    for report in check(sys.argv[1:]):
+        problems = ([report['error']] if report['error'] else []) + [f'{name} loaded at import' for name in report['eager']]
+        failed = failed or bool(problems)
+
+        elapsed = '-' if report['elapsed'] is None else f"{report['elapsed']:.1f}ms"
+        print(f"[{'FAIL' if problems else 'OK'}] {report['module']} {elapsed}")
+        for problem in problems:
+            print(f'    {problem}')
+    sys.exit(1 if failed else 0)
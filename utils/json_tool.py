@@ -0,0 +1,36 @@
+import datetime
+import decimal
+import orjson
+from flask import current_app, make_response
+from database.row import Row
+
+# 공백 없는 UTF-8 출력 (한글을 \uXXXX로 이스케이프하지 않음)
+# date는 'YYYY-MM-DD', datetime은 'YYYY-MM-DDTHH:MM:SS', time은 'HH:MM:SS'로 기존 응답 형식과 동일하게 변환
+OPTIONS = orjson.OPT_OMIT_MICROSECONDS | orjson.OPT_NON_STR_KEYS
+
+# orjson이 직접 처리하지 못하는 타입 변환
+def _default(value):
+    # PyMySQL은 TIME 컬럼을 timedelta로 반환 ('H:MM:SS', 기존 str() 변환과 동일)
+    if isinstance(value, datetime.timedelta):
+        return str(value)
+    # SUM() 등의 결과
+    if isinstance(value, decimal.Decimal):
+        return int(value) if value == value.to_integral_value() else float(value)
+    if isinstance(value, Row):
+        return value.to_dict()
+    if isinstance(value, (set, frozenset)):
+        return list(value)
+    raise TypeError(f'Object of type {type(value).__name__} is not JSON serializable')
+
+def dumps_bytes(data, indent=False):
+    return orjson.dumps(data, default=_default, option=(OPTIONS | orjson.OPT_INDENT_2) if indent else OPTIONS)
+
+def dumps(data, indent=False):
+    return dumps_bytes(data, indent).decode('utf-8')
+
+# Flask-RESTX 'application/json' 응답 직렬화 함수 (api.representations에 등록)
+def output_json(data, code, headers=None):
+    response = make_response(dumps_bytes(data, current_app.debug) + b'\n', code)
+    response.headers.extend(headers or {})
+    response.mimetype = 'application/json'
+    return response
@@ -0,0 +1,243 @@
+import math
+import time
+import hashlib
+import threading
+from utils.config_tool import get_config
+
+config = get_config()
+
+# 토큰 세대 claim (api_access_level_tool에서 발급 시 포함)
+GENERATION_CLAIM = 'token_generation'
+
+# 토큰 최대 유효 시간 (초)
+ACCESS_TOKEN_LIFETIME = int(config['JWT']['JWT_ACCESS_TOKEN_EXPIRES']) * 60
+REFRESH_TOKEN_LIFETIME = int(config['JWT']['JWT_REFRESH_TOKEN_EXPIRES']) * 24 * 60 * 60
+
+# 폐기 로그를 다시 읽는 주기 (초)
+REFRESH_INTERVAL = config['memcached'].getfloat('revocation_refresh_interval', fallback=1.0)
+
+# 블룸 필터 크기 (폐기된 토큰 수 기준)와 오탐률
+FILTER_CAPACITY = config['memcached'].getint('revocation_filter_capacity', fallback=100000)
+FILTER_ERROR_RATE = config['memcached'].getfloat('revocation_filter_error_rate', fallback=0.001)
+
+# 폐기 로그의 최대 보관 시간 (초, 로그는 폐기한 토큰이 만료될 때 함께 만료된다.)
+LOG_MAX_TTL = max(ACCESS_TOKEN_LIFETIME, REFRESH_TOKEN_LIFETIME) + 10
+
+# 시작 시 읽는 최대 로그 수와 한 번에 읽는 로그 수
+STARTUP_SCAN = config['memcached'].getint('revocation_startup_scan', fallback=FILTER_CAPACITY)
+BATCH_SIZE = 1000
+
+# 시간대별 첫 로그 번호를 기록하는 단위 (초, 시작 시 만료되지 않았을 수 있는 로그부터 읽기 위해 사용)
+LOG_MARKER_INTERVAL = 3600
+
+# 로그 번호는 발급됐지만 내용이 아직 기록되지 않은 경우 기다리는 시간 (초)
+MISSING_GRACE = 5
+
+LOG_SEQ_KEY = 'jwt_revocation_seq'
+
+def log_key(seq):
+    return f'jwt_revocation_{seq}'
+
+def log_marker_key(bucket):
+    return f'jwt_revocation_marker_{bucket}'
+
+def generation_key(user_id):
+    return 'token_generation_' + user_id
+
+# 토큰 세대가 갱신되기 전에 발급된 access token인지 확인 (refresh token은 권한 재계산을 위해 허용)
+def is_outdated_token(jwt_payload, generation):
+    if generation is None or jwt_payload.get('type') != 'access':
+        return False
+    return jwt_payload.get(GENERATION_CLAIM, 0) < generation
+
+class BloomFilter:
+    def __init__(self, capacity, error_rate):
+        self.size = max(8, int(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+
+    # 하나의 해시를 두 값으로 나누어 k개의 위치 생성 (double hashing)
+    def _positions(self, value):
+        digest = hashlib.blake2b(value.encode('utf-8'), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], 'little')
+        h2 = int.from_bytes(digest[8:], 'little') | 1
+        return [(h1 + i * h2) % self.size for i in range(self.hash_count)]
+
+    def add(self, value):
+        for position in self._positions(value):
+            self.bits[position >> 3] |= 1 << (position & 7)
+
+    def __contains__(self, value):
+        return all(self.bits[position >> 3] & (1 << (position & 7)) for position in self._positions(value))
+
+# 로그가 기록된 시각 (기록 시각이 없는 이전 형식의 jti 로그는 그보다 늦은 만료 시각으로 대신한다.)
+def written_at(entry):
+    if entry[0] == 'generation':
+        return entry[2] / 1e9
+    return entry[3] if len(entry) > 3 else entry[2]
+
+# 폐기 로그 기록 (memcache의 순번 카운터로 순서를 정하고, 각 워커가 마지막으로 읽은 번호 이후만 읽는다.)
+# 로그: ('jti', jti, 만료 시각, 기록 시각) 또는 ('generation', user_id, 세대)
+# 시간대별 첫 로그 번호도 함께 기록하여, 시작 시 보관 시간 안에 기록된 로그부터 읽을 수 있도록 한다.
+def append_log(mc, entry, ttl):
+    seq = mc.incr(LOG_SEQ_KEY)
+    if seq is None:
+        mc.add(LOG_SEQ_KEY, 0)
+        seq = mc.incr(LOG_SEQ_KEY)
+    if seq is not None:
+        mc.set(log_key(seq), entry, ttl)
+        mc.add(log_marker_key(int(time.time() // LOG_MARKER_INTERVAL)), seq, LOG_MAX_TTL + LOG_MARKER_INTERVAL)
+
+# 토큰 폐기 (로그아웃)
+# 로그를 다시 읽기 전에도 이 워커에서는 바로 차단되도록 워커 필터에도 추가한다.
+def revoke_token(mc, jti, expires_in):
+    now = time.time()
+    entry = ('jti', jti, now + expires_in, now)
+    mc.set(jti, "", expires_in)
+    append_log(mc, entry, expires_in)
+    _filter.add(entry)
+
+# 토큰 세대 갱신 (이전 세대의 access token 차단)
+def bump_generation(mc, user_id):
+    generation = time.time_ns()
+    entry = ('generation', user_id, generation)
+    mc.set(generation_key(user_id), generation)
+    append_log(mc, entry, ACCESS_TOKEN_LIFETIME + 10)
+    _filter.add(entry)
+    return generation
+
+# 워커 내부의 폐기 토큰 필터
+# 폐기 로그를 주기적으로 이어 읽어 블룸 필터와 토큰 세대를 갱신하고, 필터에 걸린 토큰만 memcache로 확인한다.
+# 로그는 폐기한 토큰과 함께 만료되므로 없는 로그는 더 이상 차단할 토큰이 없는 것으로 보고 건너뛴다.
+# 시작 시 아직 만료되지 않은 로그를 모두 읽지 못한 경우에만, 읽지 못한 로그의 토큰이 만료될 때까지 매 요청 memcache로 확인한다.
+class RevocationFilter:
+    def __init__(self):
+        self.bloom = BloomFilter(FILTER_CAPACITY, FILTER_ERROR_RATE)
+        self.revoked = []           # 필터 재생성용 [(만료 시각, jti)]
+        self.generations = {}       # {user_id: 세대}
+        self.last_seq = None
+        self.missing_since = None
+        self.exact_until = 0
+        self.next_refresh = 0
+        self.lock = threading.Lock()
+
+    def _add(self, entry):
+        if entry[0] == 'jti':
+            jti, expires_at = entry[1], entry[2]
+            self.revoked.append((expires_at, jti))
+            self.bloom.add(jti)
+            if len(self.revoked) > FILTER_CAPACITY:
+                self._rebuild()
+        elif entry[0] == 'generation':
+            _, user_id, generation = entry
+            self.generations[user_id] = max(generation, self.generations.get(user_id, 0))
+
+    # 이 워커에서 기록한 로그를 바로 반영 (다시 읽어도 같은 값이므로 중복 추가는 문제없다.)
+    def add(self, entry):
+        with self.lock:
+            self._add(entry)
+
+    # until(읽지 못한 로그의 토큰이 모두 만료되는 시각)까지 memcache로 직접 확인
+    def _enter_exact_mode(self, until):
+        self.exact_until = max(self.exact_until, until)
+
+    # 만료된 토큰을 제외하고 필터 재생성
+    def _rebuild(self):
+        now = time.time()
+        self.revoked = [(expires_at, jti) for expires_at, jti in self.revoked if expires_at > now]
+        bloom = BloomFilter(FILTER_CAPACITY, FILTER_ERROR_RATE)
+        for _, jti in self.revoked:
+            bloom.add(jti)
+        self.bloom = bloom
+
+    def _read(self, mc, start, end):
+        entries = {}
+        for batch_start in range(start, end + 1, BATCH_SIZE):
+            keys = [log_key(seq) for seq in range(batch_start, min(batch_start + BATCH_SIZE, end + 1))]
+            entries.update(mc.get_multi(keys))
+        return entries
+
+    # 보관 시간 안에 기록되었을 수 있는 첫 로그 번호 (시간대별 첫 로그 번호 중 가장 이른 것)
+    # 기록이 없으면(이전 버전에서 기록된 로그 등) 최근 STARTUP_SCAN개부터 읽는다.
+    def _first_live_seq(self, mc, seq):
+        now = time.time()
+        buckets = range(int((now - LOG_MAX_TTL) // LOG_MARKER_INTERVAL), int(now // LOG_MARKER_INTERVAL) + 1)
+        markers = mc.get_multi([log_marker_key(bucket) for bucket in buckets])
+        starts = [start for start in markers.values() if start <= seq]
+        return min(starts) if starts else max(1, seq - STARTUP_SCAN + 1)
+
+    # 시작 시 만료되지 않았을 수 있는 로그 읽기
+    # 최대 STARTUP_SCAN개만 읽으며, 읽지 못한 로그가 남으면 그 로그의 토큰이 만료될 때까지 memcache로 직접 확인한다.
+    # (읽지 못한 로그는 읽은 로그보다 먼저 기록되었으므로 가장 먼저 기록된 로그의 시각 + 최대 보관 시간 전에 만료된다.)
+    def _scan(self, mc, seq):
+        start = self._first_live_seq(mc, seq)
+        if seq - start + 1 > STARTUP_SCAN:
+            start = seq - STARTUP_SCAN + 1
+            truncated = True
+        else:
+            truncated = False
+
+        entries = self._read(mc, start, seq).values()
+        for entry in entries:
+            self._add(entry)
+        if truncated and entries:
+            self._enter_exact_mode(min(written_at(entry) for entry in entries) + LOG_MAX_TTL)
+
+    def refresh(self, mc):
+        now = time.monotonic()
+        if now < self.next_refresh or not self.lock.acquire(blocking=False):
+            return
+        try:
+            self.next_refresh = now + REFRESH_INTERVAL
+            seq = mc.get(LOG_SEQ_KEY)
+            if seq is None:
+                return
+
+            # 처음 읽는 경우: 만료되지 않았을 수 있는 로그부터 시작
+            if self.last_seq is None:
+                self._scan(mc, seq)
+                self.last_seq = seq
+                return
+
+            # memcache 재시작 등으로 카운터가 초기화된 경우 새 카운터의 로그를 처음부터 읽는다.
+            # (재시작으로 폐기 토큰 키도 함께 사라지므로 memcache로 직접 확인해도 차단할 수 없다.)
+            if seq < self.last_seq:
+                self.missing_since = None
+                self.last_seq = 0
+
+            entries = self._read(mc, self.last_seq + 1, seq)
+            for current in range(self.last_seq + 1, seq + 1):
+                entry = entries.get(log_key(current))
+                if entry is None:
+                    # 기록 중인 로그일 수 있으므로 잠시 기다렸다가, 계속 없으면 만료된 로그로 보고 건너뛴다.
+                    if self.missing_since is None:
+                        self.missing_since = now
+                    if now - self.missing_since < MISSING_GRACE:
+                        break
+                else:
+                    self._add(entry)
+                self.missing_since = None
+                self.last_seq = current
+        finally:
+            self.lock.release()
+
+    def is_revoked(self, mc, jwt_payload):
+        self.refresh(mc)
+        jti = jwt_payload['jti']
+        user_id = jwt_payload['sub']
+
+        # 시작 시 읽지 못한 로그가 있으면 이전처럼 memcache에서 직접 확인
+        if time.time() < self.exact_until:
+            key = generation_key(user_id)
+            stored = mc.get_multi([jti, key])
+            return jti in stored or is_outdated_token(jwt_payload, stored.get(key))
+
+        if jti in self.bloom and mc.get(jti) is not None:
+            return True
+        return is_outdated_token(jwt_payload, self.generations.get(user_id))
+
+_filter = RevocationFilter()
+
+# 토큰 폐기 여부 (대부분의 요청은 memcache를 조회하지 않는다.)
+def is_revoked(mc, jwt_payload):
+    return _filter.is_revoked(mc, jwt_payload)
@@ -0,0 +1,120 @@
+import socket
+import threading
+from pymemcache import serde
+from pymemcache.client.base import PooledClient
+from pymemcache.exceptions import MemcacheError
+from utils.config_tool import get_config
+
+config = get_config()
+
+# 커넥션 풀 설정
+POOL_SIZE = config['memcached'].getint('pool_size', fallback=16)
+POOL_IDLE_TIMEOUT = config['memcached'].getint('pool_idle_timeout', fallback=60)
+CONNECT_TIMEOUT = config['memcached'].getfloat('connect_timeout', fallback=1.0)
+TIMEOUT = config['memcached'].getfloat('timeout', fallback=0.5)
+
+# 연결 오류 (python-memcached처럼 캐시 miss/실패로 처리)
+ERRORS = (MemcacheError, socket.error, socket.timeout)
+
+# sockaddr 설정값을 pymemcache 서버 주소로 변환 ('host:port', 'unix:/path', '/path')
+def parse_server(sockaddr):
+    if sockaddr.startswith('unix:'):
+        return sockaddr[len('unix:'):]
+    if sockaddr.startswith('/'):
+        return sockaddr
+    host, _, port = sockaddr.partition(':')
+    return (host, int(port or 11211))
+
+# 요청 스레드들이 하나의 소켓을 공유하지 않도록 커넥션을 대여해서 사용하는 thread-safe memcache 클라이언트
+# python-memcached Client와 같은 메서드/반환값을 제공하여 기존 코드에서 그대로 사용할 수 있다.
+# 값은 python-memcached와 같은 flag로 직렬화되므로 두 클라이언트가 같은 캐시를 공유할 수 있다.
+class MemcacheClient:
+    def __init__(self, sockaddr, pool_size=POOL_SIZE, pool_idle_timeout=POOL_IDLE_TIMEOUT,
+                 connect_timeout=CONNECT_TIMEOUT, timeout=TIMEOUT):
+        self._client = PooledClient(
+            parse_server(sockaddr),
+            serde=serde.pickle_serde,
+            max_pool_size=pool_size,
+            pool_idle_timeout=pool_idle_timeout,
+            connect_timeout=connect_timeout,
+            timeout=timeout,
+            no_delay=True,
+            default_noreply=False,
+        )
+
+    def get(self, key):
+        try:
+            return self._client.get(key)
+        except ERRORS:
+            return None
+
+    # 여러 키를 한 번의 요청으로 조회 (존재하는 키만 반환)
+    def get_multi(self, keys):
+        if not keys:
+            return {}
+        try:
+            return self._client.get_many(keys)
+        except ERRORS:
+            return {}
+
+    def set(self, key, value, time=0):
+        try:
+            return self._client.set(key, value, time)
+        except ERRORS:
+            return False
+
+    # 여러 키를 한 번의 요청으로 저장 (저장에 실패한 키 목록 반환)
+    def set_multi(self, mapping, time=0):
+        if not mapping:
+            return []
+        try:
+            return self._client.set_many(mapping, time)
+        except ERRORS:
+            return list(mapping)
+
+    def add(self, key, value, time=0):
+        try:
+            return self._client.add(key, value, time)
+        except ERRORS:
+            return False
+
+    def incr(self, key, delta=1):
+        try:
+            return self._client.incr(key, delta)
+        except ERRORS:
+            return None
+
+    def decr(self, key, delta=1):
+        try:
+            return self._client.decr(key, delta)
+        except ERRORS:
+            return None
+
+    def delete(self, key, time=0):
+        try:
+            return self._client.delete(key)
+        except ERRORS:
+            return False
+
+    def delete_multi(self, keys, time=0):
+        if not keys:
+            return True
+        try:
+            return self._client.delete_many(keys)
+        except ERRORS:
+            return False
+
+    def disconnect_all(self):
+        self._client.close()
+
+_client = None
+_lock = threading.Lock()
+
+# 프로세스 공용 memcache 클라이언트 (app, query_cache, 스케줄러가 같은 커넥션 풀을 사용)
+def get_client():
+    global _client
+    if _client is None:
+        with _lock:
+            if _client is None:
+                _client = MemcacheClient(config['memcached']['sockaddr'])
+    return _client
@@ -0,0 +1,130 @@
+import time
+import uuid
+import hashlib
+import threading
+from functools import wraps
+from flask import current_app, request
+from werkzeug.wrappers import Response as BaseResponse
+from database import query_cache
+from database.database import read_from_primary
+from utils.config_tool import get_config
+
+config = get_config()
+
+# 계산한 응답 보관 시간 (초, 키에 테이블 버전이 포함되므로 쓰기가 commit 되면 바로 새 키가 된다.)
+SINGLE_FLIGHT_TTL = config['memcached'].getint('single_flight_ttl', fallback=60)
+
+# 다른 워커가 새 응답을 계산하는 동안 이전 응답을 대신 사용할 수 있는 추가 시간 (초, 0이면 사용하지 않음)
+SINGLE_FLIGHT_STALE = config['memcached'].getint('single_flight_stale', fallback=30)
+
+# 다른 요청의 계산을 기다리는 최대 시간 (초, memcache lock 만료 시간)
+SINGLE_FLIGHT_LOCK_TIMEOUT = config['memcached'].getint('single_flight_lock_timeout', fallback=10)
+
+POLL_INTERVAL = 0.05
+
+# 워커 안에서 진행 중인 계산 {키: _Flight}
+_flights = {}
+_flights_lock = threading.Lock()
+
+class _Flight:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+
+# 200 응답만 공유 (스트리밍 응답 등 Response 객체는 제외)
+def _cacheable(result):
+    if isinstance(result, BaseResponse):
+        return False
+    if isinstance(result, tuple):
+        return len(result) < 2 or result[1] in (None, 200)
+    return True
+
+def _make_key(prefix, parts):
+    return f'{prefix}_' + hashlib.sha1('\n'.join(map(str, parts)).encode('utf-8')).hexdigest()
+
+# 다른 워커와 memcache lock으로 계산 조율 (lock을 얻은 워커만 계산하고 나머지는 결과를 기다린다.)
+# stale_cached: 캐시 확인 시 함께 읽은 이전 응답
+def _lead(call, fresh_key, stale_key, stale_cached, ttl, stale):
+    mc = query_cache.get_client()
+    lock_key = fresh_key + '_lock'
+    token = uuid.uuid4().hex
+
+    if not mc.add(lock_key, token, SINGLE_FLIGHT_LOCK_TIMEOUT):
+        # 계산 중인 워커가 있으면 이전 응답으로 바로 응답 (stale-while-revalidate)
+        if stale and stale_cached is not None:
+            return stale_cached[0]
+
+        deadline = time.monotonic() + SINGLE_FLIGHT_LOCK_TIMEOUT
+        while time.monotonic() < deadline:
+            time.sleep(POLL_INTERVAL)
+            cached = mc.get(fresh_key)
+            if cached is not None:
+                return cached[0]
+            # 계산하던 워커가 실패하여 lock이 풀린 경우 직접 계산
+            if mc.add(lock_key, token, SINGLE_FLIGHT_LOCK_TIMEOUT):
+                break
+        else:
+            return call()
+
+    try:
+        result = call()
+        if _cacheable(result):
+            mc.set(fresh_key, (result,), ttl)
+            if stale:
+                mc.set(stale_key, (result,), ttl + stale)
+        return result
+    finally:
+        if mc.get(lock_key) == token:
+            mc.delete(lock_key)
+
+# 동시에 들어온 같은 요청의 캐시 miss를 한 번의 계산으로 묶는 데코레이터
+# tables: 응답을 만들 때 읽는 테이블 (버전이 바뀌면 새로 계산)
+# key: 경로와 쿼리 스트링 외에 응답을 구분하는 값을 반환하는 함수 (예: 회원별 응답이면 회원 ID)
+# ttl, stale: 응답 보관 시간과 stale-while-revalidate 추가 시간 (초)
+def single_flight(tables, key=None, ttl=SINGLE_FLIGHT_TTL, stale=SINGLE_FLIGHT_STALE):
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            # 현재 테이블 버전의 키로 공유되므로 복제가 늦은 replica가 아닌 primary에서 계산
+            def call():
+                read_from_primary()
+                return current_app.ensure_sync(func)(*args, **kwargs)
+
+            # memcache를 사용할 수 없으면 그대로 실행
+            # 버전은 요청마다 g에 보관되므로 conditional_get이 먼저 읽었다면 memcache를 다시 조회하지 않는다.
+            versions = query_cache.get_versions(tables)
+            if len(versions) != len(tables):
+                return call()
+
+            route = [request.full_path, repr(key() if key else None)]
+            fresh_key = _make_key('single_flight', route + [f'{table}={versions[table]}' for table in sorted(tables)])
+            stale_key = _make_key('single_flight_stale', route)
+
+            # 새 응답과 이전 응답을 한 번의 요청으로 조회
+            cached = query_cache.get_client().get_multi([fresh_key, stale_key] if stale else [fresh_key])
+            if fresh_key in cached:
+                return cached[fresh_key][0]
+
+            # 같은 워커 안에서는 한 스레드만 계산하고 나머지는 결과를 기다린다.
+            with _flights_lock:
+                flight = _flights.get(fresh_key)
+                leader = flight is None
+                if leader:
+                    flight = _flights[fresh_key] = _Flight()
+
+            if not leader:
+                if flight.done.wait(SINGLE_FLIGHT_LOCK_TIMEOUT) and flight.result is not None:
+                    return flight.result
+                return call()
+
+            try:
+                result = _lead(call, fresh_key, stale_key, cached.get(stale_key), ttl, stale)
+                if _cacheable(result):
+                    flight.result = result
+                return result
+            finally:
+                with _flights_lock:
+                    _flights.pop(fresh_key, None)
+                flight.done.set()
+        return wrapper
+    return decorator
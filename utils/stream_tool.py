@@ -0,0 +1,28 @@
+from utils.json_tool import dumps
+from flask import Response, stream_with_context
+
+# 행 목록을 JSON 배열로 한 행씩 직렬화
+def iter_json_array(rows, transform=None):
+    yield '['
+    for idx, row in enumerate(rows):
+        if transform:
+            row = transform(row)
+        yield (',' if idx else '') + dumps(row)
+    yield ']'
+
+# 행 목록을 메모리에 모으지 않고 JSON 응답으로 스트리밍
+# key가 주어지면 {key: [...], **data} 형태, 아니면 [...] 형태로 응답한다.
+def stream_json_response(rows, transform=None, key=None, data=None, status=200):
+    def generate():
+        if key is None:
+            yield from iter_json_array(rows, transform)
+            return
+
+        yield '{' + dumps(key) + ':'
+        yield from iter_json_array(rows, transform)
+        for name, value in (data or {}).items():
+            yield ',' + dumps(name) + ':' + dumps(value)
+        yield '}'
+
+    # request context를 유지해야 스트리밍이 끝난 뒤에 DB 세션이 반납된다.
+    return Response(stream_with_context(generate()), status=status, mimetype='application/json')
@@ -0,0 +1,68 @@
+import os
+import re
+import hashlib
+import tempfile
+from flask import send_file
+from flask_restx import Swagger
+from utils.config_tool import get_config
+from utils.json_tool import dumps_bytes
+
+config = get_config()
+
+# 운영 환경에서는 [server] swagger_docs = false로 문서 UI와 swagger.json을 모두 비활성화
+DOCS_ENABLED = config['server'].getboolean('swagger_docs', fallback=True)
+
+# 생성한 swagger.json 저장 위치
+SPEC_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                        config['server'].get('swagger_spec_dir', fallback='static/swagger'))
+
+# Api 생성 시 사용할 문서 관련 옵션
+API_OPTIONS = {'doc': '/', 'add_specs': True} if DOCS_ENABLED else {'doc': False, 'add_specs': False}
+
+# Api의 swagger.json을 생성하여 파일로 저장 (생성한 dict는 워커 메모리에 남기지 않는다.)
+# 파일 이름에 내용의 해시를 넣어 코드가 바뀌면 새 파일이 되고, 배포 중 이전/새 버전 워커가 서로의 파일을 덮어쓰지 않는다.
+def build_spec(app, api, name):
+    with app.test_request_context():
+        spec = dumps_bytes(Swagger(api).as_dict())
+
+    path = os.path.join(SPEC_DIR, f'{name}-{hashlib.sha1(spec).hexdigest()[:12]}.json')
+    if os.path.exists(path):
+        return path
+
+    # 같은 내용을 동시에 생성하는 워커끼리 임시 파일이 겹치지 않도록 고유한 이름으로 기록 후 교체
+    os.makedirs(SPEC_DIR, exist_ok=True)
+    with tempfile.NamedTemporaryFile(dir=SPEC_DIR, prefix=f'{name}-', suffix='.tmp', delete=False) as file:
+        file.write(spec)
+    os.replace(file.name, path)
+    return path
+
+# 현재 파일 외에 이전 코드로 생성한 같은 이름의 파일 삭제 (배포마다 쌓이지 않도록)
+def remove_stale_specs(name, path):
+    pattern = re.compile(rf'^{re.escape(name)}-[0-9a-f]{{12}}\.json$')
+    for file_name in os.listdir(SPEC_DIR):
+        stale = os.path.join(SPEC_DIR, file_name)
+        if pattern.match(file_name) and stale != path:
+            try:
+                os.remove(stale)
+            except FileNotFoundError:
+                pass
+
+# swagger.json 요청을 미리 생성한 파일로 응답 (ETag/If-None-Match 지원)
+# 배포 중 다른 버전의 워커가 파일을 삭제한 경우 다시 생성한다.
+def _spec_view(app, api, name, path):
+    def view(*args, **kwargs):
+        if not os.path.exists(path):
+            build_spec(app, api, name)
+        return send_file(path, mimetype='application/json', conditional=True, etag=True, max_age=0)
+    return view
+
+# app에 등록된 Api들의 swagger.json을 시작 시 한 번 생성하고 응답 함수를 교체
+# apis: [(Api, 이름)]
+def install(app, apis):
+    if not DOCS_ENABLED:
+        return
+
+    for api, name in apis:
+        path = build_spec(app, api, name)
+        remove_stale_specs(name, path)
+        app.view_functions[api.endpoint('specs')] = _spec_view(app, api, name, path)